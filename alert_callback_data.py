@@ -0,0 +1,59 @@
+import base64
+import binascii
+
+# Compact test alert callback data: "ta:" + unpadded urlsafe base64 of a chain tag byte
+# followed by the raw address bytes (fits Telegram's 64-byte callback_data limit)
+TEST_ALERT_PREFIX = "ta:"
+_CHAIN_TAG_ETH = 1
+_CHAIN_TAG_SOL = 2
+
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_INDEX = {c: i for i, c in enumerate(_B58_ALPHABET)}
+
+def _b58decode(text: str) -> bytes:
+    num = 0
+    for c in text:
+        num = num * 58 + _B58_INDEX[c]
+    # Each leading "1" encodes a leading zero byte
+    pad = len(text) - len(text.lstrip("1"))
+    return b"\0" * pad + num.to_bytes((num.bit_length() + 7) // 8, "big")
+
+def _b58encode(raw: bytes) -> str:
+    num = int.from_bytes(raw, "big")
+    chars = []
+    while num:
+        num, rem = divmod(num, 58)
+        chars.append(_B58_ALPHABET[rem])
+    pad = len(raw) - len(raw.lstrip(b"\0"))
+    return "1" * pad + "".join(reversed(chars))
+
+def encode_test_alert_data(address: str, chain: str) -> str:
+    """Build compact callback data for a token's Test Alert button"""
+    if chain.lower() in ("solana", "sol"):
+        raw = bytes((_CHAIN_TAG_SOL,)) + _b58decode(address)
+    else:
+        raw = bytes((_CHAIN_TAG_ETH,)) + bytes.fromhex(address[2:])
+    return TEST_ALERT_PREFIX + base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_test_alert_data(data: str):
+    """Return (token_address, chain) from callback data, or None if malformed"""
+    if data.startswith(TEST_ALERT_PREFIX):
+        encoded = data[len(TEST_ALERT_PREFIX):]
+        try:
+            raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+        except (binascii.Error, ValueError):
+            return None
+        if len(raw) < 2:
+            return None
+        chain_tag, addr_bytes = raw[0], raw[1:]
+        if chain_tag == _CHAIN_TAG_ETH:
+            return "0x" + addr_bytes.hex(), "eth"
+        if chain_tag == _CHAIN_TAG_SOL:
+            return _b58encode(addr_bytes), "sol"
+        return None
+
+    # Legacy format from older messages: test_alert_{address}[_{chain}]
+    parts = data.split("_")
+    if len(parts) < 3:
+        return None
+    return parts[2], parts[3] if len(parts) > 3 else "ethereum"
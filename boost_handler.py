@@ -349,8 +349,8 @@ async def handle_boost_callback(update: Update, context: ContextTypes.DEFAULT_TY
 
 def register_boost_handlers(application):
     """Register all handlers related to boosts"""
-    # Add command handler for /boost
-    application.add_handler(CommandHandler("boost", boost_command))
+    # /boost itself is owned by boost_menu.get_boost_handlers(), which main registers first;
+    # a second CommandHandler here could never fire
 
     # Add callback handlers for boost-related buttons
     application.add_handler(CallbackQueryHandler(network_callback, pattern="^network_"))
@@ -603,6 +603,8 @@ async def my_boosts_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 def get_boost_handler_commands():
     """Return all boost handler commands"""
     return [
-        CommandHandler("boost_token", boost_command),
+        # block=False: Solana verification can wait up to 30s for the tx to be indexed,
+        # which must not hold up every other user's updates
+        CommandHandler("boost_token", boost_command, block=False),
         CommandHandler("my_boosts", my_boosts_command)
     ]
\ No newline at end of file
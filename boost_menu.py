@@ -19,7 +19,7 @@ async def verify_eth_transaction(tx_hash, expected_amount, wallet_address):
     """Verify an Ethereum transaction using PaymentHandler"""
     from payment_handler import get_payment_handler
     handler = get_payment_handler()
-    success, message, tx_data = handler.verify_eth_transaction(
+    success, message, tx_data = await handler.verify_eth_transaction(
         tx_hash=tx_hash, 
         expected_amount=expected_amount, 
         target_address=wallet_address
@@ -30,10 +30,12 @@ async def verify_sol_transaction(tx_signature, expected_amount, wallet_address):
     """Verify a Solana transaction using PaymentHandler"""
     from payment_handler import get_payment_handler
     handler = get_payment_handler()
-    success, message, tx_data = handler.verify_solana_transaction(
+    # Freshly submitted signatures often aren't indexed yet, so wait with backoff instead of failing
+    success, message, tx_data = await handler.wait_for_solana_confirmation(
         tx_hash=tx_signature, 
         expected_amount=expected_amount, 
-        target_address=wallet_address
+        target_address=wallet_address,
+        timeout=30
     )
     return success, message
 
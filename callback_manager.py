@@ -6,6 +6,8 @@ from telegram.ext import CallbackQueryHandler
 from callback_handler import callback_handler, test_alert_callback
 from button_handler import button_handler
 from boost_menu import handle_boost_selection, show_how_boost_works, handle_boost_back
+from quick_track import test_alert_callback as quick_track_test_alert_callback
+from alert_callback_data import TEST_ALERT_PREFIX
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +39,8 @@ def get_all_callback_handlers():
         CallbackQueryHandler(button_handler, pattern="^track_eth$"),
         CallbackQueryHandler(button_handler, pattern="^track_sol$"),
         
-        # Test alert callbacks
+        # Test alert callbacks (compact data from the /track and /tracksol buttons first)
+        CallbackQueryHandler(quick_track_test_alert_callback, pattern=f"^{TEST_ALERT_PREFIX}"),
         CallbackQueryHandler(test_alert_callback, pattern="^test_alert_"),
         CallbackQueryHandler(test_alert_callback, pattern="^test_sol_alert_"),
         CallbackQueryHandler(test_alert_callback, pattern="^test_bnb_alert_"),
@@ -17,10 +17,9 @@ logger = logging.getLogger(__name__)
 
 def check_for_bot_token():
     """Check if the BOT_TOKEN env variable is set"""
-    from dotenv import load_dotenv
-    load_dotenv()
+    from env_cache import get_bot_token
     
-    token = os.environ.get("BOT_TOKEN") or os.environ.get("TELEGRAM_BOT_TOKEN")
+    token = get_bot_token()
     if not token:
         logger.error("❌ ERROR: No bot token found in environment variables.")
         logger.error("Please set BOT_TOKEN or TELEGRAM_BOT_TOKEN in your .env file or Replit secrets.")
@@ -152,6 +152,10 @@ def get_customization(token_address: str) -> Optional[Dict[str, Any]]:
     token_address = token_address.lower()  # Normalize to lowercase
     return token_customizations.get(token_address)
 
+def get_customized_addresses():
+    """Live set-like view of the (lowercased) addresses that have a customization"""
+    return token_customizations.keys()
+
 def remove_customization(token_address: str) -> bool:
     """Remove customization for a token"""
     global token_customizations
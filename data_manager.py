@@ -33,8 +33,8 @@ def add_tracked_token(chat_id, address, name, symbol, min_volume_usd, network="e
 
     # Check if token is already being tracked for this chat
     token_exists = False
-    for token in tracked_tokens:
-        if token.get("address", "").lower() == address and str(token.get("chat_id", "")) == str(chat_id):
+    for token in dm.get_tokens_for_chat(chat_id):
+        if token.get("address", "").lower() == address:
             # Token already exists for this chat, just update it
             token["name"] = name
             token["symbol"] = symbol
@@ -97,44 +97,46 @@ def remove_tracked_token(chat_id, address, network=None):
         bool: True if removed, False if not found
     """
     dm = get_data_manager()
-    if "tracked_tokens" not in dm.data:
+    tokens = dm.data.get("tracked_tokens")
+    if tokens is None:
         return False
 
     # Normalize inputs
     address = address.lower().strip()
     chat_id = str(chat_id)
 
-    initial_length = len(dm.data["tracked_tokens"])
+    initial_length = len(tokens)
 
     # Find matching tokens before removal for token monitor cleanup
     matching_tokens = []
     if network:
         network = network.lower().strip()
         matching_tokens = [
-            t for t in dm.data["tracked_tokens"] 
+            t for t in tokens 
             if (str(t.get("chat_id")) == chat_id and 
                t.get("address").lower() == address and
                t.get("network", "").lower() == network)
         ]
-        dm.data["tracked_tokens"] = [
-            t for t in dm.data["tracked_tokens"] 
+        remaining = [
+            t for t in tokens 
             if not (str(t.get("chat_id")) == chat_id and 
                    t.get("address").lower() == address and
                    t.get("network", "").lower() == network)
         ]
     else:
         matching_tokens = [
-            t for t in dm.data["tracked_tokens"] 
+            t for t in tokens 
             if (str(t.get("chat_id")) == chat_id and 
                t.get("address").lower() == address)
         ]
-        dm.data["tracked_tokens"] = [
-            t for t in dm.data["tracked_tokens"] 
+        remaining = [
+            t for t in tokens 
             if not (str(t.get("chat_id")) == chat_id and 
                    t.get("address").lower() == address)
         ]
+    dm.data["tracked_tokens"] = remaining
 
-    if len(dm.data["tracked_tokens"]) < initial_length:
+    if len(remaining) < initial_length:
         logger.info(f"Removed token {address} for chat {chat_id}")
 
         # Stop monitoring this token with the token monitor
@@ -170,22 +172,13 @@ def list_tracked_tokens(chat_id, network=None):
         list: Tracked tokens for the chat
     """
     dm = get_data_manager()
-    if "tracked_tokens" not in dm.data:
-        return []
-
-    chat_id = str(chat_id)
+    chat_tokens = dm.get_tokens_for_chat(chat_id)
 
     if network:
         network = network.lower().strip()
-        return [
-            t for t in dm.data["tracked_tokens"] 
-            if str(t.get("chat_id")) == chat_id and t.get("network", "").lower() == network
-        ]
+        return [t for t in chat_tokens if t.get("network", "").lower() == network]
     else:
-        return [
-            t for t in dm.data["tracked_tokens"] 
-            if str(t.get("chat_id")) == chat_id
-        ]
+        return list(chat_tokens)
 
 def get_tokens_by_network(network):
     """
@@ -198,11 +191,8 @@ def get_tokens_by_network(network):
         list: All tokens for the network
     """
     dm = get_data_manager()
-    if "tracked_tokens" not in dm.data:
-        return []
-
     network = network.lower().strip()
-    return [t for t in dm.data["tracked_tokens"] if t.get("network", "").lower() == network]
+    return [t for t in dm.data.get("tracked_tokens") or [] if t.get("network", "").lower() == network]
 
 def register_group(chat_id, name, is_admin=False):
     """
@@ -350,12 +340,11 @@ def remove_chat_data(chat_id):
         logger.info(f"Marked chat {chat_id} as inactive")
 
     # Remove tracked tokens for this chat
-    if "tracked_tokens" in dm.data:
-        initial_count = len(dm.data["tracked_tokens"])
-        dm.data["tracked_tokens"] = [
-            t for t in dm.data["tracked_tokens"] if str(t.get("chat_id")) != chat_id
-        ]
-        removed = initial_count - len(dm.data["tracked_tokens"])
+    tokens = dm.data.get("tracked_tokens")
+    if tokens is not None:
+        remaining = [t for t in tokens if str(t.get("chat_id")) != chat_id]
+        dm.data["tracked_tokens"] = remaining
+        removed = len(tokens) - len(remaining)
         if removed > 0:
             logger.info(f"Removed {removed} tracked tokens for chat {chat_id}")
 
@@ -365,6 +354,11 @@ class DataManager:
     def __init__(self, data_file=TRANSACTION_DATA_FILE):
         self.data_file = data_file
         self.data = self._load_data()
+        self.version = 0  # bumped on every save; writers save after mutating data
+        self.tokens_by_chat = {}  # {str(chat_id): [token, ...]} - built from data["tracked_tokens"]
+        self._indexed_tokens = None
+        self._indexed_count = 0
+        self._indexed_version = -1
 
     def _load_data(self):
         """Load data from JSON file or create a new data structure."""
@@ -388,6 +382,7 @@ class DataManager:
 
     def _save_data(self):
         """Save data to JSON file."""
+        self.version += 1
         try:
             with open(self.data_file, 'w') as f:
                 json.dump(self.data, f, indent=2)
@@ -400,6 +395,26 @@ class DataManager:
         """Public method to save data to file."""
         return self._save_data()
 
+    def _rebuild_chat_index(self, tokens):
+        """Group tracked tokens by chat so per-chat lookups don't scan every token."""
+        index = {}
+        for token in tokens:
+            index.setdefault(str(token.get("chat_id", "")), []).append(token)
+        self.tokens_by_chat = index
+        self._indexed_tokens = tokens
+        self._indexed_count = len(tokens)
+        self._indexed_version = self.version
+
+    def get_tokens_for_chat(self, chat_id):
+        """Return the tracked tokens for a chat (shared list, do not modify)."""
+        tokens = self.data.get("tracked_tokens") or []
+        # Writers replace the list, append to it, or edit entries and save, so identity,
+        # length and the save version together detect every change
+        if (tokens is not self._indexed_tokens or len(tokens) != self._indexed_count
+                or self.version != self._indexed_version):
+            self._rebuild_chat_index(tokens)
+        return self.tokens_by_chat.get(str(chat_id), [])
+
     def record_transaction(self, transaction_type, token_address, amount, price=None, tx_hash=None, user_id=None):
         """Record a transaction in the data file."""
         transaction = {
@@ -503,9 +518,8 @@ def get_tracked_token_info(address, chat_id=None):
     address = address.lower().strip()
 
     if chat_id:
-        chat_id = str(chat_id)
-        for token in tokens:
-            if token["address"].lower() == address and str(token.get("chat_id", "")) == chat_id:
+        for token in dm.get_tokens_for_chat(chat_id):
+            if token["address"].lower() == address:
                 return token
     else:
         for token in tokens:
@@ -961,7 +961,7 @@ class DualChainTracker:
                     logger.error(f"❌ Error getting SOL monitor: {e}")
         
         # Check ETH connection
-        eth_status = "✅ Connected" if self.eth_monitor and hasattr(self.eth_monitor, 'web3') and self.eth_monitor.web3.is_connected() else "❌ Disconnected"
+        eth_status = "✅ Connected" if self.eth_monitor and hasattr(self.eth_monitor, 'web3') and await self.eth_monitor.is_connected() else "❌ Disconnected"
         
         # Check SOL connection 
         sol_status = "✅ Connected" if self.sol_monitor else "❌ Disconnected"
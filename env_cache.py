@@ -0,0 +1,15 @@
+import functools
+import os
+from dotenv import load_dotenv
+
+@functools.lru_cache(maxsize=1)
+def load_env_once():
+    """Load .env into os.environ on the first call only, and return os.environ"""
+    load_dotenv()
+    return os.environ
+
+@functools.lru_cache(maxsize=1)
+def get_bot_token():
+    """Bot token from BOT_TOKEN or TELEGRAM_BOT_TOKEN, resolved once per process"""
+    env = load_env_once()
+    return env.get("BOT_TOKEN") or env.get("TELEGRAM_BOT_TOKEN")
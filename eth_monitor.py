@@ -1,14 +1,23 @@
 import logging
 import os
 import asyncio
+import time
+import random
 import requests
-from datetime import datetime
-from web3 import Web3
+from datetime import datetime, timezone
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, ORJSONResponse
 from config import INFURA_URL, ADMIN_CHAT_ID, FALLBACK_RPC
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson isn't installed
+    orjson = None
+    import json
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -16,6 +25,10 @@ logger = logging.getLogger(__name__)
 class EthMonitor:
     _instance = None
     CHECK_INTERVAL_SECONDS = 12
+    MAX_CONCURRENT_TXS = 8
+    ALERT_QUEUE_SIZE = 256
+    ALERT_CONCURRENCY = 5
+    ETH_PRICE_TTL_SECONDS = 30
 
     def __init__(self, bot):
         self.bot = bot
@@ -24,7 +37,15 @@ class EthMonitor:
         self.tracked_tokens = {}  # {chat_id: [{address, name, symbol, min_usd, chat_id}]} - New format
         self.total_alerts_sent = 0
         self.last_alert_msg = ""
-        self._initialize_web3()
+        self._decimals_cache = {}  # {address: decimals} - ERC-20 decimals never change
+        self._token_contracts = {}  # {address: web3 contract} - built once per token
+        self._tracked_bytes = {}  # {20-byte address: address} - mirrors tracked_contracts keys
+        self._tracked_snapshot = ()  # tuple of tracked_contracts keys served by /status
+        self._alert_queue = asyncio.Queue(maxsize=self.ALERT_QUEUE_SIZE)
+        self._alert_worker_task = None
+        self._eth_price = None
+        self._eth_price_ts = 0.0
+        self.web3 = AsyncWeb3(AsyncHTTPProvider(INFURA_URL))
 
         # Load tracked tokens from data manager
         try:
@@ -43,6 +64,7 @@ class EthMonitor:
                             "chat_id": chat_id,
                             "min_usd": token.get("min_volume_usd", 0)
                         }
+                        self._index_address(address)
 
                         # Add to new format
                         if chat_id not in self.tracked_tokens:
@@ -61,6 +83,7 @@ class EthMonitor:
                 logger.info(f"📋 Tracked contracts: {list(self.tracked_contracts.keys())}")
         except Exception as e:
             logger.error(f"❌ Error loading tokens from data manager: {e}")
+        self._refresh_tracked_snapshot()
 
     @classmethod
     def get_instance(cls, bot=None):
@@ -70,28 +93,36 @@ class EthMonitor:
             cls._instance = cls(bot)
         return cls._instance
 
-    def _initialize_web3(self):
+    async def _initialize_web3(self):
         try:
-            self.web3 = Web3(Web3.HTTPProvider(INFURA_URL))
-            if self.web3.is_connected():
+            self.web3 = AsyncWeb3(AsyncHTTPProvider(INFURA_URL))
+            if await self.web3.is_connected():
                 logger.info("✅ Connected to Ethereum via Infura")
                 return
         except Exception as e:
             logger.warning(f"Infura connection failed: {e}")
 
         try:
-            self.web3 = Web3(Web3.HTTPProvider(FALLBACK_RPC))
-            if self.web3.is_connected():
+            self.web3 = AsyncWeb3(AsyncHTTPProvider(FALLBACK_RPC))
+            if await self.web3.is_connected():
                 logger.info("✅ Connected to Ethereum via fallback RPC")
                 return
         except Exception as e:
             logger.error(f"Fallback RPC connection failed: {e}")
 
+    async def is_connected(self):
+        """Check whether the async Web3 provider can reach its node"""
+        try:
+            return bool(self.web3) and await self.web3.is_connected()
+        except Exception:
+            return False
+
     def find_token(self, chat_id, address):
         """Find a token in the tracked_tokens by chat_id and address"""
+        address = address.lower()
         tokens = self.tracked_tokens.get(chat_id, [])
         for token in tokens:
-            if token["address"].lower() == address.lower():
+            if token["address"] == address:
                 return token
         return None
 
@@ -104,8 +135,8 @@ class EthMonitor:
         found_tokens = []
 
         for addr in self.tracked_contracts.keys():
-            # Get the normalized form of the address
-            addr_norm = addr.lower()
+            # Keys are stored lowercase by track_contract
+            addr_norm = addr
             addr_clean = addr_norm.replace('0x', '')
 
             # Check both with and without 0x prefix
@@ -121,6 +152,31 @@ class EthMonitor:
 
         return found_tokens
 
+    def _index_address(self, address):
+        """Add a lowercase address to the raw-bytes index used to scan transaction input"""
+        try:
+            self._tracked_bytes[bytes.fromhex(address[2:])] = address
+        except ValueError:
+            logger.warning(f"⚠️ Not indexing malformed ETH address: {address}")
+
+    def _unindex_address(self, address):
+        try:
+            self._tracked_bytes.pop(bytes.fromhex(address[2:]), None)
+        except ValueError:
+            pass
+
+    def _refresh_tracked_snapshot(self):
+        """Rebuild the read-only views of tracked_contracts after it changes"""
+        self._tracked_snapshot = tuple(self.tracked_contracts)
+
+    def _get_token_contract(self, address):
+        """Return the cached ERC-20 contract object for a lowercase address, building it on first use"""
+        contract = self._token_contracts.get(address)
+        if contract is None:
+            contract = self.web3.eth.contract(address=Web3.to_checksum_address(address), abi=ERC20_MIN_ABI)
+            self._token_contracts[address] = contract
+        return contract
+
     def track_contract(self, address, name, symbol, chat_id, min_usd=0):
         address = address.lower()
 
@@ -131,6 +187,8 @@ class EthMonitor:
             "chat_id": chat_id,
             "min_usd": min_usd
         }
+        self._index_address(address)
+        self._refresh_tracked_snapshot()
 
         # Also store in new format organized by chat_id
         if chat_id not in self.tracked_tokens:
@@ -156,6 +214,13 @@ class EthMonitor:
                 "chain": "ethereum"
             })
 
+        # Build the contract object now so the first transfer doesn't pay for ABI/checksum setup
+        if self.web3:
+            try:
+                self._get_token_contract(address)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not prepare contract for {address}: {e}")
+
         # Log tracking confirmation
         logger.info(f"✅ Now tracking ETH token: {symbol} ({address}) for chat ID: {chat_id}")
         logger.info(f"Current tracked tokens: {list(self.tracked_contracts.keys())}")
@@ -182,7 +247,7 @@ class EthMonitor:
             # Check if this token is already tracked for this chat
             existing = False
             for token in tracked_tokens:
-                if token.get("address", "").lower() == address.lower() and str(token.get("chat_id", "")) == str(chat_id):
+                if token.get("address", "").lower() == address and str(token.get("chat_id", "")) == str(chat_id):
                     existing = True
                     # Update existing token data
                     token.update(token_data)
@@ -215,84 +280,7 @@ class EthMonitor:
             chat_id: Telegram chat ID
             min_usd: Minimum transaction value in USD to trigger alerts
         """
-        address = address.lower()
-        if address not in self.tracked_contracts:
-            self.tracked_contracts[address] = {
-                "address": address,
-                "name": name,
-                "symbol": symbol,
-                "chat_id": chat_id,
-                "min_volume_usd": min_usd
-            }
-            self.save_tracked_contracts()
-            logger.info(f"✅ Added {symbol} ({address}) to tracked contracts for chat {chat_id}")
-            return True
-        else:
-            # Update existing token
-            self.tracked_contracts[address]["chat_id"] = chat_id
-            self.tracked_contracts[address]["name"] = name
-            self.tracked_contracts[address]["symbol"] = symbol
-            self.tracked_contracts[address]["min_volume_usd"] = min_usd
-            self.save_tracked_contracts()
-            logger.info(f"🔄 Updated {symbol} ({address}) in tracked contracts for chat {chat_id}")
-            return True
-
-            self.tracked_tokens[chat_id].append({
-                "address": address,
-                "name": name,
-                "symbol": symbol,
-                "min_usd": min_usd,
-                "chat_id": chat_id,
-                "chain": "ethereum"
-            })
-
-        # Log tracking confirmation
-        logger.info(f"✅ Now tracking ETH token: {symbol} ({address}) for chat ID: {chat_id}")
-        logger.info(f"Current tracked tokens: {list(self.tracked_contracts.keys())}")
-
-        # Also save to persistent storage via data_manager
-        try:
-            from data_manager import get_data_manager
-            dm = get_data_manager()
-
-            # Format the token data for persistent storage
-            token_data = {
-                "address": address,
-                "name": name,
-                "symbol": symbol,
-                "chat_id": int(chat_id) if chat_id else None,
-                "min_volume_usd": float(min_usd),
-                "network": "ethereum",
-                "added_at": datetime.now().isoformat()
-            }
-
-            # Add to tracked_tokens list if not already there
-            tracked_tokens = dm.data.get("tracked_tokens", [])
-
-            # Check if this token is already tracked for this chat
-            existing = False
-            for token in tracked_tokens:
-                if token.get("address", "").lower() == address.lower() and str(token.get("chat_id", "")) == str(chat_id):
-                    existing = True
-                    # Update existing token data
-                    token.update(token_data)
-                    break
-
-            if not existing:
-                tracked_tokens.append(token_data)
-
-            # Update the data manager
-            dm.data["tracked_tokens"] = tracked_tokens
-            dm.save()
-
-            logger.info(f"💾 Saved token {symbol} ({address}) to persistent storage for chat {chat_id}")
-            logger.info(f"Current persistent tokens: {[t.get('address') for t in tracked_tokens]}")
-        except Exception as e:
-            logger.error(f"❌ Error saving to persistent storage: {e}", exc_info=True)
-
-        logger.info(f"✅ Tracking ETH contract: {symbol} {address} in chat {chat_id}")
-        logger.info(f"Current tracked contracts: {list(self.tracked_contracts.keys())}")
-        return True
+        return self.track_contract(address, name, symbol, chat_id, min_usd)
 
     def untrack_contract(self, address, specific_chat_id=None):
         address = address.lower()
@@ -303,6 +291,9 @@ class EthMonitor:
             # Get the chat_id before removal for persistent storage update
             chat_id = self.tracked_contracts[address].get("chat_id")
             del self.tracked_contracts[address]
+            self._token_contracts.pop(address, None)
+            self._unindex_address(address)
+            self._refresh_tracked_snapshot()
             logger.info(f"🛑 Untracked ETH contract from memory: {address}")
 
         # Also remove from new format
@@ -311,20 +302,20 @@ class EthMonitor:
             chat_id = specific_chat_id
             if chat_id in self.tracked_tokens:
                 before_count = len(self.tracked_tokens[chat_id])
-                self.tracked_tokens[chat_id] = [t for t in self.tracked_tokens[chat_id] if t["address"].lower() != address]
+                self.tracked_tokens[chat_id] = [t for t in self.tracked_tokens[chat_id] if t["address"] != address]
                 after_count = len(self.tracked_tokens[chat_id])
                 if before_count != after_count:
                     logger.info(f"🛑 Untracked ETH token {address} from chat {chat_id}")
         elif chat_id:
             # If we got chat_id from legacy format
             if chat_id in self.tracked_tokens:
-                self.tracked_tokens[chat_id] = [t for t in self.tracked_tokens[chat_id] if t["address"].lower() != address]
+                self.tracked_tokens[chat_id] = [t for t in self.tracked_tokens[chat_id] if t["address"] != address]
                 logger.info(f"🛑 Untracked ETH token {address} from chat {chat_id}")
         else:
             # If no specific chat ID, remove from all chats
             for cid in list(self.tracked_tokens.keys()):
                 before_count = len(self.tracked_tokens[cid])
-                self.tracked_tokens[cid] = [t for t in self.tracked_tokens[cid] if t["address"].lower() != address]
+                self.tracked_tokens[cid] = [t for t in self.tracked_tokens[cid] if t["address"] != address]
                 after_count = len(self.tracked_tokens[cid])
                 if before_count != after_count:
                     logger.info(f"🛑 Untracked ETH token {address} from chat {cid}")
@@ -344,11 +335,11 @@ class EthMonitor:
                     # If we know the chat_id, only remove from this specific chat
                     tracked_tokens = [
                         t for t in tracked_tokens 
-                        if not (t.get("address", "").lower() == address.lower() and str(t.get("chat_id", "")) == str(chat_id))
+                        if not (t.get("address", "").lower() == address and str(t.get("chat_id", "")) == str(chat_id))
                     ]
                 else:
                     # Otherwise remove all instances of this token
-                    tracked_tokens = [t for t in tracked_tokens if t.get("address", "").lower() != address.lower()]
+                    tracked_tokens = [t for t in tracked_tokens if t.get("address", "").lower() != address]
 
                 # Update data manager if we removed something
                 if len(tracked_tokens) != initial_count:
@@ -365,11 +356,23 @@ class EthMonitor:
 
     def get_eth_price(self):
         try:
-            r = requests.get("https://api.coingecko.com/api/v3/simple/price?ids=ethereum&vs_currencies=usd")
+            r = requests.get("https://api.coingecko.com/api/v3/simple/price?ids=ethereum&vs_currencies=usd", timeout=10)
             return r.json()["ethereum"]["usd"]
         except:
             return None
 
+    async def get_cached_eth_price(self):
+        """Return the ETH/USD price, refreshing it at most once per ETH_PRICE_TTL_SECONDS"""
+        now = time.monotonic()
+        if self._eth_price is None or now - self._eth_price_ts >= self.ETH_PRICE_TTL_SECONDS:
+            price = await asyncio.to_thread(self.get_eth_price)
+            if price:
+                self._eth_price = price
+                self._eth_price_ts = now
+            elif self._eth_price is not None:
+                logger.warning(f"⚠️ ETH price refresh failed, reusing last price ${self._eth_price}")
+        return self._eth_price
+
     async def monitor_ethereum(self):
         logger.info("🔄 Starting ETH transaction monitor...")
         asyncio.create_task(self.monitor_swaps())
@@ -378,420 +381,346 @@ class EthMonitor:
         logger.info("🔁 ETH swap loop active")
         logger.info("✅ Confirmed: eth_monitor.py is active and tracking will begin.")
         logger.info(f"Currently tracking tokens: {list(self.tracked_contracts.keys())}")
-        router_addresses = {v.lower() for v in DEX_ROUTERS.values()}
 
         while True:
             try:
-                if not self.web3.is_connected():
+                if not await self.is_connected():
                     logger.warning("Reconnecting ETH Web3...")
-                    self._initialize_web3()
+                    await self._initialize_web3()
                     await asyncio.sleep(10)
                     continue
 
-                block = self.web3.eth.get_block('latest', full_transactions=True)
-                logger.info(f"🔍 Analyzing block: {block.number} with {len(block.transactions)} transactions")
-                eth_price_usd = self.get_eth_price()
-
+                block = await self.web3.eth.get_block('latest', full_transactions=True)
+                logger.info("🔍 Analyzing block: %s with %d transactions", block.number, len(block.transactions))
+                eth_price_usd = await self.get_cached_eth_price()
+                # Every alert from this block shares the block's own timestamp
+                block_iso = datetime.fromtimestamp(block.timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+                # Let the node filter Transfer logs of tracked tokens instead of walking every receipt
+                transfer_logs_by_tx = {}
+                if self.tracked_contracts:
+                    transfer_logs = await self.web3.eth.get_logs({
+                        "fromBlock": block.number,
+                        "toBlock": block.number,
+                        "topics": [TRANSFER_TOPIC],
+                        "address": [self._get_token_contract(addr).address for addr in self.tracked_contracts]
+                    })
+                    for log in transfer_logs:
+                        transfer_logs_by_tx.setdefault(log.transactionHash, []).append(log)
+                    logger.info("🔍 %d tracked token transfers in block %s", len(transfer_logs), block.number)
+
+                # Transactions with tracked transfers, plus ones naming a tracked token in their input
+                candidates = []
                 for tx in block.transactions:
                     if not tx.to:
                         continue
 
-                    # Properly handle tx.input as bytes
-                    if isinstance(tx.input, bytes):
-                        decoded_input = tx.input.hex().lower()
-                    else:
-                        # If already a string
-                        decoded_input = tx.input.lower() if isinstance(tx.input, str) else ''
+                    # Work on the raw input bytes; hex-encoding every calldata blob is wasted work
+                    tx_input = tx.input
+                    if isinstance(tx_input, str):
+                        tx_input = bytes.fromhex(tx_input[2:] if tx_input.startswith('0x') else tx_input)
 
-                    if decoded_input == '0x':
+                    if not tx_input:
                         continue
 
-                    # Get to_address and method_id
-                    to_address = tx.to.lower() if tx.to else 'None'
-                    method_id = decoded_input[:10]
-
-                    # Check for Uniswap router and buy method
-                    is_router = to_address in router_addresses
-                    is_buying = is_buy_method(method_id)
+                    transfer_logs = transfer_logs_by_tx.get(tx.hash, [])
+                    # ABI-encoded addresses are byte aligned, so a raw substring search is exact
+                    input_tokens = [addr for addr_bytes, addr in self._tracked_bytes.items() if addr_bytes in tx_input]
+                    if not (transfer_logs or input_tokens):
+                        continue
 
-                    # Enhanced token detection
-                    tracked_tokens_in_input = self.contains_tracked_token(decoded_input)
+                    # Compute per-tx strings once and reuse them below
+                    tx_hash_hex = tx.hash.hex()
+                    to_address = tx.to.lower()
+                    method_id = '0x' + bytes(tx_input[:4]).hex()
 
                     # Log transaction details with enhanced info
-                    logger.info(f"TX {tx.hash.hex()} | To: {to_address} | Method: {method_id} | Is Router: {is_router} | Is Buy: {is_buying} | Contains Tracked Token: {tracked_tokens_in_input}")
-
-                    # Add extra debug logs for potentially important transactions
-                    if (is_router or is_buying) and not tracked_tokens_in_input and self.tracked_contracts:
-                        # Log first few characters of input for better debugging
-                        input_sample = decoded_input[:100] + "..." if len(decoded_input) > 100 else decoded_input
-                        logger.info(f"Potential swap transaction but no tracked tokens found in input: {input_sample}")
-                        logger.info(f"Tracked tokens: {list(self.tracked_contracts.keys())[:5]}")
-
-                    # Prioritize processing for transactions that are both from router and use buy method
-                    if is_router and is_buying:
-                        logger.info(f"🔍 PRIORITY: Router buy transaction detected! Router: {to_address}, Method: {method_id}")
-
-                    # Check for tracked token mentions in tx.input
-                    for tracked_addr in self.tracked_contracts.keys():
-                        tracked_addr_clean = tracked_addr.lower().replace('0x', '')
-                        if tracked_addr_clean in decoded_input:
-                            logger.info(f"🚨 Tracked token {tracked_addr} found in transaction {tx.hash.hex()}")
-                            # Add extra debug info
-                            logger.info(f"   Transaction method: {decoded_input[:10]}")
-                            logger.info(f"   Transaction to: {tx.to.lower() if tx.to else 'None'}")
-
-                            # Enhanced detection for Uniswap V3 methods
-                            # exactInputSingle (0x04e45aaf), exactInput (0xc04b8d59), exactOutputSingle (0x5023b4df), exactOutput (0xf28c0498)
-                            if decoded_input.startswith("0x04e45aaf") or decoded_input.startswith("0xb858183f") or decoded_input.startswith("0xc04b8d59"):
-                                logger.info(f"🔍 UNISWAP V3 transaction detected with tracked token!")
-
-                                # Process this transaction immediately as it's likely a buy transaction
-                                receipt = self.web3.eth.get_transaction_receipt(tx.hash)
-
-                                # Attempt to extract token amount and value
-                                try:
-                                    logger.info(f"💰 Processing Uniswap V3 exactInputSingle for token {tracked_addr}")
-
-                                    # Get the router name
-                                    router_name = "Uniswap V3"
-
-                                    # Get ETH price and estimated USD value
-                                    eth_price_usd = self.get_eth_price() or 3000
-                                    eth_value = tx.value / 10**18  # Convert wei to ETH
-                                    usd_value = eth_value * eth_price_usd
-
-                                    logger.info(f"💱 Transaction value: {eth_value} ETH (~${usd_value})")
-
-                                    # Get the token data
-                                    token_data = self.tracked_contracts[tracked_addr]
-                                    min_usd = token_data.get("min_usd", 0)
-
-                                    if usd_value >= min_usd:
-                                        logger.info(f"✅ UNISWAP THRESHOLD MET: Buy of {tracked_addr} (${usd_value}) exceeds min ${min_usd}")
-
-                                        # Determine the chat IDs to send alerts to
-                                        chat_ids = []
-                                        primary_chat_id = token_data.get("chat_id")
-                                        if primary_chat_id:
-                                            chat_ids.append(primary_chat_id)
-
-                                        # Send alerts to each chat
-                                        for chat_id in chat_ids:
-                                            token_info = {
-                                                "address": tracked_addr,
-                                                "name": token_data.get("name", "Unknown Token"),
-                                                "symbol": token_data.get("symbol", "???"),
-                                                "chain": "ethereum"
-                                            }
-
-                                            # Send the alert
-                                            tx_hash_hex = tx.hash.hex()
-                                            # Record alert data for API
-                                            alert_data = {
-                                                "timestamp": datetime.now().isoformat(),
-                                                "network": "ethereum",
-                                                "token_name": token_info.get("name", "Unknown"),
-                                                "token_symbol": token_data.get("symbol", "???"),
-                                                "contract_address": tracked_addr,
-                                                "amount_usd": usd_value,
-                                                "tx_hash": tx_hash_hex,
-                                                "chat_id": str(chat_id)
-                                            }
-
-                                            # Send alert to Telegram chat
-                                            await send_eth_alert(
-                                                bot=self.bot,
-                                                chat_id=chat_id,
-                                                symbol=token_data.get("symbol", "???"),
-                                                amount=eth_value,
-                                                tx_hash=tx_hash_hex,
-                                                token_info=token_info,
-                                                usd_value=usd_value,
-                                                dex_name=router_name,
-                                                alert_data=alert_data
-                                            )
-                                            self.total_alerts_sent += 1
-
-                                except Exception as e:
-                                    logger.error(f"❌ Error processing Uniswap V3 transaction: {e}", exc_info=True)
-
-                    # Validate router address or token presence
-                    is_known_router = tx.to.lower() in router_addresses
-                    router_name = next((name for name, addr in DEX_ROUTERS.items() if addr.lower() == tx.to.lower()), "Not a Router")
-
-                    # Log router information
-                    logger.info(f"   Is Known Router: {is_known_router} ({router_name})")
-
-                    if not is_known_router and not any(addr[2:] in decoded_input for addr in self.tracked_contracts):
-                        continue
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("TX %s | To: %s (%s) | Method: %s | Is Buy: %s | Tracked transfers: %d",
+                                    tx_hash_hex, to_address, ROUTER_NAME_BY_ADDR.get(to_address, "Not a Router"),
+                                    method_id, is_buy_method(method_id), len(transfer_logs))
 
-                    # Check for matching method signatures or if the transaction input contains a tracked token
-                    method_match = False
-                    token_in_input = False
+                    candidates.append((tx, tx_hash_hex, method_id, input_tokens, transfer_logs))
 
-                    # Check if method signature matches known DEX methods
-                    if decoded_input[:10] in SWAP_FUNCTION_SIGS.values():
-                        method_match = True
-                        logger.info(f"   Method signature match: {decoded_input[:10]}")
+                if candidates:
+                    logger.info("🔍 %d candidate transactions in block %s", len(candidates), block.number)
+                    semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TXS)
 
-                    # Check if any tracked token is in input data
-                    for tracked_addr in self.tracked_contracts.keys():
-                        if tracked_addr.lower().replace('0x', '') in decoded_input.lower():
-                            token_in_input = True
-                            logger.info(f"   Tracked token {tracked_addr} found in transaction input")
-                            break
+                    async def process_bounded(tx, tx_hash_hex, method_id, input_tokens, transfer_logs):
+                        # Errors stay per-tx so one bad transaction doesn't cancel its siblings in the group
+                        async with semaphore:
+                            try:
+                                await self._process_tx(tx, tx_hash_hex, block_iso, eth_price_usd, method_id, input_tokens, transfer_logs)
+                            except Exception as e:
+                                logger.error(f"❌ Error processing TX {tx_hash_hex}: {e}", exc_info=True)
 
-                    if not (method_match or token_in_input or is_known_router):
-                        continue
+                    async with asyncio.TaskGroup() as tg:
+                        for candidate in candidates:
+                            tg.create_task(process_bounded(*candidate))
+            except Exception as e:
+                logger.error(f"⚠️ Error during Ethereum monitoring: {e}", exc_info=True)
+
+            logger.info("Completed monitoring loop, sleeping for %s seconds", self.CHECK_INTERVAL_SECONDS)
+            await asyncio.sleep(self.CHECK_INTERVAL_SECONDS)
 
-                    receipt = self.web3.eth.get_transaction_receipt(tx.hash)
-                    logger.info(f"🔍 Processing TX: {tx.hash.hex()} | Router: {tx.to}")
+    async def _process_tx(self, tx, tx_hash_hex, block_iso, eth_price_usd, method_id, input_tokens, transfer_logs):
+        """Send alerts for tracked token buys in a candidate transaction and its tracked Transfer logs"""
+        # Tracked tokens mentioned in tx.input
+        for tracked_addr in input_tokens:
+            if tracked_addr not in self.tracked_contracts:
+                continue
 
-                    # Log ALL logs to see what we might be missing
-                    for i, log in enumerate(receipt.logs):
-                        logger.info(f"TX {tx.hash.hex()} LOG #{i} => address: {log.address.lower()} | topics: {[t.hex() for t in log.topics]}")
+            logger.info("🚨 Tracked token %s found in transaction %s | Method: %s | To: %s",
+                        tracked_addr, tx_hash_hex, method_id, tx.to)
 
-                        # Check if this is a transfer event
+            # Enhanced detection for Uniswap V3 methods
+            # exactInputSingle (0x04e45aaf), exactInput (0xc04b8d59), exactOutputSingle (0x5023b4df), exactOutput (0xf28c0498)
+            if method_id in ("0x04e45aaf", "0xb858183f", "0xc04b8d59"):
+                logger.info("🔍 UNISWAP V3 transaction detected with tracked token!")
+
+                # Attempt to extract token amount and value
+                try:
+                    logger.info("💰 Processing Uniswap V3 exactInputSingle for token %s", tracked_addr)
+
+                    # Get the router name
+                    router_name = "Uniswap V3"
+
+                    # Estimate USD value with the price fetched for this block
+                    eth_value = tx.value / 10**18  # Convert wei to ETH
+                    usd_value = eth_value * eth_price_usd if eth_price_usd else 0.0
+
+                    logger.info("💱 Transaction value: %s ETH (~$%s)", eth_value, usd_value)
+
+                    # Get the token data
+                    token_data = self.tracked_contracts[tracked_addr]
+                    min_usd = token_data.get("min_usd", 0)
+
+                    if usd_value >= min_usd:
+                        logger.info("✅ UNISWAP THRESHOLD MET: Buy of %s ($%s) exceeds min $%s", tracked_addr, usd_value, min_usd)
+
+                        # Determine the chat IDs to send alerts to
+                        chat_ids = []
+                        primary_chat_id = token_data.get("chat_id")
+                        if primary_chat_id:
+                            chat_ids.append(primary_chat_id)
+
+                        if chat_ids:
+                            token_info = {
+                                "address": tracked_addr,
+                                "name": token_data.get("name", "Unknown Token"),
+                                "symbol": token_data.get("symbol", "???"),
+                                "chain": "ethereum"
+                            }
+
+                            # Record alert data for API
+                            alert_data = {
+                                "timestamp": block_iso,
+                                "network": "ethereum",
+                                "token_name": token_info.get("name", "Unknown"),
+                                "token_symbol": token_data.get("symbol", "???"),
+                                "contract_address": tracked_addr,
+                                "amount_usd": usd_value,
+                                "tx_hash": tx_hash_hex
+                            }
+
+                            # Hand the alert to the background sender, which sends to all chats at once
+                            self._queue_alert(
+                                chat_ids,
+                                symbol=token_data.get("symbol", "???"),
+                                amount=eth_value,
+                                tx_hash=tx_hash_hex,
+                                token_info=token_info,
+                                usd_value=usd_value,
+                                dex_name=router_name,
+                                alert_data=alert_data
+                            )
+
+                except Exception as e:
+                    logger.error(f"❌ Error processing Uniswap V3 transaction: {e}", exc_info=True)
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        logger.debug("🔍 Processing TX: %s | Router: %s | Tracked transfers: %d", tx_hash_hex, tx.to, len(transfer_logs))
+
+        # get_logs already filtered by topic and tracked token address
+        for log in transfer_logs:
+            try:
+                # Drops logs of tokens untracked since get_logs ran; the lookup is reused below
+                token_address = log.address.lower()
+                token_data = self.tracked_contracts.get(token_address)
+                if token_data is None:
+                    continue
+
+                # Compare raw topic bytes; no hex strings are built for transfers we skip
+                if len(log.topics) < 3 or log.topics[0] != TRANSFER_TOPIC_BYTES:
+                    continue
+
+                from_bytes = log.topics[1][-20:]
+
+                if debug_enabled:
+                    logger.debug("🧐 TRANSFER %s in TX %s | From: 0x%s | To: 0x%s",
+                                 token_address, tx_hash_hex, bytes(from_bytes).hex(), bytes(log.topics[2][-20:]).hex())
+            except Exception as e:
+                logger.error(f"Error processing log: {e}")
+                continue
+
+            # Check if this is a buy (transfer from a router to a wallet)
+            if from_bytes in ROUTER_ADDRS_BYTES:
+                if debug_enabled:
+                    from_address = '0x' + bytes(from_bytes).hex()
+                    router_name = ROUTER_NAME_BY_ADDR.get(from_address, "Unknown Router")
+                    logger.debug("🚨 POTENTIAL BUY: Transfer from router %s (%s) for token %s in TX %s",
+                                 from_address, router_name, token_address, tx_hash_hex)
+
+                # Extract token amount from transfer data
+                try:
+                    amount = decode_uint256(log.data)
+
+                    # Get decimals from the cache, or from the token contract once (fallback to 18)
+                    decimals = self._decimals_cache.get(token_address)
+                    if decimals is None:
+                        decimals = 18  # Default but should get from token contract
                         try:
-                            if len(log.topics) >= 3 and log.topics[0].hex() == TRANSFER_TOPIC:
-                                token_address = log.address.lower()
-                                from_address = '0x' + log.topics[1].hex()[-40:]
-                                to_address = '0x' + log.topics[2].hex()[-40:]
-
-                                # Enhanced debugging for Transfer events with more context
-                                logger.info(f"💰 TRANSFER EVENT DETECTED IN TX {tx.hash.hex()}: {token_address}")
-                                logger.info(f"   From: {from_address} | To: {to_address}")
-                                logger.info(f"   Token data: {log.data}")
-                                logger.info(f"   Token value: {int(log.data, 16) if log.data else 0}")
-                                logger.info(f"   Is token tracked: {token_address in self.tracked_contracts}")
-                                logger.info(f"   Is FROM router: {from_address.lower() in router_addresses}")
-                                logger.info(f"   Is TO tracked: {to_address.lower() in self.tracked_contracts}")
-                                logger.info(f"   Currently tracking tokens: {list(self.tracked_contracts.keys())}")
-
-                            if len(log.topics) < 3 or log.topics[0].hex() != TRANSFER_TOPIC:
-                                continue
-
-                            token_address = log.address.lower()
-                            from_address = '0x' + log.topics[1].hex()[-40:]
-                            to_address = '0x' + log.topics[2].hex()[-40:]
-
-                            # More detailed debugging for log matching
-                            logger.info(f"🧐 PROCESSING TRANSFER: {token_address} in TX {tx.hash.hex()}")
-                            logger.info(f"   From: {from_address} | To: {to_address}")
-                            logger.info(f"   Token in tracked contracts: {token_address in self.tracked_contracts}")
-                            logger.info(f"   From is router: {from_address.lower() in router_addresses}")
-                            logger.info(f"   Router name if applicable: {next((name for name, addr in DEX_ROUTERS.items() if addr.lower() == from_address.lower()), 'Not a Router')}")
-                            logger.info(f"   Tracked contracts (case-sensitive check): {list(self.tracked_contracts.keys())}")
-
-                            # Case-insensitive address check for backup validation
-                            tracked_lower = [addr.lower() for addr in self.tracked_contracts.keys()]
-                            logger.info(f"   Token in tracked (lowercase): {token_address.lower() in tracked_lower}")
-
-                            # Check if this token is one we're tracking - with enhanced logging
-                            logger.info(f"🔍 Checking token against tracked tokens: {token_address}")
-                            logger.info(f"🔍 Tracked contracts: {list(self.tracked_contracts.keys())}")
-
-                            # Case-insensitive check for addresses
-                            tracked_lower = {k.lower(): v for k, v in self.tracked_contracts.items()}
-
-                            token_is_tracked = token_address in self.tracked_contracts
-                            token_is_tracked_case_insensitive = token_address.lower() in tracked_lower
-                            destination_is_tracked = to_address.lower() in self.tracked_contracts
-                            source_is_tracked = from_address.lower() in self.tracked_contracts
-
-                            logger.info(f"🧐 Tracking check results: token_is_tracked={token_is_tracked}, token_case_insensitive={token_is_tracked_case_insensitive}, destination_is_tracked={destination_is_tracked}, source_is_tracked={source_is_tracked}")
-
-                            # If token is tracked with different case, use the original case for retrieval
-                            if not token_is_tracked and token_is_tracked_case_insensitive:
-                                original_case = next((k for k in self.tracked_contracts if k.lower() == token_address.lower()), None)
-                                if original_case:
-                                    logger.info(f"✅ Found case-insensitive match: {original_case} vs {token_address}")
-                                    token_address = original_case
-                                    token_is_tracked = True
-
-                            if not (token_is_tracked or destination_is_tracked or source_is_tracked):
-                                logger.info(f"❌ SKIPPING: Transfer not related to any tracked token or address")
-                                continue
+                            # This is optional but helpful if available
+                            decimals = await self._get_token_contract(token_address).functions.decimals().call()
+                            self._decimals_cache[token_address] = decimals
+                            logger.debug("📏 Token decimals fetched from contract: %s", decimals)
                         except Exception as e:
-                            logger.error(f"Error processing log: {e}")
-                            continue
-
-                        if destination_is_tracked:
-                            token_address = to_address.lower()
-                            logger.info(f"🔍 Detected transfer TO tracked token: {token_address}")
-
-                        # Check if this is a buy (transfer from a router to a wallet)
-                        if from_address.lower() in router_addresses:
-                            logger.info(f"🚨 POTENTIAL BUY DETECTED: Transfer from router {from_address} for token {token_address}")
-                            logger.info(f"   Transaction hash: {tx.hash.hex()}")
-
-                            # Double check router and normalize addresses for comparison
-                            router_name = next((name for name, addr in DEX_ROUTERS.items() 
-                                              if addr.lower() == from_address.lower()), "Unknown Router")
-                            logger.info(f"   Router identified as: {router_name}")
-
-                            # Verify exact address format and case
-                            logger.info(f"   Token address (as is): {token_address}")
-                            logger.info(f"   Token address length: {len(token_address)}")
-                            logger.info(f"   Token address (normalized): {token_address.lower()}")
-
-                            # Log all tracked contracts for comparison
-                            logger.info(f"   All tracked contracts: {list(self.tracked_contracts.keys())}")
-
-                            # Try different normalization to ensure proper matching
-                            normalized_token = token_address.lower()
-                            normalized_tracked = {k.lower(): v for k, v in self.tracked_contracts.items()}
-                            logger.info(f"   Normalized match: {normalized_token in normalized_tracked}")
-
-                            # Only proceed if we're tracking this token
-                            if token_address not in self.tracked_contracts:
-                                logger.info(f"❌ Token {token_address} not matched in tracked contracts, skipping alert")
-                                # Additional checking for case issues
-                                if token_address.lower() in [k.lower() for k in self.tracked_contracts.keys()]:
-                                    logger.warning(f"⚠️ Case mismatch detected! Token would match if case-insensitive.")
-                                continue
-
-                            logger.info(f"✅ MATCHED TRACKED TOKEN {token_address} - Preparing alert...")
-
-                            # Extract token amount from transfer data with detailed logging
-                            try:
-                                amount = int(log.data, 16)
-                                logger.info(f"🔢 Raw token amount (hex): {log.data}")
-                                logger.info(f"🔢 Parsed amount (int): {amount}")
-
-                                # Try to get decimals from token contract (fallback to 18)
-                                decimals = 18  # Default but should get from token contract
-                                try:
-                                    # This is optional but helpful if available
-                                    token_contract = self.web3.eth.contract(
-                                        address=self.web3.to_checksum_address(token_address),
-                                        abi=[{"inputs":[],"name":"decimals","outputs":[{"internalType":"uint8","name":"","type":"uint8"}],"stateMutability":"view","type":"function"}]
-                                    )
-                                    decimals = token_contract.functions.decimals().call()
-                                    logger.info(f"📏 Token decimals fetched from contract: {decimals}")
-                                except Exception as e:
-                                    logger.info(f"📏 Using default decimals (18): {e}")
-
-                                token_amount = amount / 10**decimals
-                                logger.info(f"💱 Calculated token amount: {token_amount:.8f}")
-
-                                # Get ETH price and calculate USD value
-                                logger.info(f"💲 ETH price used for calculation: ${eth_price_usd}")
-                                usd_value = round(token_amount * eth_price_usd, 2) if eth_price_usd else 0.0
-                                logger.info(f"💵 Calculated USD value: ${usd_value}")
-
-                                logger.info(f"💰 DETECTED BUY: {token_amount:.8f} tokens of {token_address}")
-                                logger.info(f"🚀 Transaction: {tx.hash.hex()} | Value: ~${usd_value} USD")
-                            except Exception as e:
-                                logger.error(f"❌ Error calculating token amount: {e}", exc_info=True)
-                                continue
-
-                            # Check if value meets minimum threshold
-                            token_data = self.tracked_contracts[token_address]
-                            min_usd = token_data.get("min_usd", 0)
-
-                            logger.info(f"💰 Buy amount: {token_amount:.4f} tokens (~${usd_value} USD)")
-                            logger.info(f"   Minimum threshold: ${min_usd}")
-                            logger.info(f"   Token data: {token_data}")
-
-                            if usd_value >= min_usd:
-                                logger.info(f"✅ THRESHOLD MET: Buy of {token_amount:.4f} of {token_address} (${usd_value}) exceeds min ${min_usd}")
-
-                                # Determine the chat IDs to send alerts to
-                                chat_ids = []
-
-                                # Primary chat ID from the token data
-                                primary_chat_id = token_data.get("chat_id")
-                                if primary_chat_id:
-                                    chat_ids.append(primary_chat_id)
-                                    logger.info(f"Found primary chat ID: {primary_chat_id} for token {token_address}")
-
-                                # Always send to admin chat if configured
-                                if ADMIN_CHAT_ID and ADMIN_CHAT_ID not in ['', 'None', None]:
-                                    admin_id = int(ADMIN_CHAT_ID)
-                                    if admin_id not in chat_ids:
-                                        chat_ids.append(admin_id)
-                                        logger.info(f"Adding admin chat ID: {admin_id}")
-
-                                if not chat_ids:
-                                    logger.warning(f"No chat IDs found for token {token_address}")
-                                    continue
-
-                                # Send alerts to each chat
-                                for chat_id in chat_ids:
-                                    try:
-                                        logger.info(f"📢 Sending alert to chat {chat_id} for token {token_address}")
-
-                                        # Prepare token info for alert
-                                        token_info = {
-                                            "address": token_address,
-                                            "name": token_data.get("name", "Unknown Token"),
-                                            "symbol": token_data.get("symbol", "???"),
-                                            "chain": "ethereum",
-                                            "telegram": token_data.get("telegram", "#"),
-                                            "website": token_data.get("website", "#"),
-                                            "twitter": token_data.get("twitter", "#")
-                                        }
-
-                                        # Debug token_info
-                                        logger.info(f"🔍 Debug token_info: {token_info}")
-
-                                        # Send the alert
-                                        dex_name = "Uniswap"  # Default; could determine actual DEX with more analysis
-                                        tx_hash_hex = tx.hash.hex()
-
-                                        logger.info(f"🚀 SENDING ALERT NOW for {token_address} to chat {chat_id}")
-                                        logger.info(f"   Token symbol: {token_data.get('symbol', '???')}")
-                                        logger.info(f"   Amount: {token_amount}")
-                                        logger.info(f"   USD Value: ${usd_value}")
-                                        logger.info(f"   DEX: {dex_name}")
-                                        logger.info(f"   Transaction hash: {tx_hash_hex}")
-                                        logger.info(f"   Token info being sent: {token_info}")
-
-                                        # Record alert data for API
-                                        alert_data = {
-                                            "timestamp": datetime.now().isoformat(),
-                                            "network": "ethereum",
-                                            "token_name": token_info.get("name", "Unknown"),
-                                            "token_symbol": token_data.get("symbol", "???"),
-                                            "contract_address": token_address,
-                                            "amount_usd": usd_value,
-                                            "tx_hash": tx_hash_hex,
-                                            "chat_id": str(chat_id)
-                                        }
-
-                                        # Send alert to Telegram chat
-                                        await send_eth_alert(
-                                            bot=self.bot,
-                                            chat_id=chat_id,
-                                            symbol=token_data.get("symbol", "???"),
-                                            amount=token_amount,
-                                            tx_hash=tx_hash_hex,
-                                            token_info=token_info,
-                                            usd_value=usd_value,
-                                            dex_name=dex_name,
-                                            alert_data=alert_data
-                                        )
-
-                                        # Check if alert was successful (assuming send_eth_alert returns success status)
-                                        alert_success = True  # This should be the return value from send_eth_alert
-                                        if alert_success:
-                                            logger.info(f"✅ ALERT SENT SUCCESSFULLY to chat {chat_id}")
-                                            # Update tracking stats
-                                            self.total_alerts_sent += 1
-                                            self.last_alert_msg = f"ETH Alert: {token_data.get('symbol', '???')} buy of {token_amount:.4f} (~${usd_value}) via {dex_name}"
-                                        else:
-                                            logger.error(f"❌ ALERT FAILED TO SEND to chat {chat_id} despite no exception")
-                                    except Exception as e:
-                                        logger.error(f"❌ EXCEPTION DURING ALERT SENDING to chat {chat_id}: {e}", exc_info=True)
-                            else:
-                                logger.info(f"❌ BELOW THRESHOLD: Buy of {token_amount:.4f} of {token_address} (${usd_value}) below min ${min_usd}")
-                                continue
+                            logger.debug("📏 Using default decimals (18): %s", e)
+
+                    token_amount = amount / 10**decimals
+                    usd_value = round(token_amount * eth_price_usd, 2) if eth_price_usd else 0.0
+
+                    logger.info("💰 DETECTED BUY: %.8f tokens of %s | TX: %s | Value: ~$%s USD (ETH price $%s)",
+                                token_amount, token_address, tx_hash_hex, usd_value, eth_price_usd)
+                except Exception as e:
+                    logger.error(f"❌ Error calculating token amount: {e}", exc_info=True)
+                    continue
+
+                # Check if value meets minimum threshold
+                min_usd = token_data.get("min_usd", 0)
+
+                if usd_value >= min_usd:
+                    logger.info("✅ THRESHOLD MET: Buy of %.4f of %s ($%s) exceeds min $%s", token_amount, token_address, usd_value, min_usd)
+
+                    # Determine the chat IDs to send alerts to
+                    chat_ids = []
+
+                    # Primary chat ID from the token data
+                    primary_chat_id = token_data.get("chat_id")
+                    if primary_chat_id:
+                        chat_ids.append(primary_chat_id)
+
+                    # Always send to admin chat if configured
+                    if ADMIN_CHAT_ID and ADMIN_CHAT_ID not in ['', 'None', None]:
+                        admin_id = int(ADMIN_CHAT_ID)
+                        if admin_id not in chat_ids:
+                            chat_ids.append(admin_id)
+
+                    if not chat_ids:
+                        logger.warning("No chat IDs found for token %s", token_address)
+                        continue
+
+                    # Prepare token info for alert
+                    token_info = {
+                        "address": token_address,
+                        "name": token_data.get("name", "Unknown Token"),
+                        "symbol": token_data.get("symbol", "???"),
+                        "chain": "ethereum",
+                        "telegram": token_data.get("telegram", "#"),
+                        "website": token_data.get("website", "#"),
+                        "twitter": token_data.get("twitter", "#")
+                    }
+
+                    dex_name = "Uniswap"  # Default; could determine actual DEX with more analysis
+
+                    logger.info("🚀 Queueing alert for %s to chats %s | TX: %s", token_address, chat_ids, tx_hash_hex)
+                    logger.debug("   Token info being sent: %s", token_info)
+
+                    # Record alert data for API
+                    alert_data = {
+                        "timestamp": block_iso,
+                        "network": "ethereum",
+                        "token_name": token_info.get("name", "Unknown"),
+                        "token_symbol": token_data.get("symbol", "???"),
+                        "contract_address": token_address,
+                        "amount_usd": usd_value,
+                        "tx_hash": tx_hash_hex
+                    }
+
+                    # Hand the alert to the background sender; stats update once it is delivered
+                    self._queue_alert(
+                        chat_ids,
+                        last_alert_msg=f"ETH Alert: {token_data.get('symbol', '???')} buy of {token_amount:.4f} (~${usd_value}) via {dex_name}",
+                        symbol=token_data.get("symbol", "???"),
+                        amount=token_amount,
+                        tx_hash=tx_hash_hex,
+                        token_info=token_info,
+                        usd_value=usd_value,
+                        dex_name=dex_name,
+                        alert_data=alert_data
+                    )
+                else:
+                    logger.info("❌ BELOW THRESHOLD: Buy of %.4f of %s ($%s) below min $%s", token_amount, token_address, usd_value, min_usd)
+                    continue
+
+    def _queue_alert(self, chat_ids, last_alert_msg=None, **alert_kwargs):
+        """Queue an alert for the background sender so block scanning never waits on Telegram"""
+        try:
+            self._alert_queue.put_nowait((list(chat_ids), alert_kwargs, last_alert_msg))
+            return True
+        except asyncio.QueueFull:
+            logger.warning("⚠️ Alert queue full, dropping alert for chats %s", chat_ids)
+            return False
+
+    async def _deliver_alert(self, chat_ids, alert_kwargs, last_alert_msg):
+        """Send one alert to all of its chats concurrently and update stats per chat"""
+        alert_data = alert_kwargs.pop("alert_data", None)
+        results = await asyncio.gather(
+            *(
+                send_eth_alert(
+                    bot=self.bot,
+                    chat_id=chat_id,
+                    alert_data=dict(alert_data, chat_id=str(chat_id)) if alert_data else None,
+                    **alert_kwargs
+                )
+                for chat_id in chat_ids
+            ),
+            return_exceptions=True
+        )
+
+        for chat_id, result in zip(chat_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ EXCEPTION DURING ALERT SENDING to chat {chat_id}: {result}", exc_info=result)
+            elif result:
+                logger.info("✅ ALERT SENT SUCCESSFULLY to chat %s", chat_id)
+                # Update tracking stats
+                self.total_alerts_sent += 1
+                if last_alert_msg:
+                    self.last_alert_msg = last_alert_msg
+            else:
+                logger.error("❌ ALERT FAILED TO SEND to chat %s", chat_id)
+
+    async def _alert_worker(self):
+        """Deliver queued alerts, at most ALERT_CONCURRENCY at a time"""
+        logger.info("📬 ETH alert sender active")
+        while True:
+            batch = [await self._alert_queue.get()]
+            while len(batch) < self.ALERT_CONCURRENCY and not self._alert_queue.empty():
+                batch.append(self._alert_queue.get_nowait())
+
+            try:
+                await asyncio.gather(*(self._deliver_alert(*job) for job in batch))
             except Exception as e:
-                logger.error(f"⚠️ Error during Ethereum monitoring: {e}", exc_info=True)
+                logger.error(f"❌ Error delivering ETH alerts: {e}", exc_info=True)
+            finally:
+                for _ in batch:
+                    self._alert_queue.task_done()
 
-            logger.info(f"Completed monitoring loop, sleeping for {self.CHECK_INTERVAL_SECONDS} seconds")
-            await asyncio.sleep(self.CHECK_INTERVAL_SECONDS)
+    def start_alert_worker(self):
+        """Start the background alert sender if it is not already running"""
+        if self._alert_worker_task is None or self._alert_worker_task.done():
+            self._alert_worker_task = asyncio.create_task(self._alert_worker())
+        return self._alert_worker_task
 
     async def track_command(self, update, context):
         """Handle the /track command"""
@@ -876,7 +805,13 @@ class EthMonitor:
 
 
 # Constants
+ERC20_MIN_ABI = [
+    {"inputs": [], "name": "decimals", "outputs": [{"internalType": "uint8", "name": "", "type": "uint8"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [], "name": "symbol", "outputs": [{"internalType": "string", "name": "", "type": "string"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [], "name": "name", "outputs": [{"internalType": "string", "name": "", "type": "string"}], "stateMutability": "view", "type": "function"}
+]
 TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+TRANSFER_TOPIC_BYTES = bytes.fromhex(TRANSFER_TOPIC[2:])
 DEX_ROUTERS = {
     # Uniswap Routers (all versions)
     "UniswapV1": "0xf164fC0Ec4E93095b804a4795bBe1e041497b92a",
@@ -941,7 +876,7 @@ SWAP_FUNCTION_SIGS = {
 }
 
 # Methods specifically for buying tokens (ETH/Native -> Token)
-BUY_METHODS = [
+BUY_METHODS = (
     "0x7ff36ab5",  # swapExactETHForTokens
     "0xb6f9de95",  # swapExactETHForTokensSupportingFeeOnTransferTokens
     "0xfb3bdb41",  # swapETHForExactTokens
@@ -951,17 +886,34 @@ BUY_METHODS = [
     "0xb858183f",  # exactInput
     "0x414bf389",  # exactInputSingle
     "0xbc651188",  # v3SwapExactIn
-]
+)
+
+# Lowercase lookup sets built once so hot-path membership checks are O(1)
+ROUTER_ADDRS_LC = frozenset(addr.lower() for addr in DEX_ROUTERS.values())
+# Raw 20-byte router addresses, matched against the tail of Transfer topics
+ROUTER_ADDRS_BYTES = frozenset(bytes.fromhex(addr[2:]) for addr in ROUTER_ADDRS_LC)
+# First name wins for routers listed twice (e.g. MatchaRouter / 0x)
+ROUTER_NAME_BY_ADDR = {addr.lower(): name for name, addr in reversed(DEX_ROUTERS.items())}
+BUY_METHODS_SET = frozenset(BUY_METHODS)
+
+def decode_uint256(data):
+    """Decode an ABI-encoded uint256 log payload (raw bytes or 0x-prefixed hex string)"""
+    if not data:
+        return 0
+    if isinstance(data, str):
+        data = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+    return int.from_bytes(data, "big")
 
 def is_buy_method(method_id):
     """Check if method signature indicates a buy transaction"""
     if not method_id:
         return False
     method_id = method_id[:10].lower()
-    return method_id in BUY_METHODS
+    return method_id in BUY_METHODS_SET
 
 # FastAPI setup
-app = FastAPI()
+StatusResponse = ORJSONResponse if orjson else JSONResponse
+app = FastAPI(default_response_class=StatusResponse)
 monitor_instance = None
 
 @app.get("/")
@@ -980,24 +932,59 @@ def root():
 @app.get("/status")
 def status():
     if monitor_instance:
-        return JSONResponse({
-            "tracked_contracts": list(monitor_instance.tracked_contracts),
+        return StatusResponse({
+            "tracked_contracts": monitor_instance._tracked_snapshot,
             "alerts_sent": monitor_instance.total_alerts_sent,
             "last_alert": monitor_instance.last_alert_msg[:300]
         })
-    return JSONResponse({"status": "bot not running"})
+    return StatusResponse({"status": "bot not running"})
 
 def run_dashboard():
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
 
+ALERT_LOG_FILE = "alerts.log"
+ALERT_LOG_FLUSH_SECONDS = 0.1
+_alert_log_queue = None
+_alert_log_task = None
+
+def _log_alert_data(alert_data):
+    """Queue alert data for the background alerts.log writer, starting it if needed"""
+    global _alert_log_queue, _alert_log_task
+    if _alert_log_queue is None:
+        _alert_log_queue = asyncio.Queue()
+    if _alert_log_task is None or _alert_log_task.done():
+        _alert_log_task = asyncio.create_task(_alert_log_writer(_alert_log_queue))
+    if orjson:
+        record = orjson.dumps(alert_data, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        record = (json.dumps(alert_data) + "\n").encode()
+    _alert_log_queue.put_nowait(record)
+
+def _write_alert_lines(lines):
+    with open(ALERT_LOG_FILE, "ab") as f:
+        f.writelines(lines)
+
+async def _alert_log_writer(queue):
+    """Append queued alert records to alerts.log in batches"""
+    while True:
+        lines = [await queue.get()]
+        # Give concurrent alerts a moment to queue up so they share one write
+        await asyncio.sleep(ALERT_LOG_FLUSH_SECONDS)
+        while not queue.empty():
+            lines.append(queue.get_nowait())
+        try:
+            await asyncio.to_thread(_write_alert_lines, lines)
+            logger.debug("✅ Saved %d alert records", len(lines))
+        except Exception as e:
+            logger.error(f"❌ Error saving alert data: {e}")
+
 async def send_eth_alert(bot, chat_id, symbol, amount, tx_hash, token_info=None, usd_value=None, dex_name="Uniswap", alert_data=None):
     """Send an Ethereum token buy alert"""
-    from telegram import InlineKeyboardButton, InlineKeyboardMarkup
     try:
         # 🛡️ Validate token_info and parameters
-        logger.info(f"🔍 Preparing to send ETH alert with token_info: {token_info}")
-        logger.info(f"   Chat ID: {chat_id}, Symbol: {symbol}, Amount: {amount}, TX: {tx_hash}")
+        logger.debug("🔍 Preparing to send ETH alert with token_info: %s", token_info)
+        logger.debug("   Chat ID: %s, Symbol: %s, Amount: %s, TX: %s", chat_id, symbol, amount, tx_hash)
 
         # Validate token_info structure
         if not token_info:
@@ -1016,10 +1003,10 @@ async def send_eth_alert(bot, chat_id, symbol, amount, tx_hash, token_info=None,
         token_name = token_info.get("name", symbol)
         token_symbol = token_info.get("symbol", symbol)
 
-        # 💵 Calculate USD value if not provided
+        # 💵 Calculate USD value if not provided, using the monitor's cached ETH price
         if usd_value is None:
-            eth_price = 3000  # fallback ETH price
-            usd_value = eth_price * amount
+            eth_price = eth_monitor_instance._eth_price if eth_monitor_instance else None
+            usd_value = eth_price * amount if eth_price else 0.0
 
         # 🧭 Build URLs
         tx_url = f"https://etherscan.io/tx/{tx_hash}"
@@ -1045,7 +1032,7 @@ async def send_eth_alert(bot, chat_id, symbol, amount, tx_hash, token_info=None,
         )
 
         # 🧠 Log for debugging
-        logger.info(f"📤 Sending alert to chat_id: {chat_id}")
+        logger.debug("📤 Sending alert to chat_id: %s", chat_id)
 
         # ✅ Inline buttons
         keyboard = InlineKeyboardMarkup([
@@ -1063,16 +1050,13 @@ async def send_eth_alert(bot, chat_id, symbol, amount, tx_hash, token_info=None,
                 reply_markup=keyboard,
                 disable_web_page_preview=True
             )
-            logger.info(f"✅ Alert sent to chat {chat_id} for {symbol}")
+            logger.info("✅ Alert sent to chat %s for %s", chat_id, symbol)
             if alert_data:
-                # Store alert data (Implementation for storing alert data will depend on your system)
+                # Hand alert data to the background alerts.log writer
                 try:
-                    # Example using a simple list for demonstration (Replace with your actual storage mechanism)
-                    with open("alerts.log", "a") as f:
-                        f.write(str(alert_data) + "\n")
-                    logger.info(f"✅ Alert data saved: {alert_data}")
+                    _log_alert_data(alert_data)
                 except Exception as e:
-                    logger.error(f"❌ Error saving alert data: {e}")
+                    logger.error(f"❌ Error queueing alert data: {e}")
             return True
         except Exception as send_error:
             logger.error(f"❌ Error sending message to chat {chat_id}: {send_error}")
@@ -1106,6 +1090,7 @@ def get_instance(bot=None):
 async def start_monitoring(bot=None):
     monitor = get_instance(bot)
     logger.info("🚀 Starting Ethereum monitoring task...")
+    monitor.start_alert_worker()
     monitoring_task = asyncio.create_task(monitor.monitor_ethereum())
     return monitoring_task
 
@@ -1132,6 +1117,9 @@ async def track_uni_token_for_testing(chat_id):
     logger.info(f"✅ Added UNI token for testing in chat {chat_id}")
     return uni_address
 
+# Fixed fake transaction hash for test alerts
+_TEST_TX_HASH = "0x" + "0123456789abcdef" * 4
+
 async def test_eth_alert(chat_id, token_address=None):
     """Send a test ETH alert to verify the alert system is working"""
     global eth_monitor_instance
@@ -1184,10 +1172,11 @@ async def test_eth_alert(chat_id, token_address=None):
         logger.info(f"🔍 Using new tracking format search: {token_data}")
 
         # If not found in chat, check legacy format
-        if not token_data and token_address.lower() in eth_monitor_instance.tracked_contracts:
-            token_data = eth_monitor_instance.tracked_contracts[token_address.lower()]
+        token_address_lc = token_address.lower()
+        if not token_data and token_address_lc in eth_monitor_instance.tracked_contracts:
+            token_data = eth_monitor_instance.tracked_contracts[token_address_lc]
             # Ensure token_info includes address field
-            token_data["address"] = token_address.lower()
+            token_data["address"] = token_address_lc
             logger.info(f"🔍 Using legacy tracking format: {token_data}")
 
         # If token is not tracked, fallback to a basic example
@@ -1220,14 +1209,12 @@ async def test_eth_alert(chat_id, token_address=None):
 
     logger.info(f"🧪 Sending test ETH alert for token {token_data.get('symbol')} to chat {chat_id}")
 
-    test_tx = "0x" + "0123456789abcdef" * 4  # Fake tx hash
-
     success = await send_eth_alert(
         bot=eth_monitor_instance.bot,
         chat_id=chat_id,
         symbol=token_data.get("symbol", "TEST"),
         amount=1.5,
-        tx_hash=test_tx,
+        tx_hash=_TEST_TX_HASH,
         token_info=token_data,
         usd_value=4500,
         dex_name="Uniswap (Test)"
@@ -1253,9 +1240,6 @@ async def test_eth_alert(chat_id=None, token_info=None):
         logger.error("No chat_id provided for test_eth_alert")
         return False
 
-    # Generate a test transaction
-    tx_hash = "0x" + "".join([hex(i)[-1] for i in range(16)] * 4)
-
     # Use provided token info or default to a test token
     if not token_info:
         test_token = {
@@ -1270,10 +1254,9 @@ async def test_eth_alert(chat_id=None, token_info=None):
 
     symbol = test_token.get("symbol", "UNI")
 
-    # Random values for a more realistic test
-    import random
-    amount = round(random.uniform(0.5, 5.0), 2)
-    usd_value = round(amount * random.uniform(500, 5000), 2)
+    # Random values for a more realistic test; send_eth_alert formats the precision
+    amount = random.uniform(0.5, 5.0)
+    usd_value = amount * random.uniform(500, 5000)
 
     # Send a test alert
     await send_eth_alert(
@@ -1281,7 +1264,7 @@ async def test_eth_alert(chat_id=None, token_info=None):
         chat_id=chat_id,
         symbol=symbol,
         amount=amount,
-        tx_hash=tx_hash,
+        tx_hash=_TEST_TX_HASH,
         token_info=test_token,
         usd_value=usd_value,
         dex_name="Uniswap V3 (Test Alert)"
@@ -7,48 +7,55 @@ from data_manager import get_data_manager
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# The back-to-help menu is static, so build its text and keyboard once at import
+_BACK_TO_HELP_TEXT = (
+    "🚀 <b>Welcome to <u>TickerTrending Bot</u></b>\n\n"
+    "This bot helps <b>track</b> and <b>boost</b> crypto tokens across Telegram.\n\n"
+    "🧰 <b>Here's what you can do:</b>\n"
+    "• <code>/track</code> – Add ETH token\n"
+    "• <code>/tracksol</code> – Add SOL token\n"
+    "• <code>/untrack</code> – Remove token\n"
+    "• <code>/boost</code> – Promote your token\n"
+    "• <code>/customize_token</code> – Add token image, links, emojis\n"
+    "• <code>/example_alert</code> – Preview your alert\n"
+    "• <code>/stats</code> – Group analytics\n\n"
+    "🔗 <i>Powered by <a href='https://tickertrending.com'>TickerTrending.com</a></i>"
+)
+
+_BACK_TO_HELP_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📈 Track Token", callback_data="track"),
+        InlineKeyboardButton("❌ Untrack Token", callback_data="untrack"),
+    ],
+    [
+        InlineKeyboardButton("🚀 Boost Project", callback_data="boost"),
+        InlineKeyboardButton("🎨 Customize Alerts", callback_data="customize"),
+    ],
+    [
+        InlineKeyboardButton("📊 View Stats", callback_data="stats"),
+        InlineKeyboardButton("🧪 Test Alert", callback_data="example_alert"),
+    ],
+    [
+        InlineKeyboardButton("📄 Contracts Tracked", callback_data="contracts_tracked"),
+        InlineKeyboardButton("📘 Full Guide", url="https://tickertrending.com/guide"),
+    ],
+])
+
 async def handle_back_to_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle back to help button press"""
     query = update.callback_query
     await query.answer()
 
     # Re-display help menu
-    text = (
-        "🚀 <b>Welcome to <u>TickerTrending Bot</u></b>\n\n"
-        "This bot helps <b>track</b> and <b>boost</b> crypto tokens across Telegram.\n\n"
-        "🧰 <b>Here's what you can do:</b>\n"
-        "• <code>/track</code> – Add ETH token\n"
-        "• <code>/tracksol</code> – Add SOL token\n"
-        "• <code>/untrack</code> – Remove token\n"
-        "• <code>/boost</code> – Promote your token\n"
-        "• <code>/customize_token</code> – Add token image, links, emojis\n"
-        "• <code>/example_alert</code> – Preview your alert\n"
-        "• <code>/stats</code> – Group analytics\n\n"
-        "🔗 <i>Powered by <a href='https://tickertrending.com'>TickerTrending.com</a></i>"
-    )
-
-    keyboard = [
-        [
-            InlineKeyboardButton("📈 Track Token", callback_data="track"),
-            InlineKeyboardButton("❌ Untrack Token", callback_data="untrack"),
-        ],
-        [
-            InlineKeyboardButton("🚀 Boost Project", callback_data="boost"),
-            InlineKeyboardButton("🎨 Customize Alerts", callback_data="customize"),
-        ],
-        [
-            InlineKeyboardButton("📊 View Stats", callback_data="stats"),
-            InlineKeyboardButton("🧪 Test Alert", callback_data="example_alert"),
-        ],
-        [
-            InlineKeyboardButton("📄 Contracts Tracked", callback_data="contracts_tracked"),
-            InlineKeyboardButton("📘 Full Guide", url="https://tickertrending.com/guide"),
-        ],
-    ]
-
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    text = _BACK_TO_HELP_TEXT
+    reply_markup = _BACK_TO_HELP_MARKUP
     try:
-        await query.edit_message_text(text, reply_markup=reply_markup, parse_mode="HTML")
+        await query.edit_message_text(
+            text,
+            reply_markup=reply_markup,
+            parse_mode=ParseMode.HTML,
+            disable_web_page_preview=True
+        )
     except Exception as e:
         # If editing fails, send a new message
         logger.error(f"Error handling back button: {e}")
@@ -57,67 +64,155 @@ async def handle_back_to_help(update: Update, context: ContextTypes.DEFAULT_TYPE
                 chat_id=update.effective_chat.id,
                 text=text,
                 reply_markup=reply_markup,
-                parse_mode="HTML"
+                parse_mode=ParseMode.HTML,
+                disable_web_page_preview=True
             )
 
+_HELP_CALLBACK_HANDLERS = None
+
 def get_help_callback_handlers():
     """Return all callback handlers for help menu navigation"""
-    return [
-        CallbackQueryHandler(handle_back_to_help, pattern="^back_to_help$"),
-    ]
+    # Handlers (and their compiled patterns) are created once and reused
+    global _HELP_CALLBACK_HANDLERS
+    if _HELP_CALLBACK_HANDLERS is None:
+        _HELP_CALLBACK_HANDLERS = [
+            CallbackQueryHandler(handle_back_to_help, pattern="^back_to_help$", block=False),
+        ]
+    return _HELP_CALLBACK_HANDLERS
 
 
 import logging
 import os
+import time
+from datetime import datetime
 from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.ext import ContextTypes, CommandHandler, CallbackQueryHandler
 from telegram.constants import ParseMode
 
+try:
+    # bot_status is a shared dict mutated in place, so a module-level reference stays current
+    from dashboard import bot_status as _bot_status
+except Exception:
+    _bot_status = None
+
 logger = logging.getLogger(__name__)
 
-async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Show help information with beautiful UI"""
-    keyboard = [
-        [
-            InlineKeyboardButton("📈 Track Token", callback_data="track_token"),
-            InlineKeyboardButton("❌ Untrack Token", callback_data="untrack_token")
-        ],
-        [
-            InlineKeyboardButton("🚀 Boost Token", callback_data="boost_token"), #This line is changed
-            InlineKeyboardButton("🎨 Customize Alerts", callback_data="customize_alerts")
-        ],
-        [
-            InlineKeyboardButton("📊 View Stats", callback_data="view_stats"),
-            InlineKeyboardButton("🧪 Test Alert", callback_data="test_alert")
-        ],
-        [
-            InlineKeyboardButton("📋 Tracked Tokens", callback_data="contracts_tracked"),
-            InlineKeyboardButton("📚 Full Guide", url="https://tickertrending.com/guide")
-        ],
-        [
-            InlineKeyboardButton("✅ Bot Status Check", callback_data="bot_status_check")
-        ]
+# Static menus are built once at import and shared by every handler call
+_BACK_BUTTON = InlineKeyboardButton("🔙 Back", callback_data="help_menu")
+_BACK_MARKUP = InlineKeyboardMarkup([[_BACK_BUTTON]])
+
+_HELP_KEYBOARD = [
+    [
+        InlineKeyboardButton("📈 Track Token", callback_data="track_token"),
+        InlineKeyboardButton("❌ Untrack Token", callback_data="untrack_token")
+    ],
+    [
+        InlineKeyboardButton("🚀 Boost Token", callback_data="boost_token"),
+        InlineKeyboardButton("🎨 Customize Alerts", callback_data="customize_alerts")
+    ],
+    [
+        InlineKeyboardButton("📊 View Stats", callback_data="view_stats"),
+        InlineKeyboardButton("🧪 Test Alert", callback_data="test_alert")
+    ],
+    [
+        InlineKeyboardButton("📋 Tracked Tokens", callback_data="contracts_tracked"),
+        InlineKeyboardButton("📚 Full Guide", url="https://tickertrending.com/guide")
+    ],
+    [
+        InlineKeyboardButton("✅ Bot Status Check", callback_data="bot_status_check")
     ]
+]
+_HELP_MARKUP = InlineKeyboardMarkup(_HELP_KEYBOARD)
+
+_HELP_TEXT = (
+    "🚀 <b>Welcome to TickerTrending Bot</b>\n\n"
+    "This bot helps <b>track</b> and <b>boost</b> crypto tokens across Telegram.\n\n"
+    "🧰 <b>Here's what you can do:</b>\n"
+    "• <code>/track</code> – Add ETH token\n"
+    "• <code>/tracksol</code> – Add SOL token\n"
+    "• <code>/untrack</code> – Remove token\n"
+    "• <code>/boost</code> – Promote your token\n"
+    "• <code>/customize</code> – Add token image, links, emojis\n"
+    "• <code>/example_alert</code> – Preview your alert\n"
+    "• <code>/stats</code> – Group analytics\n\n"
+    "🔗 <i>Powered by</i> <a href='https://tickertrending.com'>TickerTrending.com</a>"
+)
+
+_TRACK_TOKEN_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🟣 Ethereum", callback_data="track_eth"),
+        InlineKeyboardButton("🔵 Solana", callback_data="track_sol")
+    ],
+    [_BACK_BUTTON]
+])
+
+_BOOST_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🟣 Ethereum", callback_data="network_eth"),
+        InlineKeyboardButton("🔵 Solana", callback_data="network_sol"),
+    ],
+    [
+        InlineKeyboardButton("🟡 BNB", callback_data="network_bnb"),
+        InlineKeyboardButton("🟢 Base", callback_data="network_base"),
+    ],
+    [
+        InlineKeyboardButton("ℹ️ How Boosting Works", callback_data="how_boost_works"),
+    ],
+    [_BACK_BUTTON]
+])
+
+_BOOST_TEXT = (
+    "🚀 <b>Boost Your Token's Visibility</b>\n\n"
+    "Supercharge your token's reach by boosting it to our partner channels and communities.\n\n"
+    "• <b>Increased Exposure</b> across multiple channels\n"
+    "• <b>Higher Visibility</b> to potential buyers\n"
+    "• <b>Professional Presentation</b> with your branding\n\n"
+    "Select which blockchain your token is on:"
+)
+
+_CUSTOMIZE_TEXT = (
+    "🎨 <b>Customize Your Token Alerts</b>\n\n"
+    "Make your alerts stand out with custom branding:\n\n"
+    "• 🖼️ <b>Token Logo</b> - Add your project's logo\n"
+    "• 🔗 <b>Website Link</b> - Drive traffic to your site\n"
+    "• 💬 <b>Telegram Group</b> - Grow your community\n"
+    "• 🐦 <b>Twitter</b> - Connect social media\n"
+    "• 😎 <b>Custom Emojis</b> - Add personality\n\n"
+    "Use <code>/customize</code> followed by your token address to begin."
+)
+
+# Per-network (emoji, test-alert callback prefix); any other network is treated like BNB
+_NET_META = {
+    "ethereum": ("🟣", "test_alert_"),
+    "solana": ("🔵", "test_sol_alert_"),
+    "bnb": ("🟡", "test_bnb_alert_"),
+}
+_OTHER_NET_META = _NET_META["bnb"]
+_NET_EMOJI = {network: meta[0] for network, meta in _NET_META.items()}
+
+# Environment variables don't change while the bot runs, so the dashboard link is fixed
+_REPL_SLUG = os.environ.get('REPL_SLUG', '')
+_REPL_OWNER = os.environ.get('REPL_OWNER', '')
+if _REPL_SLUG and _REPL_OWNER:
+    _DASHBOARD_URL = f"https://{_REPL_SLUG}.{_REPL_OWNER}.repl.co/status"
+else:
+    _DASHBOARD_URL = "http://0.0.0.0:8080/status"
+_DASHBOARD_BUTTON = InlineKeyboardButton("🌐 Open Dashboard", url=_DASHBOARD_URL)
+_DASHBOARD_KEYBOARD = InlineKeyboardMarkup([[_DASHBOARD_BUTTON]])
+_STATUS_MARKUP = InlineKeyboardMarkup([[_DASHBOARD_BUTTON], [_BACK_BUTTON]])
+_STATUS_UNAVAILABLE_TEXT = "✅ <b>Bot Status: Online</b>\n\nDashboard statistics are currently unavailable."
+
+# Status figures change at most about once a second, so presses within that window share one render
+_STATUS_CACHE_TTL_SECONDS = 1.0
+_status_cache = {"ts": 0.0, "text": None, "markup": None}
+
+_VIEW_STATS_TEXT = "📊 <b>Token Statistics</b>\n\nTo view detailed stats about your tracked tokens, use:\n<code>/status</code>"
 
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
-    help_text = (
-        "🚀 <b>Welcome to TickerTrending Bot</b>\n\n"
-        "This bot helps <b>track</b> and <b>boost</b> crypto tokens across Telegram.\n\n"
-        "🧰 <b>Here's what you can do:</b>\n"
-        "• <code>/track</code> – Add ETH token\n"
-        "• <code>/tracksol</code> – Add SOL token\n"
-        "• <code>/untrack</code> – Remove token\n"
-        "• <code>/boost</code> – Promote your token\n"
-        "• <code>/customize</code> – Add token image, links, emojis\n"
-        "• <code>/example_alert</code> – Preview your alert\n"
-        "• <code>/stats</code> – Group analytics\n\n"
-        "🔗 <i>Powered by</i> <a href='https://tickertrending.com'>TickerTrending.com</a>"
-    )
-
+async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Show help information with beautiful UI"""
     await update.message.reply_text(
-        text=help_text,
-        reply_markup=reply_markup,
+        text=_HELP_TEXT,
+        reply_markup=_HELP_MARKUP,
         parse_mode=ParseMode.HTML,
         disable_web_page_preview=True
     )
@@ -127,17 +222,9 @@ async def handle_track_token_callback(update: Update, context: ContextTypes.DEFA
     query = update.callback_query
     await query.answer()
 
-    keyboard = [
-        [
-            InlineKeyboardButton("🟣 Ethereum", callback_data="track_eth"),
-            InlineKeyboardButton("🔵 Solana", callback_data="track_sol")
-        ],
-        [InlineKeyboardButton("🔙 Back", callback_data="help_menu")]
-    ]
-
     await query.edit_message_text(
         text="Select a blockchain to track a token:",
-        reply_markup=InlineKeyboardMarkup(keyboard)
+        reply_markup=_TRACK_TOKEN_MARKUP
     )
 
 async def handle_untrack_token_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -147,7 +234,7 @@ async def handle_untrack_token_callback(update: Update, context: ContextTypes.DE
 
     await query.edit_message_text(
         text="To untrack a token, use the command:\n\n/untrack <token_address>\n\nFor example: /untrack 0x1234...",
-        reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back", callback_data="help_menu")]])
+        reply_markup=_BACK_MARKUP
     )
 
 async def handle_boost_token_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -155,34 +242,9 @@ async def handle_boost_token_callback(update: Update, context: ContextTypes.DEFA
     query = update.callback_query
     await query.answer()
 
-    # Create a rich UI for boosting with all four networks
-    keyboard = [
-        [
-            InlineKeyboardButton("🟣 Ethereum", callback_data="network_eth"),
-            InlineKeyboardButton("🔵 Solana", callback_data="network_sol"),
-        ],
-        [
-            InlineKeyboardButton("🟡 BNB", callback_data="network_bnb"),
-            InlineKeyboardButton("🟢 Base", callback_data="network_base"),
-        ],
-        [
-            InlineKeyboardButton("ℹ️ How Boosting Works", callback_data="how_boost_works"),
-        ],
-        [InlineKeyboardButton("🔙 Back", callback_data="help_menu")]
-    ]
-
-    boost_text = (
-        "🚀 <b>Boost Your Token's Visibility</b>\n\n"
-        "Supercharge your token's reach by boosting it to our partner channels and communities.\n\n"
-        "• <b>Increased Exposure</b> across multiple channels\n"
-        "• <b>Higher Visibility</b> to potential buyers\n"
-        "• <b>Professional Presentation</b> with your branding\n\n"
-        "Select which blockchain your token is on:"
-    )
-
     await query.edit_message_text(
-        text=boost_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        text=_BOOST_TEXT,
+        reply_markup=_BOOST_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -191,21 +253,10 @@ async def handle_customize_alerts_callback(update: Update, context: ContextTypes
     query = update.callback_query
     await query.answer()
 
-    template_text = (
-        "🎨 <b>Customize Your Token Alerts</b>\n\n"
-        "Make your alerts stand out with custom branding:\n\n"
-        "• 🖼️ <b>Token Logo</b> - Add your project's logo\n"
-        "• 🔗 <b>Website Link</b> - Drive traffic to your site\n"
-        "• 💬 <b>Telegram Group</b> - Grow your community\n"
-        "• 🐦 <b>Twitter</b> - Connect social media\n"
-        "• 😎 <b>Custom Emojis</b> - Add personality\n\n"
-        "Use <code>/customize</code> followed by your token address to begin."
-    )
-
     await query.edit_message_text(
-        text=template_text,
+        text=_CUSTOMIZE_TEXT,
         parse_mode=ParseMode.HTML,
-        reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back", callback_data="help_menu")]])
+        reply_markup=_BACK_MARKUP
     )
 
 async def handle_view_stats_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -214,9 +265,9 @@ async def handle_view_stats_callback(update: Update, context: ContextTypes.DEFAU
     await query.answer()
 
     await query.edit_message_text(
-        text="📊 <b>Token Statistics</b>\n\nTo view detailed stats about your tracked tokens, use:\n<code>/status</code>",
+        text=_VIEW_STATS_TEXT,
         parse_mode=ParseMode.HTML,
-        reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back", callback_data="help_menu")]])
+        reply_markup=_BACK_MARKUP
     )
 
 async def handle_test_alert_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -225,17 +276,12 @@ async def handle_test_alert_callback(update: Update, context: ContextTypes.DEFAU
     await query.answer()
 
     # Get tracked tokens for this chat
-    from data_manager import get_data_manager
-    dm = get_data_manager()
-    chat_id = update.effective_chat.id
-    tokens = []
-    if "tracked_tokens" in dm.data:
-        tokens = [t for t in dm.data["tracked_tokens"] if str(t.get("chat_id", "")) == str(chat_id)]
+    tokens = get_data_manager().get_tokens_for_chat(update.effective_chat.id)
 
     if not tokens:
         await query.edit_message_text(
             text="⚠️ You don't have any tracked tokens.\n\nPlease track a token first using /track or /tracksol.",
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back", callback_data="help_menu")]])
+            reply_markup=_BACK_MARKUP
         )
         return
 
@@ -244,24 +290,14 @@ async def handle_test_alert_callback(update: Update, context: ContextTypes.DEFAU
     for token in tokens:
         symbol = token.get("symbol", "???")
         address = token.get("address", "")
-        network = token.get("network", "ethereum")
-
-        if network == "ethereum":
-            callback_data = f"test_alert_{address}"
-            emoji = "🟣"
-        elif network == "solana":
-            callback_data = f"test_sol_alert_{address}"
-            emoji = "🔵"
-        else:
-            callback_data = f"test_bnb_alert_{address}"
-            emoji = "🟡"
+        emoji, prefix = _NET_META.get(token.get("network", "ethereum"), _OTHER_NET_META)
 
         keyboard.append([InlineKeyboardButton(
             f"{emoji} Test {symbol} Alert", 
-            callback_data=callback_data
+            callback_data=prefix + address
         )])
 
-    keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="help_menu")])
+    keyboard.append([_BACK_BUTTON])
 
     await query.edit_message_text(
         text="Select a token to generate a test alert:",
@@ -274,26 +310,20 @@ async def handle_contracts_tracked_callback(update: Update, context: ContextType
     await query.answer()
 
     # Get tracked tokens for this chat
-    from data_manager import get_data_manager
-    dm = get_data_manager()
-    chat_id = update.effective_chat.id
-    tokens = []
-    if "tracked_tokens" in dm.data:
-        tokens = [t for t in dm.data["tracked_tokens"] if str(t.get("chat_id", "")) == str(chat_id)]
+    tokens = get_data_manager().get_tokens_for_chat(update.effective_chat.id)
 
     if not tokens:
         await query.edit_message_text(
             text="You aren't tracking any tokens yet.\n\nUse /track or /tracksol to add tokens.",
-            reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back", callback_data="help_menu")]])
+            reply_markup=_BACK_MARKUP
         )
         return
 
-    # Build message with token list
-    message = "🔍 <b>Your Tracked Tokens:</b>\n\n"
+    # Build message with token list; collect parts and join once
+    parts = ["🔍 <b>Your Tracked Tokens:</b>\n\n"]
 
     for token in tokens:
-        network = token.get('network', 'ethereum')
-        network_emoji = "🟣" if network == "ethereum" else "🔵" if network == "solana" else "🟡"
+        network_emoji = _NET_EMOJI.get(token.get('network', 'ethereum'), _OTHER_NET_META[0])
 
         # Format address for display
         address = token.get('address', '')
@@ -304,19 +334,21 @@ async def handle_contracts_tracked_callback(update: Update, context: ContextType
 
         min_volume = token.get('min_volume_usd', 10.0)
 
-        message += (
+        parts.append(
             f"{network_emoji} <b>{token.get('name', '')}</b> ({token.get('symbol', '')})\n"
             f"    Address: <code>{display_address}</code>\n"
             f"    Min Volume: ${min_volume} USD\n\n"
         )
 
+    message = "".join(parts)
+
     # Add buttons to manage tokens
     keyboard = [
         [
             InlineKeyboardButton("📈 Add Token", callback_data="track_token"),
             InlineKeyboardButton("❌ Remove Token", callback_data="untrack_token")
         ],
-        [InlineKeyboardButton("🔙 Back", callback_data="help_menu")]
+        [_BACK_BUTTON]
     ]
 
     await query.edit_message_text(
@@ -325,54 +357,47 @@ async def handle_contracts_tracked_callback(update: Update, context: ContextType
         reply_markup=InlineKeyboardMarkup(keyboard)
     )
 
-async def handle_bot_status_check(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle bot status check button click"""
-    query = update.callback_query
-    await query.answer()
+def _build_status_message():
+    """Render the bot status text and keyboard from the dashboard stats"""
+    # Fallback if dashboard isn't available
+    if _bot_status is None:
+        return _STATUS_UNAVAILABLE_TEXT, _BACK_MARKUP
 
-    # Get dashboard status
     try:
-        from dashboard import bot_status
-
         uptime = "Unknown"
         try:
-            from datetime import datetime
-            start_time = datetime.fromisoformat(bot_status["start_time"])
+            start_time = datetime.fromisoformat(_bot_status["start_time"])
             uptime_seconds = (datetime.now() - start_time).total_seconds()
             uptime = f"{int(uptime_seconds // 3600)}h {int((uptime_seconds % 3600) // 60)}m"
         except Exception as e:
             logger.error(f"Error calculating uptime: {e}")
 
-        # Get the Replit URL (will work if running on Replit)
-        replit_slug = os.environ.get('REPL_SLUG', '')
-        replit_owner = os.environ.get('REPL_OWNER', '')
-
-        if replit_slug and replit_owner:
-            dashboard_url = f"https://{replit_slug}.{replit_owner}.repl.co/status"
-        else:
-            dashboard_url = "http://0.0.0.0:8080/status"
-
         status_text = (
             f"✅ <b>Bot Status: Online</b>\n"
             f"⏱ Uptime: {uptime}\n"
-            f"📊 Tracked Tokens: {sum(len(contracts) for contracts in bot_status.get('tracked_contracts', {}).values())}\n"
-            f"📨 Alerts Sent: {bot_status.get('alerts_sent', 0)}\n"
-            f"👥 Active Chats: {bot_status.get('telegram_chats', 0)}\n\n"
-            f"<a href='{dashboard_url}'>View Full Dashboard</a>"
+            f"📊 Tracked Tokens: {sum(len(contracts) for contracts in _bot_status.get('tracked_contracts', {}).values())}\n"
+            f"📨 Alerts Sent: {_bot_status.get('alerts_sent', 0)}\n"
+            f"👥 Active Chats: {_bot_status.get('telegram_chats', 0)}\n\n"
+            f"<a href='{_DASHBOARD_URL}'>View Full Dashboard</a>"
         )
+    except Exception:
+        return _STATUS_UNAVAILABLE_TEXT, _BACK_MARKUP
 
-        keyboard = [
-            [InlineKeyboardButton("🌐 Open Dashboard", url=dashboard_url)],
-            [InlineKeyboardButton("🔙 Back", callback_data="help_menu")]
-        ]
-    except:
-        # Fallback if dashboard isn't available
-        status_text = "✅ <b>Bot Status: Online</b>\n\nDashboard statistics are currently unavailable."
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="help_menu")]]
+    return status_text, _STATUS_MARKUP
+
+async def handle_bot_status_check(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle bot status check button click"""
+    query = update.callback_query
+    await query.answer()
+
+    now = time.monotonic()
+    if _status_cache["text"] is None or now - _status_cache["ts"] >= _STATUS_CACHE_TTL_SECONDS:
+        _status_cache["text"], _status_cache["markup"] = _build_status_message()
+        _status_cache["ts"] = now
 
     await query.edit_message_text(
-        text=status_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        text=_status_cache["text"],
+        reply_markup=_status_cache["markup"],
         parse_mode=ParseMode.HTML,
         disable_web_page_preview=True
     )
@@ -383,43 +408,8 @@ async def handle_back_to_help_menu(update: Update, context: ContextTypes.DEFAULT
     await query.answer()
 
     # Create help menu directly instead of calling help_command
-    keyboard = [
-        [
-            InlineKeyboardButton("📈 Track Token", callback_data="track_token"),
-            InlineKeyboardButton("❌ Untrack Token", callback_data="untrack_token")
-        ],
-        [
-            InlineKeyboardButton("🚀 Boost Token", callback_data="boost_token"),
-            InlineKeyboardButton("🎨 Customize Alerts", callback_data="customize_alerts")
-        ],
-        [
-            InlineKeyboardButton("📊 View Stats", callback_data="view_stats"),
-            InlineKeyboardButton("🧪 Test Alert", callback_data="test_alert")
-        ],
-        [
-            InlineKeyboardButton("📋 Tracked Tokens", callback_data="contracts_tracked"),
-            InlineKeyboardButton("📚 Full Guide", url="https://tickertrending.com/guide")
-        ],
-        [
-            InlineKeyboardButton("✅ Bot Status Check", callback_data="bot_status_check")
-        ]
-    ]
-
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
-    help_text = (
-        "🚀 <b>Welcome to TickerTrending Bot</b>\n\n"
-        "This bot helps <b>track</b> and <b>boost</b> crypto tokens across Telegram.\n\n"
-        "🧰 <b>Here's what you can do:</b>\n"
-        "• <code>/track</code> – Add ETH token\n"
-        "• <code>/tracksol</code> – Add SOL token\n"
-        "• <code>/untrack</code> – Remove token\n"
-        "• <code>/boost</code> – Promote your token\n"
-        "• <code>/customize</code> – Add token image, links, emojis\n"
-        "• <code>/example_alert</code> – Preview your alert\n"
-        "• <code>/stats</code> – Group analytics\n\n"
-        "🔗 <i>Powered by</i> <a href='https://tickertrending.com'>TickerTrending.com</a>"
-    )
+    reply_markup = _HELP_MARKUP
+    help_text = _HELP_TEXT
 
     try:
         await query.edit_message_text(
@@ -441,36 +431,43 @@ async def handle_back_to_help_menu(update: Update, context: ContextTypes.DEFAULT
 
 async def dashboard_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show dashboard link"""
-    # Get the Replit URL (will work if running on Replit)
-    replit_slug = os.environ.get('REPL_SLUG', '')
-    replit_owner = os.environ.get('REPL_OWNER', '')
-
-    if replit_slug and replit_owner:
-        dashboard_url = f"https://{replit_slug}.{replit_owner}.repl.co/status"
-    else:
-        dashboard_url = "http://0.0.0.0:8080/status"
-
-    keyboard = [[InlineKeyboardButton("🌐 Open Dashboard", url=dashboard_url)]]
-
     await update.message.reply_html(
         f"📊 <b>Bot Dashboard</b>\n\n"
         f"Access the dashboard to view bot statistics, tracked tokens, and more.\n\n"
-        f"<a href='{dashboard_url}'>Click here to open the dashboard</a>",
-        reply_markup=InlineKeyboardMarkup(keyboard)
+        f"<a href='{_DASHBOARD_URL}'>Click here to open the dashboard</a>",
+        reply_markup=_DASHBOARD_KEYBOARD,
+        disable_web_page_preview=True
     )
 
+# Exact callback_data -> handler; one dict lookup replaces a regex match per handler
+_HELP_CALLBACKS = {
+    "track_token": handle_track_token_callback,
+    "untrack_token": handle_untrack_token_callback,
+    "boost_token": handle_boost_token_callback,
+    "customize_alerts": handle_customize_alerts_callback,
+    "view_stats": handle_view_stats_callback,
+    "test_alert": handle_test_alert_callback,
+    "contracts_tracked": handle_contracts_tracked_callback,
+    "bot_status_check": handle_bot_status_check,
+    "help_menu": handle_back_to_help_menu,
+}
+
+async def _dispatch_help_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Route a help-menu button press to its handler"""
+    await _HELP_CALLBACKS[update.callback_query.data](update, context)
+
+_HELP_HANDLERS = None
+
 def get_help_handlers():
     """Return all help-related command and callback handlers"""
-    return [
-        CommandHandler("help", help_command),
-        CommandHandler("dashboard", dashboard_command),
-        CallbackQueryHandler(handle_track_token_callback, pattern="^track_token$"),
-        CallbackQueryHandler(handle_untrack_token_callback, pattern="^untrack_token$"),
-        CallbackQueryHandler(handle_boost_token_callback, pattern="^boost_token$"),
-        CallbackQueryHandler(handle_customize_alerts_callback, pattern="^customize_alerts$"),
-        CallbackQueryHandler(handle_view_stats_callback, pattern="^view_stats$"),
-        CallbackQueryHandler(handle_test_alert_callback, pattern="^test_alert$"),
-        CallbackQueryHandler(handle_contracts_tracked_callback, pattern="^contracts_tracked$"),
-        CallbackQueryHandler(handle_bot_status_check, pattern="^bot_status_check$"),
-        CallbackQueryHandler(handle_back_to_help_menu, pattern="^help_menu$"),
-    ]
\ No newline at end of file
+    # Handlers are created once and reused
+    global _HELP_HANDLERS
+    if _HELP_HANDLERS is None:
+        # The callback runs with block=False so one slow edit doesn't hold up other users' button presses.
+        # Its pattern only matches help-menu data, leaving other callbacks to later handlers
+        _HELP_HANDLERS = [
+            CommandHandler("help", help_command),
+            CommandHandler("dashboard", dashboard_command),
+            CallbackQueryHandler(_dispatch_help_callback, pattern=_HELP_CALLBACKS.__contains__, block=False),
+        ]
+    return _HELP_HANDLERS
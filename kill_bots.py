@@ -2,33 +2,21 @@
 #!/usr/bin/env python3
 import os
 import signal
-import subprocess
 import sys
+from kill_duplicates import kill_python_bots
 
 print("✅ Running kill_bots.py to ensure clean start")
 
-# Get all Python processes
+# Kill Python processes running main.py or start_bot.py
 try:
-    output = subprocess.check_output(["ps", "aux"]).decode()
-    lines = output.strip().split('\n')
-    
-    # Find PIDs of Python processes running main.py or start_bot.py
-    for line in lines:
-        if "python" in line and ("main.py" in line or "start_bot.py" in line):
-            # Extract PID (second column in ps aux output)
-            parts = line.split()
-            if len(parts) >= 2:
-                try:
-                    pid = int(parts[1])
-                    print(f"Killing process {pid}: {line.strip()}")
-                    os.kill(pid, signal.SIGKILL)
-                except (ValueError, ProcessLookupError) as e:
-                    print(f"Error killing process: {e}")
+    kill_python_bots(exclude_pid=os.getpid(), sig=signal.SIGKILL)
     
     # Also remove any lock files
-    if os.path.exists("app.lock"):
-        os.remove("app.lock")
+    try:
+        os.unlink("app.lock")
         print("Removed app.lock file")
+    except FileNotFoundError:
+        pass
         
     print("✅ All bot processes cleaned up")
     
@@ -1,44 +1,64 @@
 
 #!/usr/bin/env python3
 import os
-import subprocess
+import signal
 import sys
 import time
 
+try:
+    import psutil
+except ImportError:
+    # Fall back to reading /proc directly when psutil isn't installed
+    psutil = None
+
+def _iter_process_cmdlines():
+    """Yield (pid, cmdline) for every running process"""
+    if psutil is not None:
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            yield proc.info['pid'], " ".join(proc.info['cmdline'] or [])
+        return
+
+    for pid_str in os.listdir('/proc'):
+        if not pid_str.isdigit():
+            continue
+        try:
+            with open(f'/proc/{pid_str}/cmdline', 'rb') as f:
+                cmd = f.read().replace(b'\x00', b' ')
+        except OSError:
+            # Process exited or isn't readable
+            continue
+        yield int(pid_str), cmd.decode(errors='replace')
+
+def kill_python_bots(exclude_pid=None, sig=signal.SIGKILL):
+    """Send sig to every Python process running main.py or start_bot.py, returning how many were signalled"""
+    killed_count = 0
+    for pid, cmd in _iter_process_cmdlines():
+        if pid == exclude_pid:
+            continue
+        if "python" in cmd and ("main.py" in cmd or "start_bot.py" in cmd):
+            try:
+                print(f"Killing process {pid}: {cmd.strip()}")
+                os.kill(pid, sig)
+                killed_count += 1
+            except ProcessLookupError as e:
+                print(f"Error with process: {e}")
+    return killed_count
+
 def kill_telegram_bot_instances():
     """Kill all running Telegram bot instances"""
     print("🔍 Finding and killing duplicate Telegram bot instances...")
     
-    # Record current PID to avoid killing this script
-    current_pid = os.getpid()
-    killed_count = 0
-    
     try:
-        # Get all running Python processes
-        result = subprocess.run(["ps", "aux"], capture_output=True, text=True)
-        lines = result.stdout.strip().split('\n')
-        
-        # Find PIDs of bot-related processes
-        for line in lines:
-            if "python" in line and ("main.py" in line or "start_bot.py" in line):
-                # Extract PID (second column in ps aux output)
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        pid = int(parts[1])
-                        # Skip current process
-                        if pid != current_pid:
-                            print(f"Killing process {pid}: {line.strip()}")
-                            os.kill(pid, 9)  # SIGKILL
-                            killed_count += 1
-                    except (ValueError, ProcessLookupError) as e:
-                        print(f"Error with process: {e}")
+        # Skip the current PID to avoid killing this script
+        killed_count = kill_python_bots(exclude_pid=os.getpid())
         
         # Also remove any lock files
-        for lockfile in ["bot.lock", "app.lock", "bot.pid"]:
-            if os.path.exists(lockfile):
-                os.remove(lockfile)
+        for lockfile in ("bot.lock", "app.lock", "bot.pid"):
+            try:
+                os.unlink(lockfile)
                 print(f"Removed {lockfile} file")
+            except FileNotFoundError:
+                pass
                 
         print(f"✅ Successfully killed {killed_count} duplicate processes")
         
@@ -2,15 +2,27 @@ import asyncio
 import logging
 import os
 import nest_asyncio
-from telegram.ext import ApplicationBuilder, CommandHandler
+from telegram.ext import ApplicationBuilder, CommandHandler, AIORateLimiter
 from telegram import Update
 from telegram.ext import ContextTypes
 from config import TELEGRAM_BOT_TOKEN
-from eth_monitor import get_instance as get_eth_monitor, start_monitoring as start_eth_monitor
+from eth_monitor import get_instance as get_eth_monitor
 from solana_monitor import SolanaMonitor
 
-# Patch Replit loop issues
-nest_asyncio.apply()
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (and unavailable on Windows); fall back to the stock asyncio loop
+    uvloop = None
+
+# nest_asyncio is only needed when main() is driven from an already-running loop (Replit's
+# REPL). Everywhere else it just slows every call_soon/create_task, so it's applied only on
+# Replit (detected via REPL_ID) or when USE_NEST_ASYNCIO is set. It can't patch uvloop, so
+# those environments stay on the stock loop; production deployments should leave REPL_ID unset.
+RUNNING_IN_REPLIT = bool(os.environ.get("REPL_ID"))
+USE_NEST_ASYNCIO = RUNNING_IN_REPLIT or bool(os.environ.get("USE_NEST_ASYNCIO"))
+if USE_NEST_ASYNCIO:
+    nest_asyncio.apply()
 
 # Logging
 logging.basicConfig(level=logging.INFO)
@@ -19,6 +31,31 @@ logger = logging.getLogger(__name__)
 # Globals
 sol_monitor = None
 
+def _log_task_exception(task: asyncio.Task):
+    """Done-callback for background tasks outside the TaskGroup so their crashes get logged"""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"❌ Background task {task.get_name()} crashed: {task.exception()}", exc_info=task.exception())
+
+def _safe_register(application, handlers):
+    """Add each handler, logging (not raising) on a bad one so the rest still register"""
+    for handler in handlers:
+        try:
+            application.add_handler(handler)
+        except Exception as e:
+            logger.error(f"Failed to register handler {handler!r}: {e}")
+
+async def _run_polling(application):
+    """Poll Telegram until cancelled"""
+    # Drive PTB's async lifecycle directly; run_polling() would re-enter the running loop
+    async with application:
+        await application.start()
+        await application.updater.start_polling()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await application.updater.stop()
+            await application.stop()
+
 async def test_alert_command(update: Update, context: ContextTypes.DEFAULT_TYPE, force_eth=False):
     """Generate example alerts for tracked tokens to test notifications"""
     chat_id = update.effective_chat.id
@@ -49,39 +86,37 @@ async def register_chat_command(update: Update, context: ContextTypes.DEFAULT_TY
         logger.error(f"Error registering chat: {e}")
         await update.message.reply_text("❌ Error registering chat. Please try again later.")
 
-async def register_chat_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Register a chat for alerts"""
-    chat_id = update.effective_chat.id
-
-    # Add to active chats
-    try:
-        from data_manager import register_chat
-        success = register_chat(chat_id)
-        if success:
-            await update.message.reply_text("✅ This chat has been registered for alerts!")
-        else:
-            await update.message.reply_text("ℹ️ This chat was already registered.")
-    except Exception as e:
-        logger.error(f"Error registering chat: {e}")
-        await update.message.reply_text("❌ Error registering chat. Please try again later.")
-
 async def main():
     global sol_monitor
 
     logger.info("🔧 Building bot application...")
-    application = ApplicationBuilder().token(TELEGRAM_BOT_TOKEN).build()
+    builder = ApplicationBuilder().token(TELEGRAM_BOT_TOKEN)
+    # Keep outgoing calls within Telegram's global ~30 msg/s limit (needs the rate-limiter extra)
+    try:
+        builder = builder.rate_limiter(AIORateLimiter(overall_max_rate=30, overall_time_period=1))
+    except RuntimeError as e:
+        logger.warning(f"⚠️ Telegram rate limiter unavailable: {e}")
+    application = builder.build()
 
-    # Register error handler
+    # Import all handler modules once, up front (deferred to main() to avoid circular imports)
     from error_handler import register_error_handler
-    register_error_handler(application)
-
-    # === Register Commands ===
     from track_handler import get_track_handlers
     from conversation_handler import handle_track_command
+    from utils import handle_status_command, handle_example_alert
+    from start_handler import get_start_handlers
+    from help_handler import get_help_handlers, get_help_callback_handlers
+    from callback_manager import register_all_callbacks
+    from button_handler import register_button_handlers, get_button_handlers
+    from data_debug import get_data_debug_handlers
+    from quick_track import register_handlers as register_eth_handlers
+    from quick_track_sol import register_handlers as register_sol_handlers
 
+    # Register error handler
+    register_error_handler(application)
+
+    # === Register Commands ===
     # Register track handlers
-    for handler in get_track_handlers():
-        application.add_handler(handler)
+    _safe_register(application, get_track_handlers())
 
     application.add_handler(CommandHandler("track", handle_track_command))
 
@@ -90,34 +125,22 @@ async def main():
     application.add_handler(CommandHandler("test_eth", lambda u, c: test_alert_command(u, c, force_eth=True)))
     application.add_handler(CommandHandler("register_chat", register_chat_command))
 
-    from utils import handle_status_command, handle_example_alert
     application.add_handler(CommandHandler("status", handle_status_command))
     application.add_handler(CommandHandler("example_alert", handle_example_alert))
 
-    # Import all UI handlers
-    from boost_handler import register_boost_handlers
-    from boost_menu import get_boost_handlers
-    from callback_manager import register_all_callbacks
-    from button_handler import register_button_handlers
-    from help_handler import get_help_handlers
-
     # Register start command with premium UI
     logger.info("🚀 Registering premium start UI handlers...")
-    from start_handler import get_start_handlers
-    for handler in get_start_handlers():
-        application.add_handler(handler)
+    _safe_register(application, get_start_handlers())
     
     # Register help command handlers with interactive UI
     logger.info("🎮 Registering help UI handlers...")
-    for handler in get_help_handlers():
-        application.add_handler(handler)
+    _safe_register(application, get_help_handlers())
 
     # Register boost menu with rich UI
     try:
         logger.info("🚀 Loading boost menu handlers...")
         from boost_menu import get_boost_handlers
-        for handler in get_boost_handlers():
-            application.add_handler(handler)
+        _safe_register(application, get_boost_handlers())
 
         # Register boost token command handlers
         from boost_handler import register_boost_handlers
@@ -128,12 +151,9 @@ async def main():
 
     # Register all callback and button handlers
     logger.info("🔄 Registering callback handlers...")
-    from callback_manager import register_all_callbacks
-    from help_handler import get_help_callback_handlers
 
     # First register all specialized callbacks
-    for handler in get_help_callback_handlers():
-        application.add_handler(handler)
+    _safe_register(application, get_help_callback_handlers())
 
     # Then register the main callback system
     register_all_callbacks(application)
@@ -144,38 +164,13 @@ async def main():
     except Exception as e:
         logger.warning(f"Button handlers registration issue (non-critical): {e}")
         logger.info("Attempting to recover button functionality...")
-        from button_handler import get_button_handlers
-        for handler in get_button_handlers():
-            try:
-                application.add_handler(handler)
-            except Exception as inner_e:
-                logger.error(f"Failed to register button handler: {inner_e}")
+        _safe_register(application, get_button_handlers())
 
-    from data_debug import get_data_debug_handlers
-    for handler in get_data_debug_handlers():
-        application.add_handler(handler)
+    _safe_register(application, get_data_debug_handlers())
 
-    from quick_track import register_handlers as register_eth_handlers
-    from quick_track_sol import register_handlers as register_sol_handlers
     register_eth_handlers(application)
     register_sol_handlers(application)
 
-    # === Monitoring ===
-    try:
-        logger.info("🔄 Starting Ethereum monitoring...")
-        eth_task = asyncio.create_task(start_eth_monitor(application.bot))
-        eth_mon = get_eth_monitor(application.bot)
-        logger.info(f"✅ ETH monitor started, tracking {len(eth_mon.tracked_contracts)} tokens")
-    except Exception as e:
-        logger.error(f"❌ ETH monitor failed: {e}", exc_info=True)
-
-    try:
-        logger.info("🔄 Starting Solana monitoring...")
-        sol_monitor = SolanaMonitor(application.bot)
-        asyncio.create_task(sol_monitor.start())
-    except Exception as e:
-        logger.warning(f"⚠️ Solana monitor issue: {e}")
-
     # === Dashboard ===
     try:
         from dashboard import start_dashboard_server
@@ -196,8 +191,28 @@ async def main():
             logger.error("🔄 Try restarting the bot after updating the token.")
             return
 
-    logger.info("🚀 Bot is starting polling...")
-    await application.run_polling(close_loop=False)
+    # === Monitoring + Polling ===
+    # Monitors and the poller share one TaskGroup: if any of them crashes the others are
+    # cancelled and the error surfaces here instead of leaving a dead monitor behind
+    async with asyncio.TaskGroup() as tg:
+        try:
+            logger.info("🔄 Starting Ethereum monitoring...")
+            eth_mon = get_eth_monitor(application.bot)
+            eth_mon.start_alert_worker().add_done_callback(_log_task_exception)
+            tg.create_task(eth_mon.monitor_swaps(), name="eth_monitor")
+            logger.info(f"✅ ETH monitor started, tracking {len(eth_mon.tracked_contracts)} tokens")
+        except Exception as e:
+            logger.error(f"❌ ETH monitor failed: {e}", exc_info=True)
+
+        try:
+            logger.info("🔄 Starting Solana monitoring...")
+            sol_monitor = SolanaMonitor(application.bot)
+            tg.create_task(sol_monitor.start(), name="sol_monitor")
+        except Exception as e:
+            logger.warning(f"⚠️ Solana monitor issue: {e}")
+
+        logger.info("🚀 Bot is starting polling...")
+        tg.create_task(_run_polling(application), name="polling")
 
 
 if __name__ == "__main__":
@@ -206,11 +221,15 @@ if __name__ == "__main__":
     print(f"📊 Dashboard URL: https://{os.environ.get('REPL_SLUG', 'workspace')}.{os.environ.get('REPL_OWNER', 'arasbaker99')}.repl.co/status")
 
     try:
-        asyncio.run(main())
+        if uvloop is not None and not USE_NEST_ASYNCIO:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except RuntimeError as e:
-        if "already running" in str(e):
+        if USE_NEST_ASYNCIO and "already running" in str(e):
             logger.info("Using existing event loop...")
             loop = asyncio.get_event_loop()
+            nest_asyncio.apply(loop)
             loop.run_until_complete(main())
         else:
             logger.error(f"Startup Error: {e}", exc_info=True)
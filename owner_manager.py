@@ -1,37 +1,104 @@
+import asyncio
 import json
 import logging
 import os
 from pathlib import Path
 from telegram import Update
 from telegram.ext import ContextTypes
-from datetime import datetime
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson isn't installed
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    # Without msgspec admins.json is parsed with json.loads and checked by hand
+    msgspec = None
+
+# Set up logging (handlers are configured once, by the entry point)
 logger = logging.getLogger(__name__)
 
 # Constants
 OWNER_ID_FILE = Path("owner_id.txt")
 ADMINS_FILE = Path("admins.json")
 
-def get_owner_id() -> int:
-    """Get the owner's Telegram ID from file"""
+# Parsed file contents, keyed on the file's mtime so edits on disk are still picked up
+_owner_cache = None
+_owner_mtime = None
+_admins_cache = None
+_admins_mtime = None
+# _owner_mtime value recorded while owner_id.txt doesn't exist, so "no owner" is cached too
+_OWNER_MISSING = object()
+# Lookup sets mirroring _admins_cache; the JSON keeps the original username casing
+_admin_ids = set()
+_usernames_lower = set()
+# Owner + admin IDs; reset to None whenever either cache above changes
+_authorized_cache = None
+
+def _file_mtime(path: Path):
+    """Return the file's mtime in nanoseconds, or None if it doesn't exist"""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def _owner_stamp():
+    """owner_id.txt's mtime, or _OWNER_MISSING when the file doesn't exist"""
+    mtime = _file_mtime(OWNER_ID_FILE)
+    return _OWNER_MISSING if mtime is None else mtime
+
+def _read_owner_id() -> int:
+    """Read the owner's Telegram ID from file"""
     try:
-        if OWNER_ID_FILE.exists():
-            owner_id = OWNER_ID_FILE.read_text().strip()
-            if owner_id and owner_id.isdigit():
-                return int(owner_id)
+        # bytes.isdigit()/int(bytes) skip the UTF-8 decode for this integer-only file
+        owner_id = OWNER_ID_FILE.read_bytes().strip()
+        if owner_id.isdigit():
+            return int(owner_id)
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        logger.error(f"Error reading owner ID: {e}")
+        logger.error("Error reading owner ID: %s", e)
     return None
 
+def get_owner_id() -> int:
+    """Get the owner's Telegram ID, re-reading the file only when it changed"""
+    global _owner_cache, _owner_mtime, _authorized_cache
+    try:
+        stamp = _owner_stamp()
+    except OSError as e:
+        logger.error("Error reading owner ID: %s", e)
+        return None
+    if _owner_mtime != stamp:
+        # A removed file clears the cached owner so is_owner() can't match a stale ID
+        _owner_cache = None if stamp is _OWNER_MISSING else _read_owner_id()
+        _owner_mtime = stamp
+        _authorized_cache = None
+    return _owner_cache
+
+async def get_owner_id_async() -> int:
+    """get_owner_id() for async callers; a changed file is re-read in a worker thread"""
+    try:
+        if _owner_mtime is not None and _owner_mtime == _owner_stamp():
+            return _owner_cache
+    except OSError:
+        pass
+    return await asyncio.to_thread(get_owner_id)
+
 def set_owner_id(user_id: int) -> bool:
     """Set the owner's Telegram ID"""
+    global _owner_cache, _owner_mtime, _authorized_cache
     try:
         OWNER_ID_FILE.write_text(str(user_id))
+        _owner_cache = int(user_id)
+        _owner_mtime = _owner_stamp()
+        _authorized_cache = None
         return True
     except Exception as e:
-        logger.error(f"Error setting owner ID: {e}")
+        _owner_mtime = None
+        logger.error("Error setting owner ID: %s", e)
         return False
 
 def ensure_owner(user_id: int) -> bool:
@@ -39,26 +106,60 @@ def ensure_owner(user_id: int) -> bool:
     if not get_owner_id():
         success = set_owner_id(user_id)
         if success:
-            logger.info(f"🔐 Owner auto-assigned to {user_id}")
+            logger.info("🔐 Owner auto-assigned to %s", user_id)
         return success
     return False
 
 def is_owner(user_id: int) -> bool:
-    """Check if a user is the bot owner"""
-    owner_id = get_owner_id()
-    return owner_id is not None and user_id == owner_id
-
-def load_admins() -> dict:
-    """Load admin list from file"""
+    """Check if a user is the bot owner; one stat plus an int compare while the file is unchanged"""
+    if _owner_mtime is None or _owner_mtime != _owner_stamp():
+        get_owner_id()
+    return _owner_cache is not None and user_id == _owner_cache
+
+def _atomic_write_json(path: Path, obj):
+    """Write obj as indented JSON via a fsynced temp file and rename, so readers never see a partial file"""
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(obj, indent=2).encode()
+
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+if msgspec is not None:
+    class Admins(msgspec.Struct):
+        """Typed schema of admins.json, validated while decoding"""
+        user_ids: list[int] = []
+        usernames: list[str] = []
+
+def _read_admins() -> dict:
+    """Read and normalize the admin list from file"""
     if not ADMINS_FILE.exists():
         # Create default empty admin list
         return {"user_ids": [], "usernames": []}
 
     try:
-        content = ADMINS_FILE.read_text()
+        content = ADMINS_FILE.read_bytes()
         if not content.strip():
             return {"user_ids": [], "usernames": []}
 
+        if msgspec is not None:
+            try:
+                admins = msgspec.json.decode(content, type=Admins)
+                return {"user_ids": admins.user_ids, "usernames": admins.usernames}
+            except msgspec.ValidationError:
+                # Legacy list or loosely-typed file; fall through to the lenient parser
+                pass
+            except msgspec.DecodeError:
+                logger.error("Admin file contains invalid JSON, resetting to defaults")
+                return {"user_ids": [], "usernames": []}
+
         data = json.loads(content)
 
         # Handle legacy format (simple list of ids)
@@ -82,35 +183,86 @@ def load_admins() -> dict:
         logger.error("Admin file contains invalid JSON, resetting to defaults")
         return {"user_ids": [], "usernames": []}
     except Exception as e:
-        logger.error(f"Error loading admins: {e}")
+        logger.error("Error loading admins: %s", e)
         return {"user_ids": [], "usernames": []}
 
+def _index_admins(admins: dict):
+    """Rebuild the admin lookup sets from an admin dict"""
+    global _admin_ids, _usernames_lower, _authorized_cache
+    _admin_ids = set(admins.get("user_ids", []))
+    _usernames_lower = {un.lower() for un in admins.get("usernames", [])}
+    _authorized_cache = None
+
+def load_admins() -> dict:
+    """Load admin list, re-reading the file only when it changed on disk.
+
+    The returned dict is shared; callers that modify it must save it with save_admins().
+    """
+    global _admins_cache, _admins_mtime
+    try:
+        mtime = _file_mtime(ADMINS_FILE)
+    except OSError as e:
+        logger.error("Error loading admins: %s", e)
+        return {"user_ids": [], "usernames": []}
+    if _admins_cache is None or _admins_mtime != mtime:
+        _admins_cache = _read_admins()
+        _admins_mtime = mtime
+        _index_admins(_admins_cache)
+    return _admins_cache
+
+async def load_admins_async() -> dict:
+    """load_admins() for async callers; a changed file is re-read in a worker thread"""
+    try:
+        if _admins_cache is not None and _admins_mtime == _file_mtime(ADMINS_FILE):
+            return _admins_cache
+    except OSError:
+        pass
+    return await asyncio.to_thread(load_admins)
+
 def save_admins(admins: dict) -> bool:
     """Save admin list to file"""
+    global _admins_cache, _admins_mtime
     try:
-        ADMINS_FILE.write_text(json.dumps(admins, indent=2))
+        _atomic_write_json(ADMINS_FILE, admins)
+        _admins_cache = admins
+        _admins_mtime = _file_mtime(ADMINS_FILE)
+        _index_admins(admins)
         return True
     except Exception as e:
-        logger.error(f"Error saving admins: {e}")
+        # Drop the cache so an unsaved in-memory change isn't served as if persisted
+        _admins_cache = None
+        logger.error("Error saving admins: %s", e)
         return False
 
 def is_admin(user_id: int, username: str = None) -> bool:
     """Check if a user is an admin by ID or username"""
-    admins = load_admins()
+    load_admins()
 
-    # Check by user ID first (more reliable)
-    if user_id in admins.get("user_ids", []):
-        return True
-
-    # If username provided, check that too (case insensitive)
-    if username:
-        return any(un.lower() == username.lower() for un in admins.get("usernames", []))
-
-    return False
+    # Check by user ID first (more reliable), then username (case insensitive)
+    return user_id in _admin_ids or bool(username and username.lower() in _usernames_lower)
     
+def _authorized_ids() -> frozenset:
+    """Owner + admin IDs as one frozenset, rebuilt only after either file changes"""
+    global _authorized_cache
+    owner_id = get_owner_id()
+    load_admins()
+    if _authorized_cache is None:
+        ids = set(_admin_ids)
+        if owner_id is not None:
+            ids.add(owner_id)
+        _authorized_cache = frozenset(ids)
+    return _authorized_cache
+
 def is_authorized(user_id: int, username: str = None) -> bool:
     """Check if a user is authorized (owner or admin)"""
-    return is_owner(user_id) or is_admin(user_id, username)
+    return user_id in _authorized_ids() or bool(username and username.lower() in _usernames_lower)
+
+async def is_authorized_async(user_id: int, username: str = None) -> bool:
+    """is_authorized() for async callers; changed files are re-read in a worker thread"""
+    owner_id = await get_owner_id_async()
+    await load_admins_async()
+    return ((owner_id is not None and user_id == owner_id) or user_id in _admin_ids
+            or bool(username and username.lower() in _usernames_lower))
 
 def add_admin(user_id: int = None, username: str = None, notify: bool = True) -> bool:
     """Add a user to admin list by ID, username, or both"""
@@ -120,13 +272,12 @@ def add_admin(user_id: int = None, username: str = None, notify: bool = True) ->
 
     admins = load_admins()
     changed = False
-    timestamp = datetime.now().isoformat()
 
-    if user_id is not None and user_id not in admins["user_ids"]:
+    if user_id is not None and user_id not in _admin_ids:
         admins["user_ids"].append(user_id)
         changed = True
 
-    if username and username.lower() not in [un.lower() for un in admins["usernames"]]:
+    if username and username.lower() not in _usernames_lower:
         admins["usernames"].append(username)
         changed = True
 
@@ -147,16 +298,15 @@ def remove_admin(user_id: int = None, username: str = None, notify: bool = True)
     admins = load_admins()
     changed = False
 
-    if user_id is not None and user_id in admins["user_ids"]:
+    if user_id is not None and user_id in _admin_ids:
         admins["user_ids"].remove(user_id)
         changed = True
 
     if username:
         # Case insensitive removal
         lower_username = username.lower()
-        original_usernames = admins["usernames"].copy()
-        admins["usernames"] = [un for un in admins["usernames"] if un.lower() != lower_username]
-        if len(original_usernames) != len(admins["usernames"]):
+        if lower_username in _usernames_lower:
+            admins["usernames"] = [un for un in admins["usernames"] if un.lower() != lower_username]
             changed = True
 
     if changed:
@@ -171,11 +321,12 @@ def reset_admins() -> bool:
     """Reset all admins (for emergency use)"""
     try:
         empty_admins = {"user_ids": [], "usernames": []}
-        ADMINS_FILE.write_text(json.dumps(empty_admins, indent=2))
+        if not save_admins(empty_admins):
+            return False
         logger.warning("⚠️ Admin list has been reset!")
         return True
     except Exception as e:
-        logger.error(f"Error resetting admins: {e}")
+        logger.error("Error resetting admins: %s", e)
         return False
 
 def get_admin_usernames() -> list:
@@ -198,7 +349,7 @@ def notify_admin_change(added: bool, user_id: int = None, username: str = None):
         user_info.append(f"username: @{username}")
 
     user_str = ", ".join(user_info)
-    logger.info(f"Admin {action}: {user_str}")
+    logger.info("Admin %s: %s", action, user_str)
 
 def count_admins() -> int:
     """Count the number of unique admins (combining IDs and usernames)"""
@@ -207,25 +358,14 @@ def count_admins() -> int:
 
 def get_all_authorized() -> list:
     """Get list of all authorized users (owner + admins)"""
-    authorized = set()
-
-    # Add owner
-    owner_id = get_owner_id()
-    if owner_id:
-        authorized.add(owner_id)
-
-    # Add admins
-    admins = load_admins()
-    for admin_id in admins.get("user_ids", []):
-        authorized.add(admin_id)
-
-    return list(authorized)
+    return list(_authorized_ids())
 
 def strictly_owner(func):
     """Decorator to restrict command access to only the owner"""
     async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
         user_id = update.effective_user.id
-        if not is_owner(user_id):
+        owner_id = await get_owner_id_async()
+        if owner_id is None or user_id != owner_id:
             await update.message.reply_text("❌ This command can only be used by the bot owner.")
             return
         return await func(update, context, *args, **kwargs)
@@ -235,10 +375,8 @@ def admin_only(func):
     """Decorator to restrict command access to admins and owner"""
     async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
         user = update.effective_user
-        user_id = user.id
-        username = user.username
-
-        if is_owner(user_id) or is_admin(user_id, username):
+        # Refreshes the caches off the event loop, then checks membership in memory
+        if await is_authorized_async(user.id, user.username):
             return await func(update, context, *args, **kwargs)
 
         await update.message.reply_text("❌ This command requires admin privileges.")
@@ -1,19 +1,27 @@
 
+import asyncio
+import functools
 import logging
 import time
 import os
-import requests
+import httpx
 from typing import Tuple, Dict, Any, Optional
-from web3 import Web3
+from web3 import AsyncWeb3, AsyncHTTPProvider
 from dotenv import load_dotenv
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging (handlers are configured once, by the entry point)
 logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
 
+# Backoff between Solana verification attempts while a tx isn't indexed yet (seconds)
+_SOL_RETRY_BASE_DELAY = 0.5
+_SOL_RETRY_MAX_DELAY = 8
+
+# While the ETH RPC is marked down, re-probe it at most this often (seconds)
+_ETH_RECONNECT_PROBE_INTERVAL = 30
+
 class PaymentHandler:
     """Handles payment verification for Ethereum and Solana networks"""
     
@@ -22,19 +30,46 @@ class PaymentHandler:
         self.infura_url = os.getenv("INFURA_URL", "https://mainnet.infura.io/v3/your-infura-key")
         self.w3 = None
         try:
-            self.w3 = Web3(Web3.HTTPProvider(self.infura_url))
-            if self.w3.is_connected():
-                logger.info("Connected to Ethereum network")
-            else:
-                logger.warning("Failed to connect to Ethereum network")
+            # Async provider so RPC round-trips don't block the bot's event loop
+            self.w3 = AsyncWeb3(AsyncHTTPProvider(self.infura_url))
         except Exception as e:
-            logger.error(f"Error connecting to Ethereum network: {e}")
+            logger.error("Error connecting to Ethereum network: %s", e)
+        # Assume the provider is up until an RPC call says otherwise; avoids an
+        # is_connected() round-trip on every verification
+        self._connected = self.w3 is not None
+        self._last_probe = 0.0
         
         # Solana API endpoints
         self.solana_api = "https://api.mainnet-beta.solana.com"
         self.solscan_api = "https://api.solscan.io/transaction"
+
+        # One shared async client so Solscan/RPC calls reuse pooled keep-alive connections
+        # (no TCP+TLS handshake per verification); connect failures are retried twice
+        self._client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30),
+            transport=httpx.AsyncHTTPTransport(retries=2)
+        )
+
+        # In-flight wait_for_solana_confirmation polls, keyed by (tx hash, expected amount, target
+        # address): the verdict depends on all three, so only identical requests share a poll
+        self._sol_waits = {}
+        
+    async def _eth_available(self) -> bool:
+        """Return the cached ETH connection state, re-probing periodically while it is down"""
+        if self._connected or not self.w3:
+            return self._connected
+        now = time.monotonic()
+        if now - self._last_probe >= _ETH_RECONNECT_PROBE_INTERVAL:
+            self._last_probe = now
+            try:
+                self._connected = await self.w3.is_connected()
+            except Exception as e:
+                logger.error("Ethereum connection probe failed: %s", e)
+                self._connected = False
+        return self._connected
         
-    def verify_eth_transaction(self, tx_hash: str, expected_amount: float, target_address: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    async def verify_eth_transaction(self, tx_hash: str, expected_amount: float, target_address: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """
         Verify an Ethereum transaction
         
@@ -46,7 +81,7 @@ class PaymentHandler:
         Returns:
             Tuple of (success, message, transaction_data)
         """
-        if not self.w3 or not self.w3.is_connected():
+        if not await self._eth_available():
             return False, "Ethereum connection not available", None
         
         try:
@@ -56,13 +91,16 @@ class PaymentHandler:
                 
             target_address = target_address.lower()
             
-            # Get transaction details
-            tx = self.w3.eth.get_transaction(tx_hash)
+            # Fetch the transaction, its receipt and the head block concurrently (one round-trip of latency)
+            tx, receipt, current_block = await asyncio.gather(
+                self.w3.eth.get_transaction(tx_hash),
+                self.w3.eth.get_transaction_receipt(tx_hash),
+                self.w3.eth.block_number
+            )
             if not tx:
                 return False, "Transaction not found", None
                 
-            # Get transaction receipt to check status
-            receipt = self.w3.eth.get_transaction_receipt(tx_hash)
+            # Check the receipt for status
             if not receipt:
                 return False, "Transaction receipt not found", None
                 
@@ -86,7 +124,6 @@ class PaymentHandler:
                 return False, f"Transaction amount too low: {amount_eth} ETH < {expected_amount} ETH", tx
                 
             # Check if transaction is confirmed
-            current_block = self.w3.eth.block_number
             conf_blocks = current_block - receipt.blockNumber
             
             if conf_blocks < 1:
@@ -94,11 +131,16 @@ class PaymentHandler:
                 
             return True, "Transaction verified successfully", tx
             
+        except (OSError, asyncio.TimeoutError) as e:
+            # Network-level failure: mark the provider down until the next probe succeeds
+            self._connected = False
+            logger.error("Ethereum RPC connection error: %s", e)
+            return False, "Ethereum connection not available", None
         except Exception as e:
-            logger.error(f"Error verifying ETH transaction: {e}")
+            logger.error("Error verifying ETH transaction: %s", e)
             return False, f"Error verifying transaction: {str(e)}", None
             
-    def verify_solana_transaction(self, tx_hash: str, expected_amount: float, target_address: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    async def verify_solana_transaction(self, tx_hash: str, expected_amount: float, target_address: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """
         Verify a Solana transaction
         
@@ -113,12 +155,12 @@ class PaymentHandler:
         try:
             # Try solscan API first (more reliable)
             params = {"tx": tx_hash}
-            response = requests.get(self.solscan_api, params=params)
+            response = await self._client.get(self.solscan_api, params=params)
             
             if response.status_code != 200:
-                logger.warning(f"Solscan API error: {response.status_code}")
+                logger.warning("Solscan API error: %s", response.status_code)
                 # Fallback to RPC API
-                return self._verify_solana_tx_rpc(tx_hash, expected_amount, target_address)
+                return await self._verify_solana_tx_rpc(tx_hash, expected_amount, target_address)
                 
             tx_data = response.json()
             
@@ -158,10 +200,49 @@ class PaymentHandler:
             return True, "Transaction verified successfully", tx_data
             
         except Exception as e:
-            logger.error(f"Error verifying Solana transaction: {e}")
+            logger.error("Error verifying Solana transaction: %s", e)
             return False, f"Error verifying transaction: {str(e)}", None
             
-    def _verify_solana_tx_rpc(self, tx_hash: str, expected_amount: float, target_address: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    async def wait_for_solana_confirmation(self, tx_hash: str, expected_amount: float, target_address: str, timeout: float = 60) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """
+        Verify a Solana transaction, retrying with exponential backoff until it is indexed
+        
+        Callers waiting on the same tx_hash, amount and target address share a single poll,
+        so only one request is in flight per verification.
+        
+        Returns:
+            Tuple of (success, message, transaction_data)
+        """
+        key = (tx_hash, expected_amount, target_address)
+        task = self._sol_waits.get(key)
+        if task is None:
+            deadline = asyncio.get_running_loop().time() + timeout
+            task = asyncio.create_task(self._poll_solana_transaction(tx_hash, expected_amount, target_address, deadline))
+            self._sol_waits[key] = task
+            task.add_done_callback(lambda _: self._sol_waits.pop(key, None))
+        try:
+            # shield: one caller timing out must not cancel the poll other callers share
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            return False, "Transaction not confirmed yet, please try again shortly", None
+            
+    async def _poll_solana_transaction(self, tx_hash: str, expected_amount: float, target_address: str, deadline: float) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """Re-run verify_solana_transaction until it succeeds, fails definitively or the deadline passes"""
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            result = await self.verify_solana_transaction(tx_hash, expected_amount, target_address)
+            success, _, tx_data = result
+            # A result with tx data is a definitive verdict; None means not found/indexed yet
+            if success or tx_data is not None:
+                return result
+            delay = min(_SOL_RETRY_MAX_DELAY, _SOL_RETRY_BASE_DELAY * 2 ** attempt)
+            if loop.time() + delay > deadline:
+                return result
+            await asyncio.sleep(delay)
+            attempt += 1
+            
+    async def _verify_solana_tx_rpc(self, tx_hash: str, expected_amount: float, target_address: str) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """Fallback method to verify Solana transaction using RPC API"""
         try:
             # Prepare JSON-RPC request
@@ -176,7 +257,7 @@ class PaymentHandler:
                 ]
             }
             
-            response = requests.post(self.solana_api, headers=headers, json=payload)
+            response = await self._client.post(self.solana_api, headers=headers, json=payload)
             
             if response.status_code != 200:
                 return False, f"Solana RPC API error: {response.status_code}", None
@@ -199,14 +280,16 @@ class PaymentHandler:
             if not pre_balances or not post_balances:
                 return False, "Transaction data incomplete", tx_data
                 
-            # Find account index for the target address
-            account_index = None
-            for i, account in enumerate(tx_data.get("transaction", {}).get("message", {}).get("accountKeys", [])):
-                if account == target_address:
-                    account_index = i
-                    break
-                    
-            if account_index is None:
+            # Index every account once: static keys first, then lookup-table addresses
+            # (writable before readonly), matching the order of pre/postBalances
+            account_keys = list(tx_data.get("transaction", {}).get("message", {}).get("accountKeys", []))
+            loaded = tx_data.get("meta", {}).get("loadedAddresses") or {}
+            account_keys += loaded.get("writable", [])
+            account_keys += loaded.get("readonly", [])
+            account_positions = {addr: i for i, addr in enumerate(account_keys)}
+            
+            account_index = account_positions.get(target_address)
+            if account_index is None or account_index >= len(pre_balances) or account_index >= len(post_balances):
                 return False, f"Target address {target_address} not found in transaction", tx_data
                 
             # Check balance change
@@ -224,31 +307,28 @@ class PaymentHandler:
             return True, "Transaction verified successfully", tx_data
             
         except Exception as e:
-            logger.error(f"Error verifying Solana transaction using RPC: {e}")
+            logger.error("Error verifying Solana transaction using RPC: %s", e)
             return False, f"Error verifying transaction: {str(e)}", None
 
-# Singleton instance
-_payment_handler = None
-
-def get_payment_handler():
+# Singleton instance (lru_cache's bookkeeping is thread-safe, so callers on worker threads share it)
+@functools.lru_cache(maxsize=1)
+def get_payment_handler() -> PaymentHandler:
     """Get or create a PaymentHandler instance"""
-    global _payment_handler
-    if _payment_handler is None:
-        _payment_handler = PaymentHandler()
-    return _payment_handler
+    return PaymentHandler()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     # Test the payment handler
     handler = get_payment_handler()
     
     # Example ETH transaction verification
-    # eth_result, eth_msg, eth_data = handler.verify_eth_transaction(
+    # eth_result, eth_msg, eth_data = asyncio.run(handler.verify_eth_transaction(
     #     "0x123...", 0.05, "0x247cd53A34b1746C11944851247D7Dd802C1d703"
-    # )
+    # ))
     # print(f"ETH Verification: {eth_result}, {eth_msg}")
     
     # Example SOL transaction verification
-    # sol_result, sol_msg, sol_data = handler.verify_solana_transaction(
+    # sol_result, sol_msg, sol_data = asyncio.run(handler.verify_solana_transaction(
     #     "abc123...", 0.5, "DbqdUJmaPgLKkCEhebokxGTuXhzoS7D2SuWxhahi8BYn"
-    # )
+    # ))
     # print(f"SOL Verification: {sol_result}, {sol_msg}")
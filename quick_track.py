@@ -1,11 +1,33 @@
+import functools
 import logging
 import re
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, CommandHandler, CallbackQueryHandler
 from eth_monitor import get_instance as get_eth_monitor
+from alert_callback_data import encode_test_alert_data, decode_test_alert_data
 
 logger = logging.getLogger(__name__)
 
+# 0x followed by exactly 40 hex digits
+_ETH_ADDR_RE = re.compile(r'^0x[0-9a-fA-F]{40}$')
+
+# Characters a plain min_usd value can contain; anything else is rejected before float()
+_NUMERIC_CHARS = frozenset("0123456789.+-eE")
+
+# Chain names accepted in test alert callback data
+_ETH_NAMES = frozenset({"ethereum", "eth"})
+_SOL_NAMES = frozenset({"solana", "sol"})
+
+@functools.lru_cache(maxsize=4096)
+def _build_track_keyboard(address: str) -> InlineKeyboardMarkup:
+    """Chart/explorer/test/customize buttons for a tracked ETH token (markups are immutable, so shared)"""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton("📊 View Chart", url=f"https://dexscreener.com/ethereum/{address}"),
+         InlineKeyboardButton("🔍 Etherscan", url=f"https://etherscan.io/token/{address}")],
+        [InlineKeyboardButton("🧪 Test Alert", callback_data=encode_test_alert_data(address, "eth"))],
+        [InlineKeyboardButton("✨ Customize Token", callback_data=f"customize_{address}")]
+    ])
+
 async def quick_track_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Simple command to directly track an Ethereum token by address with optional name, symbol and min_usd"""
     chat_id = update.effective_chat.id
@@ -25,10 +47,10 @@ async def quick_track_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
     address = context.args[0].strip()
 
     # Basic validation
-    if not address.startswith("0x") or len(address) != 42:
+    if not _ETH_ADDR_RE.match(address):
         await update.message.reply_text(
             "❌ That doesn't look like a valid Ethereum contract address.\n\n"
-            "It should start with `0x` and be exactly 42 characters long.",
+            "It should start with `0x` followed by 40 hex characters.",
             parse_mode="Markdown"
         )
         return
@@ -38,12 +60,14 @@ async def quick_track_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
     symbol = context.args[2] if len(context.args) > 2 else "TKN"
 
     # Parse min_usd if provided
-    try:
-        min_usd = float(context.args[3]) if len(context.args) > 3 else 10.0
+    min_usd = 10.0
+    if len(context.args) > 3 and _NUMERIC_CHARS.issuperset(context.args[3]):
+        try:
+            min_usd = float(context.args[3])
+        except ValueError:
+            pass  # Keep the default if parse error (e.g. "1.2.3")
         if min_usd < 0:
             min_usd = 10.0  # Default if negative value
-    except (ValueError, TypeError):
-        min_usd = 10.0  # Default if parse error
 
     try:
         # Get the monitor instance through the application's bot
@@ -58,15 +82,7 @@ async def quick_track_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
 
         if success:
             # Add buttons for chart and test
-            etherscan_url = f"https://etherscan.io/token/{address}"
-            dextools_url = f"https://dexscreener.com/ethereum/{address}"
-            keyboard = [
-                [InlineKeyboardButton("📊 View Chart", url=dextools_url),
-                 InlineKeyboardButton("🔍 Etherscan", url=etherscan_url)],
-                [InlineKeyboardButton("🧪 Test Alert", callback_data=f"test_alert_{address}_eth")],
-                [InlineKeyboardButton("✨ Customize Token", callback_data=f"customize_{address}")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = _build_track_keyboard(address)
 
             await update.message.reply_text(
                 f"✅ Now tracking *{name}* (*{symbol}*) on Ethereum\n\n"
@@ -104,26 +120,23 @@ async def test_alert_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
     await query.answer("Preparing test alert...")
 
     try:
-        # Extract token address from callback data
-        callback_data = query.data
-        parts = callback_data.split("_")
-
-        if len(parts) < 3:
+        # Extract token address and chain from callback data
+        decoded = decode_test_alert_data(query.data)
+        if decoded is None:
             await query.message.reply_text("⚠️ Invalid test alert data")
             return
 
-        # Extract address and optional chain (defaults to ethereum)
-        token_address = parts[2]
-        chain = parts[3] if len(parts) > 3 else "ethereum"
+        token_address, chain = decoded
         chat_id = update.effective_chat.id
 
         # Send appropriate test alert based on chain
         success = False
 
-        if chain.lower() in ["ethereum", "eth"]:
+        chain_key = chain.lower()
+        if chain_key in _ETH_NAMES:
             from eth_monitor import test_eth_alert
             success = await test_eth_alert(chat_id, token_address)
-        elif chain.lower() in ["solana", "sol"]:
+        elif chain_key in _SOL_NAMES:
             from solana_monitor import test_sol_alert
             success = await test_sol_alert(chat_id, token_address)
         else:
@@ -143,7 +156,8 @@ def register_handlers(application):
     # Add command handler for /track
     application.add_handler(CommandHandler("track", quick_track_handler))
 
-    # Add callback handler for test alerts
+    # Add callback handler for test alerts; the compact ta: data is routed by callback_manager,
+    # ahead of its catch-all
     application.add_handler(CallbackQueryHandler(test_alert_callback, pattern="^test_alert_"))
 
     logger.info("✅ Quick track handlers registered")
\ No newline at end of file
@@ -1,12 +1,30 @@
 
+import functools
 import logging
 import re
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, CommandHandler, CallbackQueryHandler
 from solana_monitor import get_instance as get_sol_monitor
+from alert_callback_data import encode_test_alert_data
 
 logger = logging.getLogger(__name__)
 
+# 32-44 base58 characters (no 0, O, I or l)
+_SOL_ADDR_RE = re.compile(r'^[1-9A-HJ-NP-Za-km-z]{32,44}$')
+
+# Characters a plain min_usd value can contain; anything else is rejected before float()
+_NUMERIC_CHARS = frozenset("0123456789.+-eE")
+
+@functools.lru_cache(maxsize=4096)
+def _build_track_keyboard(address: str) -> InlineKeyboardMarkup:
+    """Chart/explorer/test/customize buttons for a tracked Solana token (markups are immutable, so shared)"""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton("📊 View Chart", url=f"https://dexscreener.com/solana/{address}"),
+         InlineKeyboardButton("🔍 Solscan", url=f"https://solscan.io/token/{address}")],
+        [InlineKeyboardButton("🧪 Test Alert", callback_data=encode_test_alert_data(address, "sol"))],
+        [InlineKeyboardButton("✨ Customize Token", callback_data=f"customize_{address}")]
+    ])
+
 async def quick_track_sol_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Simple command to directly track a Solana token by address with optional name, symbol and min_usd"""
     chat_id = update.effective_chat.id
@@ -25,11 +43,11 @@ async def quick_track_sol_handler(update: Update, context: ContextTypes.DEFAULT_
     # Get the address (required)
     address = context.args[0].strip()
 
-    # Basic validation - Solana addresses are typically base58 encoded and ~32-44 chars
-    if len(address) < 32 or len(address) > 44:
+    # Basic validation - Solana addresses are base58 encoded and 32-44 chars
+    if not _SOL_ADDR_RE.match(address):
         await update.message.reply_text(
             "❌ That doesn't look like a valid Solana address.\n\n"
-            "Solana addresses are typically 32-44 characters long.",
+            "Solana addresses are 32-44 base58 characters long.",
             parse_mode="Markdown"
         )
         return
@@ -39,12 +57,14 @@ async def quick_track_sol_handler(update: Update, context: ContextTypes.DEFAULT_
     symbol = context.args[2] if len(context.args) > 2 else "SOL"
 
     # Parse min_usd if provided
-    try:
-        min_usd = float(context.args[3]) if len(context.args) > 3 else 10.0
+    min_usd = 10.0
+    if len(context.args) > 3 and _NUMERIC_CHARS.issuperset(context.args[3]):
+        try:
+            min_usd = float(context.args[3])
+        except ValueError:
+            pass  # Keep the default if parse error (e.g. "1.2.3")
         if min_usd < 0:
             min_usd = 10.0  # Default if negative value
-    except (ValueError, TypeError):
-        min_usd = 10.0  # Default if parse error
 
     try:
         # Get the Solana monitor instance
@@ -67,15 +87,7 @@ async def quick_track_sol_handler(update: Update, context: ContextTypes.DEFAULT_
             logger.error(f"Failed to save Solana token to data manager: {e}")
 
         # Add buttons for chart and test
-        chart_url = f"https://dexscreener.com/solana/{address}"
-        solscan_url = f"https://solscan.io/token/{address}"
-        keyboard = [
-            [InlineKeyboardButton("📊 View Chart", url=chart_url),
-             InlineKeyboardButton("🔍 Solscan", url=solscan_url)],
-            [InlineKeyboardButton("🧪 Test Alert", callback_data=f"test_alert_{address}_sol")],
-            [InlineKeyboardButton("✨ Customize Token", callback_data=f"customize_{address}")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = _build_track_keyboard(address)
 
         await update.message.reply_text(
             f"✅ Now tracking *{name}* (*{symbol}*) on Solana\n\n"
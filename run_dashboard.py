@@ -1,5 +1,6 @@
 
 import asyncio
+import importlib.util
 import logging
 import os
 from dashboard import app
@@ -9,6 +10,10 @@ import uvicorn
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("dashboard_test")
 
+# uvloop + httptools (both in uvicorn[standard]) when installed; "auto" otherwise, e.g. on Windows
+_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+_HTTP = "httptools" if importlib.util.find_spec("httptools") else "auto"
+
 def run_dashboard():
     """Run just the dashboard for testing"""
     logger.info("📊 Starting dashboard test")
@@ -25,13 +30,16 @@ def run_dashboard():
     # Explicitly binding to 0.0.0.0:8080 for external access
     print(f"🌐 Starting uvicorn server on http://0.0.0.0:8080")
     print(f"📊 Access URL should be: {dashboard_url}")
+    # Single process: the status endpoints serve dashboard's in-memory bot_status
     uvicorn.run(
         app, 
         host="0.0.0.0", 
         port=8080, 
         log_level="info",
         proxy_headers=True,
-        forwarded_allow_ips="*"
+        forwarded_allow_ips="*",
+        loop=_LOOP,
+        http=_HTTP
     )
 
 if __name__ == "__main__":
@@ -1,58 +1,264 @@
+import aiohttp
 import asyncio
+import collections
+import functools
+import heapq
+import itertools
 import logging
 import json
+import time
 from datetime import datetime
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from customization_handler import apply_token_customization, get_customized_addresses
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to aiohttp's stdlib-json decoding when orjson isn't installed
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Alert helpers from utils; without them Solana alerts are skipped instead of failing per alert
+try:
+    from utils import should_send_alert, generate_alert_message, get_buttons
+except ImportError:
+    should_send_alert = generate_alert_message = get_buttons = None
+
+try:
+    from dashboard import increment_alerts, set_last_alert, add_tracked_contract
+    _DASHBOARD = True
+except ImportError:
+    _DASHBOARD = False
+
 DEXSCREENER_URL = "https://api.dexscreener.com/latest/dex/tokens"
 PUMPFUN_API_URL = "https://api.pump.fun/pump"
 DEX_URL_BASE = "https://dexscreener.com/solana"
 PUMPFUN_URL_BASE = "https://pump.fun/token"
 SOLSCAN_TX_URL = "https://solscan.io/tx"
 
+# DexScreener's tokens endpoint accepts up to 30 comma-separated addresses per request
+DEXSCREENER_BATCH_SIZE = 30
+
+# Max concurrent requests to pump.fun/DexScreener per monitoring cycle
+MAX_CONCURRENT_FETCHES = 10
+
+# Processed pump.fun tx hashes remembered per token (oldest evicted first)
+MAX_PROCESSED_TXS = 100
+
+# Minimum spacing between alerts to the same chat (Telegram allows ~1 msg/s per chat)
+CHAT_ALERT_INTERVAL = 1.1
+
+# Adaptive per-token polling: start at POLL_INTERVAL seconds, double after a quiet poll
+# (up to MAX_POLL_INTERVAL) and halve after one with buys (down to MIN_POLL_INTERVAL)
+POLL_INTERVAL = 15
+MIN_POLL_INTERVAL = 5
+MAX_POLL_INTERVAL = 120
+
+# Token metadata (base/quote token, main pair, dex) barely changes; refresh it hourly
+TOKEN_METADATA_TTL = 3600
+
+async def _read_json(res):
+    """Decode a JSON response body, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(await res.read())
+    return await res.json()
+
 class SolanaMonitor:
     def __init__(self, bot):
         self.bot = bot
         self.session = None
-        self.tokens = []
+        # Lowercased address -> {group_id: token dict}, so the poll loop and removals work per address
+        self._tokens = {}
         self.running = True
         self.last_processed_txs = {}
         self.solana_tokens_to_track = {}  # Initialize properly
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        # Keep a stuck request from stalling the 15s monitoring cycle
+        self._timeout = aiohttp.ClientTimeout(total=10)
+        # Lowercased address -> (expires_at, metadata) from DexScreener responses
+        self._meta_cache = {}
+        # (address, group_id) -> {pair address: last seen txns.m5.buys}, so only new buys alert
+        self._dex_buy_counts = collections.defaultdict(dict)
+        # Per-chat send pacing: chat_id -> lock, chat_id -> earliest loop time of the next alert
+        self._chat_locks = collections.defaultdict(asyncio.Lock)
+        self._chat_next_send = {}
+        # Earliest-due-first poll schedule: heap of (due_at, address). _poll_due holds each
+        # address's live due time so superseded heap entries can be skipped
+        self._poll_heap = []
+        self._poll_due = {}
+        self._poll_interval = {}
+
+    @property
+    def tokens(self):
+        """Snapshot list of tracked token dicts"""
+        return [token for groups in self._tokens.values() for token in groups.values()]
 
     async def start(self):
-        import aiohttp
-        self.session = aiohttp.ClientSession()
+        # Pooled keep-alive connections (with cached DNS) are reused across cycles
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=self._timeout
+        )
         while self.running:
             try:
-                await self.monitor_tokens()
-                await asyncio.sleep(15)
+                due = self._due_addresses()
+                activity = {}
+                try:
+                    if due:
+                        activity = await self.monitor_tokens(due)
+                finally:
+                    for address in due:
+                        self._reschedule_poll(address, activity.get(address, False))
+                await asyncio.sleep(self._seconds_until_next_poll())
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
                 await asyncio.sleep(60)
 
-    async def monitor_tokens(self):
-        for token in self.tokens:
-            address = token.get("address")
-            token_name = token.get("name")
+    def _schedule_poll(self, address, due_at, interval):
+        self._poll_due[address] = due_at
+        self._poll_interval[address] = interval
+        heapq.heappush(self._poll_heap, (due_at, address))
+
+    def _reschedule_poll(self, address, active):
+        """Schedule an address's next poll, polling busy tokens more often and quiet ones less"""
+        interval = self._poll_interval.get(address, POLL_INTERVAL)
+        if active:
+            interval = max(MIN_POLL_INTERVAL, interval / 2)
+        else:
+            interval = min(MAX_POLL_INTERVAL, interval * 2)
+        self._schedule_poll(address, time.monotonic() + interval, interval)
+
+    def _due_addresses(self):
+        """Pop every tracked address whose poll is due; newly tracked addresses are due at once"""
+        now = time.monotonic()
+        tracked = self._tokens.keys()
+        for address in tracked - self._poll_due.keys():
+            self._schedule_poll(address, now, POLL_INTERVAL)
+
+        due = []
+        heap = self._poll_heap
+        while heap and heap[0][0] <= now:
+            due_at, address = heapq.heappop(heap)
+            if self._poll_due.get(address) != due_at:
+                continue  # Superseded entry
+            if address not in tracked:
+                # Untracked since it was scheduled
+                del self._poll_due[address]
+                self._poll_interval.pop(address, None)
+                continue
+            due.append(address)
+        return due
+
+    def _seconds_until_next_poll(self):
+        # Wake at least every POLL_INTERVAL so newly added tokens are picked up promptly
+        if not self._poll_heap:
+            return POLL_INTERVAL
+        return min(POLL_INTERVAL, max(0, self._poll_heap[0][0] - time.monotonic()))
+
+    async def monitor_tokens(self, addresses=None):
+        """Poll the given addresses (default: all tracked) and return {address: had_buys}"""
+        if addresses is None:
+            addresses = list(self._tokens)
+        else:
+            addresses = [address for address in dict.fromkeys(addresses) if address in self._tokens]
+        if not addresses:
+            return {}
+        tokens = [token for address in addresses for token in self._tokens[address].values()]
+
+        # pump.fun is per-address, so fetch those concurrently alongside the batched DexScreener lookups
+        pump_results, pairs_by_addr = await asyncio.gather(
+            asyncio.gather(*(self._bounded(self.fetch_pumpfun_data(address)) for address in addresses)),
+            self.fetch_dexscreener_batch(addresses)
+        )
+        pump_by_addr = dict(zip(addresses, pump_results))
+        for address, pairs in pairs_by_addr.items():
+            self._cache_metadata(address, pairs)
+
+        # Process tokens concurrently; one token's failure must not stop the others
+        results = await asyncio.gather(
+            *(self._process_token(token, pump_by_addr, pairs_by_addr) for token in tokens),
+            return_exceptions=True
+        )
+        activity = dict.fromkeys(addresses, False)
+        for token, result in zip(tokens, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing Solana token {token.get('symbol', '???')}: {result}")
+            elif result:
+                activity[token.get("address")] = True
+        return activity
+
+    def _cache_metadata(self, address, pairs):
+        """Remember a token's static DexScreener metadata (from its first pair) until the TTL expires.
+
+        address must already be lowercased.
+        """
+        now = time.monotonic()
+        cached = self._meta_cache.get(address)
+        if (cached and cached[0] > now) or not pairs:
+            return
+        first = pairs[0]
+        self._meta_cache[address] = (now + TOKEN_METADATA_TTL, {
+            "baseToken": first.get("baseToken"),
+            "quoteToken": first.get("quoteToken"),
+            "pairAddress": first.get("pairAddress"),
+            "dexId": first.get("dexId")
+        })
+
+    def get_token_metadata(self, address):
+        """Return cached DexScreener metadata for a token, or None if missing/expired"""
+        cached = self._meta_cache.get(address.lower())
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
 
-            # First try pump.fun API for any contract deployed there
-            pump_data = await self.fetch_pumpfun_data(address)
-            if pump_data and len(pump_data.get("swaps", [])) > 0:
-                await self.process_pumpfun_buys(token, pump_data)
+    async def _bounded(self, coro):
+        """Await coro while holding the fetch semaphore"""
+        async with self._sem:
+            return await coro
 
-            # Also check dexscreener as fallback
-            dex_data = await self.fetch_dexscreener_data(address)
-            if dex_data:
-                await self.process_dexscreener_buys(token, dex_data)
+    async def _process_token(self, token, pump_by_addr, pairs_by_addr):
+        """Process one token's fetched data; returns True if any new buys were seen"""
+        address = token.get("address")
+        if not address:
+            return False
+        active = False
+
+        # First try pump.fun API for any contract deployed there
+        pump_data = pump_by_addr.get(address)
+        if pump_data and len(pump_data.get("swaps", [])) > 0:
+            active = await self.process_pumpfun_buys(token, pump_data) > 0
+
+        # Also check dexscreener as fallback (token addresses are lowercased by add_token)
+        pairs = pairs_by_addr.get(address)
+        if pairs:
+            active = await self.process_dexscreener_buys(token, {"pairs": pairs}) > 0 or active
+        return active
+
+    async def fetch_dexscreener_batch(self, addresses):
+        """Fetch DexScreener pairs for many tokens in as few requests as possible.
+
+        Returns a dict of lowercased base-token address -> list of pairs.
+        """
+        it = iter(addresses)
+        chunks = []
+        while chunk := list(itertools.islice(it, DEXSCREENER_BATCH_SIZE)):
+            chunks.append(",".join(chunk))
+
+        pairs_by_addr = collections.defaultdict(list)
+        for data in await asyncio.gather(*(self._bounded(self.fetch_dexscreener_data(chunk)) for chunk in chunks)):
+            for pair in data.get("pairs") or []:
+                base_address = (pair.get("baseToken") or {}).get("address")
+                if base_address:
+                    pairs_by_addr[base_address.lower()].append(pair)
+        return pairs_by_addr
 
     async def fetch_pumpfun_data(self, address):
         try:
             url = f"{PUMPFUN_API_URL}/{address}/swaps"
             async with self.session.get(url) as res:
                 if res.status == 200:
-                    return await res.json()
+                    return await _read_json(res)
                 if res.status != 404:  # Log only if it's not a 404 (token not on pump.fun)
                     logger.warning(f"Pump.fun API fetch failed for {address}: {res.status}")
         except Exception as e:
@@ -63,18 +269,21 @@ class SolanaMonitor:
         try:
             async with self.session.get(f"{DEXSCREENER_URL}/{address}") as res:
                 if res.status == 200:
-                    return await res.json()
+                    return await _read_json(res)
                 logger.warning(f"DEXScreener fetch failed: {res.status}")
         except Exception as e:
             logger.error(f"Fetch error for {address}: {e}")
         return {}
 
     async def process_pumpfun_buys(self, token, data):
+        """Alert on new pump.fun buys; returns how many new buys were seen"""
         address = token.get("address")
 
         # Initialize tracking for this token if not already done
-        if address not in self.last_processed_txs:
-            self.last_processed_txs[address] = set()
+        # Insertion-ordered so the oldest hashes are the ones evicted
+        processed = self.last_processed_txs.get(address)
+        if processed is None:
+            processed = self.last_processed_txs[address] = collections.OrderedDict()
 
         # Get recent swaps (buys)
         swaps = data.get("swaps", [])
@@ -82,71 +291,76 @@ class SolanaMonitor:
         # Limit the number of alerts we process at once to prevent flood controls
         max_alerts_per_cycle = 3
         alerts_sent = 0
+        buys_seen = 0
+
+        # Buys (tokenIn is SOL) we haven't processed yet, extracted in one pass; lazy, so the
+        # dedup check also sees hashes added earlier in this loop
+        new_buys = (
+            (swap.get("txId"), token_in)
+            for swap in swaps
+            if (token_in := swap.get("tokenIn") or {}).get("ticker", "").lower() == "sol"
+            and swap.get("txId") not in processed
+        )
+        dex_name = "Pump.fun"
 
-        for swap in swaps:
+        for tx_hash, token_in in new_buys:
             # Rate limit the number of alerts we process in a single cycle
             if alerts_sent >= max_alerts_per_cycle:
                 logger.info(f"Rate limiting alerts for {token.get('symbol', 'Unknown')} - max {max_alerts_per_cycle} per cycle")
                 break
 
-            tx_hash = swap.get("txId")
-            # Skip if we've already processed this transaction
-            if tx_hash in self.last_processed_txs[address]:
+            buys_seen += 1
+            amount_sol = float(token_in.get("amount", 0))
+            amount_usd = amount_sol * float(token_in.get("usdPrice", 0))
+
+            # Add to processed transactions, dropping the oldest once over the cap
+            processed[tx_hash] = None
+            if len(processed) > MAX_PROCESSED_TXS:
+                processed.popitem(last=False)
+
+            # Check if we should send an alert for this token (rate limit to prevent flooding)
+            if should_send_alert is not None and not should_send_alert(address):
+                logger.info(f"⏱️ Rate limited alert for {token.get('symbol', '???')} - {amount_sol} SOL")
                 continue
 
-            # Check if it's a buy (tokenIn is SOL)
-            token_in = swap.get("tokenIn", {}).get("ticker", "").lower()
-            if token_in == "sol":
-                amount_sol = float(swap.get("tokenIn", {}).get("amount", 0))
-                amount_usd = amount_sol * float(swap.get("tokenIn", {}).get("usdPrice", 0))
-                dex_name = "Pump.fun"
-
-                # Rate limit alerts to prevent flooding
-                from utils import should_send_alert
-
-                # Check if we should send an alert for this token
-                if should_send_alert(address):
-                    # Send the alert
-                    await send_alert(
-                        bot=self.bot,
-                        token_info=token,
-                        chain="solana",
-                        value_token=amount_sol,
-                        value_usd=amount_usd,
-                        tx_hash=tx_hash,
-                        dex_name=dex_name
-                    )
-                    logger.info(f"✅ Alert sent for {token.get('symbol', '???')} - {amount_sol} SOL (${amount_usd:.2f})")
-                else:
-                    logger.info(f"⏱️ Rate limited alert for {token.get('symbol', '???')} - {amount_sol} SOL")
-
-                # Add to processed transactions
-                self.last_processed_txs[address].add(tx_hash)
-
-                # Keep processed tx list manageable
-                if len(self.last_processed_txs[address]) > 100:
-                    self.last_processed_txs[address] = set(list(self.last_processed_txs[address])[-50:])
-
-                # Send alert with longer delay between messages
-                await self.send_pump_alert(token, tx_hash, amount_sol, amount_usd, dex_name)
-                alerts_sent += 1
-                # Add extra delay between alerts to avoid Telegram rate limits
-                await asyncio.sleep(1.5)  # This is already using asyncio.sleep correctly
+            # Paced per chat by send_pump_alert, so other chats aren't held up
+            await self.send_pump_alert(token, tx_hash, amount_sol, amount_usd, dex_name)
+            alerts_sent += 1
+
+        return buys_seen
 
     async def process_dexscreener_buys(self, token, data):
+        """Alert on pairs whose m5 buy count grew; returns how many alerts were sent"""
         pairs = data.get("pairs", [])
         if pairs is None:
             pairs = []
 
-        sol_pairs = [p for p in pairs if p.get("chainId") == "solana"]
-        for pair in sol_pairs:
-            tx = pair.get("txns", {}).get("m5", {})
-            if tx and tx.get("buys", 0) > 0:
+        buy_counts = self._dex_buy_counts[(token.get("address"), token.get("group_id"))]
+        alerts = 0
+        for pair in pairs:
+            if pair.get("chainId") != "solana":
+                continue
+            new_buys = (pair.get("txns") or {}).get("m5", {}).get("buys", 0)
+            pair_id = pair.get("pairAddress")
+            # The m5 window reports the same buys for several cycles; alert only when it grows
+            last_buys = buy_counts.get(pair_id, new_buys)
+            buy_counts[pair_id] = new_buys
+            if new_buys > last_buys:
                 await self.send_dex_alert(token, pair)
+                alerts += 1
+        return alerts
+
+    async def _wait_for_chat_slot(self, chat_id):
+        """Space alerts to one chat CHAT_ALERT_INTERVAL apart without delaying other chats"""
+        async with self._chat_locks[chat_id]:
+            loop = asyncio.get_running_loop()
+            delay = self._chat_next_send.get(chat_id, 0) - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._chat_next_send[chat_id] = loop.time() + CHAT_ALERT_INTERVAL
 
     async def send_pump_alert(self, token, tx_hash, amount_sol, amount_usd, dex_name):
-        from utils import send_alert
-
+        await self._wait_for_chat_slot(token.get("group_id"))
         success = await send_alert(
             bot=self.bot,
             token_info=token,
@@ -163,8 +377,7 @@ class SolanaMonitor:
             logger.error(f"Failed to send Pump.fun alert for {token.get('symbol', '???')}")
 
     async def send_dex_alert(self, token, pair):
-        from utils import send_alert
-
+        await self._wait_for_chat_slot(token.get("group_id"))
         tx_hash = pair.get("pairCreatedAt", "UNKNOWN")
         dex = pair.get("dexId", "DEX")
         price = float(pair.get("priceUsd", 0))
@@ -201,21 +414,22 @@ class SolanaMonitor:
         address = address.lower()
 
         # Check if token is already being tracked
-        for token in self.tokens:
-            if token["address"].lower() == address and token["group_id"] == group_id:
-                # Update existing token info
-                token["name"] = name
-                token["symbol"] = symbol
-                logger.info(f"Updated existing token: {symbol} ({address})")
-                return
+        groups = self._tokens.setdefault(address, {})
+        existing = groups.get(group_id)
+        if existing is not None:
+            # Update existing token info
+            existing["name"] = name
+            existing["symbol"] = symbol
+            logger.info(f"Updated existing token: {symbol} ({address})")
+            return
 
         # Add new token
-        self.tokens.append({
+        groups[group_id] = {
             "address": address,
             "name": name,
             "symbol": symbol,
             "group_id": group_id
-        })
+        }
         logger.info(f"Added new token to monitor: {symbol} ({address})")
 
     def remove_token(self, address, group_id=None):
@@ -223,21 +437,23 @@ class SolanaMonitor:
         # Normalize address to lowercase
         address = address.lower()
 
-        # Keep track of how many tokens were removed
-        initial_count = len(self.tokens)
-
-        # Remove from tokens list
+        # Remove from tracked tokens
+        groups = self._tokens.get(address, {})
         if group_id:
             # Remove for specific group
-            self.tokens = [t for t in self.tokens 
-                          if not (t["address"].lower() == address and t["group_id"] == group_id)]
+            removed_count = 1 if groups.pop(group_id, None) is not None else 0
         else:
             # Remove for all groups
-            self.tokens = [t for t in self.tokens if t["address"].lower() != address]
+            removed_count = len(groups)
+            groups.clear()
+        if not groups:
+            self._tokens.pop(address, None)
 
         # Also clear any cached transaction data
         if address in self.last_processed_txs:
             del self.last_processed_txs[address]
+        for key in [k for k in self._dex_buy_counts if k[0] == address and (not group_id or k[1] == group_id)]:
+            del self._dex_buy_counts[key]
 
         # Make sure token is not in solana_tokens_to_track (if the attribute exists)
         if hasattr(self, 'solana_tokens_to_track') and address in self.solana_tokens_to_track:
@@ -248,13 +464,12 @@ class SolanaMonitor:
         if hasattr(self, 'solana_tokens_to_track'):
             # Sometimes tokens may be stored with different formats
             alternate_keys = [k for k in self.solana_tokens_to_track.keys() 
-                             if k.lower().endswith(address.lower())]
+                             if k.lower().endswith(address)]
             for key in alternate_keys:
                 del self.solana_tokens_to_track[key]
                 logger.info(f"🔕 Removed alternate format token {key} from tracking")
 
         # Log the result
-        removed_count = initial_count - len(self.tokens)
         if removed_count > 0:
             logger.info(f"🔕 Removed token {address} from active monitoring (removed {removed_count} instances)")
             return True
@@ -264,7 +479,7 @@ class SolanaMonitor:
 
     def get_tracked_addresses(self):
         """Return a list of all tracked addresses"""
-        return [t["address"].lower() for t in self.tokens]
+        return list(self._tokens)
 
     async def test_dexscreener_integration(self, token_address):
         """Test method to verify DexScreener integration for a specific token"""
@@ -297,8 +512,15 @@ class SolanaMonitor:
         # Add the token
         self.add_token(token_address, token_name, token_symbol, chat_id)
 
+        # Already seen on DexScreener within the metadata TTL: no need to re-fetch
+        if self.get_token_metadata(token_address) is not None:
+            logger.info(f"Successfully verified data for {token_symbol} (cached)")
+            return True
+
         # Try to fetch some initial data
         dex_data = await self.fetch_dexscreener_data(token_address)
+        if dex_data and dex_data.get("pairs"):
+            self._cache_metadata(token_address.lower(), dex_data["pairs"])
         pump_data = await self.fetch_pumpfun_data(token_address)
 
         if (dex_data and dex_data.get("pairs")) or (pump_data and pump_data.get("swaps")):
@@ -328,25 +550,36 @@ class SolanaMonitor:
 
         return True
 
+@functools.lru_cache(maxsize=4096)
+def _alert_markup(token_address):
+    """Alert buttons for a token, built once and reused (InlineKeyboardMarkup is immutable)"""
+    return InlineKeyboardMarkup(get_buttons(token_address))
+
 async def send_alert(bot, token_info, chain, value_token, value_usd, tx_hash, dex_name):
-    from utils import generate_alert_message, get_buttons
+    if generate_alert_message is None or get_buttons is None:
+        logger.warning("Alert helpers not available in utils, skipping Solana alert")
+        return False
+
     chat_id = token_info.get("group_id")
     token_address = token_info.get("address")
     alert_message = generate_alert_message(token_info, chain, value_token, value_usd, tx_hash, dex_name)
-    buttons = get_buttons(token_address)
+    reply_markup = _alert_markup(token_address)
 
     # Update dashboard statistics
-    try:
-        from dashboard import increment_alerts, set_last_alert, add_tracked_contract
+    if _DASHBOARD:
         increment_alerts()
         set_last_alert(alert_message)
         add_tracked_contract(token_address, "solana")
-    except ImportError:
-        logger.warning("Dashboard module not available for updating stats")
 
-    # Get token customization to check for media
-    from customization_handler import apply_token_customization
-    alert_message, media = apply_token_customization(token_address, alert_message)
+    # Get token customization to check for media; most tokens have none, so skip the lookup
+    # (tracked addresses are already lowercased, like the customization keys)
+    media = None
+    if token_address in get_customized_addresses():
+        customized = apply_token_customization(token_address, alert_message)
+        if isinstance(customized, tuple):
+            alert_message, media = customized
+        else:
+            alert_message = customized
 
     # Send alert with media if available
     if media and media.get("type") == "photo":
@@ -355,7 +588,7 @@ async def send_alert(bot, token_info, chain, value_token, value_usd, tx_hash, de
             photo=media["file_id"],
             caption=alert_message,
             parse_mode="HTML",
-            reply_markup=InlineKeyboardMarkup(buttons)
+            reply_markup=reply_markup
         )
     elif media and (media.get("type") == "animation" or media.get("type") == "document"):
         await bot.send_animation(
@@ -363,7 +596,7 @@ async def send_alert(bot, token_info, chain, value_token, value_usd, tx_hash, de
             animation=media["file_id"],
             caption=alert_message,
             parse_mode="HTML",
-            reply_markup=InlineKeyboardMarkup(buttons)
+            reply_markup=reply_markup
         )
     elif media and media.get("type") == "sticker":
         # First send the sticker
@@ -376,7 +609,7 @@ async def send_alert(bot, token_info, chain, value_token, value_usd, tx_hash, de
             chat_id=chat_id,
             text=alert_message,
             parse_mode="HTML",
-            reply_markup=InlineKeyboardMarkup(buttons)
+            reply_markup=reply_markup
         )
     else:
         # Send regular message if no media
@@ -384,7 +617,7 @@ async def send_alert(bot, token_info, chain, value_token, value_usd, tx_hash, de
             chat_id=chat_id,
             text=alert_message,
             parse_mode="HTML",
-            reply_markup=InlineKeyboardMarkup(buttons)
+            reply_markup=reply_markup
         )
     return True
 
@@ -2,11 +2,23 @@
 import os
 import sys
 import signal
-import subprocess
 import logging
 import asyncio
+import contextlib
 import nest_asyncio
-from dotenv import load_dotenv
+from env_cache import get_bot_token
+
+try:
+    import psutil
+except ImportError:
+    # kill_duplicates' /proc scan is used instead when psutil isn't installed
+    psutil = None
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional (and unavailable on Windows); fall back to the stock asyncio loop
+    uvloop = None
 
 # Print startup message directly to console for visibility
 print("👋 Bot is launching...")
@@ -19,35 +31,64 @@ logging.basicConfig(
 )
 logger = logging.getLogger("bot_starter")
 
-# Apply nest_asyncio to avoid runtime errors with event loops
-nest_asyncio.apply()
+# Imported once (after logging is configured) and shared by both startup paths
+try:
+    from main import main as main_async
+    _main_import_error = None
+except ImportError as e:
+    main_async = None
+    _main_import_error = e
+
+# Same switch as main.py, plus notebooks: nest_asyncio is only needed where a loop may already
+# be running. Elsewhere it slows every await and rules out uvloop, so it isn't applied
+USE_NEST_ASYNCIO = (
+    bool(os.environ.get("REPL_ID"))
+    or bool(os.environ.get("USE_NEST_ASYNCIO"))
+    or "ipykernel" in sys.modules
+)
+if USE_NEST_ASYNCIO:
+    nest_asyncio.apply()
+
+def _run(coro):
+    """Run coro to completion, on uvloop when it's installed and nest_asyncio isn't in use"""
+    if uvloop is not None and not USE_NEST_ASYNCIO:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
 
 def cleanup_previous_instances():
-    """Kill any running bot instances"""
+    """Terminate any running bot instances, killing ones that don't exit promptly"""
     try:
-        # Kill main.py processes
-        subprocess.run("pkill -9 -f 'python main.py'", shell=True)
-        # Kill existing start_bot.py processes (except this one)
         current_pid = os.getpid()
-        subprocess.run(f"pkill -9 -f 'python start_bot.py' -P {current_pid}", shell=True)
-
-        # Also check for and kill any stalled bot processes
-        try:
-            import psutil
-            current_pid = os.getpid()
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        if psutil is None:
+            from kill_duplicates import kill_python_bots
+            kill_python_bots(exclude_pid=current_pid)
+        else:
+            # One scan; SIGTERM first so instances can shut down cleanly
+            targets = []
+            for proc in psutil.process_iter(['pid', 'cmdline']):
                 if proc.info['pid'] == current_pid:
                     continue
                 cmd = proc.info['cmdline'] if proc.info['cmdline'] else []
                 if len(cmd) >= 2 and 'python' in cmd[0] and ('main.py' in cmd[1] or 'start_bot.py' in cmd[1]):
-                    logger.info(f"Killing duplicate process: {proc.info['pid']}")
+                    logger.info(f"Terminating duplicate process: {proc.info['pid']}")
                     try:
-                        os.kill(proc.info['pid'], 9)
-                    except Exception as e:
-                        logger.warning(f"Failed to kill process {proc.info['pid']}: {e}")
-        except ImportError:
-            # psutil not available, use simpler method
-            pass
+                        proc.terminate()
+                        targets.append(proc)
+                    except psutil.NoSuchProcess:
+                        pass
+                    except psutil.Error as e:
+                        logger.warning(f"Failed to terminate process {proc.info['pid']}: {e}")
+
+            # Wait for exits instead of sleeping a fixed time, then SIGKILL the stragglers
+            _, alive = psutil.wait_procs(targets, timeout=0.5)
+            for proc in alive:
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+                except psutil.Error as e:
+                    logger.warning(f"Failed to kill process {proc.pid}: {e}")
+            psutil.wait_procs(alive, timeout=0.2)
 
         logger.info("✅ Cleaned up previous bot instances")
     except Exception as e:
@@ -55,8 +96,7 @@ def cleanup_previous_instances():
 
 def check_environment():
     """Check environment variables and dependencies"""
-    load_dotenv()
-    token = os.getenv('BOT_TOKEN') or os.getenv('TELEGRAM_BOT_TOKEN')
+    token = get_bot_token()
     if not token:
         logger.error("❌ No bot token found! Please set TELEGRAM_BOT_TOKEN environment variable")
         return False
@@ -111,24 +151,52 @@ async def start_bot_async():
     except Exception as e:
         logger.warning(f"⚠️ Dashboard initialization issue: {e}")
 
-    # Import main's async functions
-    try:
-        from main import main as main_async
+    if main_async is None:
+        logger.error(f"❌ Failed to import from main.py: {_main_import_error}")
+        return False
 
-        logger.info("🚀 Starting Telegram bot with full UI support...")
-        try:
-            # This will run the complete main.py with all handlers registered
-            await main_async()
-        except Exception as e:
-            logger.error(f"❌ Error in bot execution: {e}", exc_info=True)
-            return False
-        return True
+    logger.info("🚀 Starting Telegram bot with full UI support...")
+    try:
+        # This will run the complete main.py with all handlers registered
+        await main_async()
     except Exception as e:
-        logger.error(f"❌ Failed to import from main.py: {e}", exc_info=True)
+        logger.error(f"❌ Error in bot execution: {e}", exc_info=True)
         return False
+    return True
+
+async def run_until_stopped():
+    """Run start_bot_async() until it returns or SIGINT/SIGTERM asks the bot to stop"""
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    signals = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+            signals.append(sig)
+        except (NotImplementedError, RuntimeError):
+            # Windows or a non-main thread: the default handlers stay in place
+            pass
+
+    bot_task = asyncio.create_task(start_bot_async())
+    stop_task = asyncio.create_task(stop.wait())
+    try:
+        await asyncio.wait([bot_task, stop_task], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        stop_task.cancel()
+        for sig in signals:
+            loop.remove_signal_handler(sig)
+        if not bot_task.done():
+            logger.info("🛑 Stop signal received, shutting down bot...")
+            bot_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await bot_task
+
+# Bot task scheduled onto an already-running loop (kept referenced so it isn't collected)
+_bot_task = None
 
 def start_bot():
     """Start the main bot process"""
+    global _bot_task
     if not check_environment():
         return 1
 
@@ -138,31 +206,34 @@ def start_bot():
 
     # Run the async function
     try:
-        asyncio.run(start_bot_async())
-        return 0
-    except RuntimeError as e:
-        if "already running" in str(e):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None and not USE_NEST_ASYNCIO:
+            # Called from code that already drives a loop: run as a task on it rather than
+            # re-entering it, which would need nest_asyncio
             logger.info("Using existing event loop...")
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(start_bot_async())
+            _bot_task = loop.create_task(run_until_stopped())
             return 0
-        else:
-            logger.error(f"❌ Failed to start bot: {e}")
-            return 1
+        _run(run_until_stopped())
+        return 0
     except Exception as e:
         logger.error(f"❌ Failed to start bot: {e}")
         return 1
 
 if __name__ == "__main__":
     try:
-        # Check if we should run async or sync version
-        import asyncio
-        try:
-            from main import main as main_async
+        # Run main directly when it imported; otherwise (or if that fails) use the full startup
+        fallback_reason = _main_import_error
+        if main_async is not None:
             logger.info("Running async main directly for deployment...")
-            asyncio.run(main_async())
-        except (RuntimeError, ImportError) as e:
-            logger.info(f"Falling back to standard start_bot: {e}")
+            try:
+                _run(main_async())
+            except RuntimeError as e:
+                fallback_reason = e
+        if fallback_reason is not None:
+            logger.info(f"Falling back to standard start_bot: {fallback_reason}")
             exit_code = start_bot()
             sys.exit(exit_code)
     except KeyboardInterrupt:
@@ -5,8 +5,14 @@ import sys
 import time
 import logging
 import platform
+import signal
 import subprocess
-from dotenv import load_dotenv
+
+try:
+    import psutil
+except ImportError:
+    # Fall back to pkill/taskkill when psutil isn't installed
+    psutil = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -20,6 +26,53 @@ try:
 except ImportError:
     logger.info("ℹ️ Colored logs package not available, using standard logs")
 
+def _kill_matching(patterns=("main.py",)):
+    """SIGTERM other Python processes whose command line mentions a pattern, SIGKILL any that linger"""
+    current_pid = os.getpid()
+    targets = []
+    for proc in psutil.process_iter(['pid', 'cmdline']):
+        if proc.info['pid'] == current_pid:
+            continue
+        cmd = proc.info['cmdline'] or []
+        if cmd and 'python' in os.path.basename(cmd[0]).lower() and any(
+                pattern in arg for arg in cmd[1:] for pattern in patterns):
+            try:
+                proc.send_signal(signal.SIGTERM)
+                targets.append(proc)
+                logger.info(f"Terminating bot process {proc.info['pid']}")
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.Error as e:
+                logger.warning(f"Failed to terminate process {proc.info['pid']}: {e}")
+
+    # wait_procs returns as soon as everything has exited, so no fixed sleep is needed
+    _, alive = psutil.wait_procs(targets, timeout=0.5)
+    for proc in alive:
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.Error as e:
+            logger.warning(f"Failed to kill process {proc.pid}: {e}")
+    psutil.wait_procs(alive, timeout=0.2)
+    return len(targets)
+
+# A bot that exits within this many seconds of launch counts as a failed start
+STARTUP_CHECK_SECONDS = 3.0
+
+def _wait_for_early_exit(process, timeout=STARTUP_CHECK_SECONDS):
+    """Return the bot's exit code if it dies within timeout, or None if it's still running"""
+    # poll() with backoff: a crash is noticed within 200ms without any signal handling
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while (returncode := process.poll()) is None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.6, 0.2)
+    return returncode
+
 def main():
     """Main function to start the bot with proper environment checks and reliability features"""
     # Check environment first
@@ -44,14 +97,17 @@ def main():
             return 1
 
         # Kill any running bot processes - with cross-platform support
-        if platform.system() != "Windows":
-            subprocess.run("pkill -9 -f 'python.*main.py' || true", shell=True)
+        if psutil is not None:
+            _kill_matching()
         else:
-            # Windows alternative (though not as effective)
-            logger.info("Windows detected, using taskkill instead of pkill")
-            subprocess.run("taskkill /F /IM python.exe /FI \"WINDOWTITLE eq *main.py*\" 2>NUL", shell=True)
-        
-        time.sleep(1)
+            if platform.system() != "Windows":
+                subprocess.run("pkill -9 -f 'python.*main.py' || true", shell=True)
+            else:
+                # Windows alternative (though not as effective)
+                logger.info("Windows detected, using taskkill instead of pkill")
+                subprocess.run("taskkill /F /IM python.exe /FI \"WINDOWTITLE eq *main.py*\" 2>NUL", shell=True)
+
+            time.sleep(1)
 
         # Remove lock files
         for lockfile in ["app.lock", "bot.lock"]:
@@ -87,9 +143,8 @@ def main():
                 preexec_fn=os.setpgrp if platform.system() != "Windows" else None
             )
         
-        # Wait a bit to catch immediate failures
-        time.sleep(3)
-        if process.poll() is not None:
+        # Watch for immediate failures
+        if _wait_for_early_exit(process) is not None:
             logger.error(f"❌ Bot exited immediately with code {process.returncode}")
             with open("bot.log", "r") as log_file:
                 last_lines = log_file.readlines()[-10:]  # Get last 10 lines
@@ -1,4 +1,8 @@
+import asyncio
 import logging
+import os
+import shutil
+from pathlib import Path
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes, CommandHandler, CallbackQueryHandler
 from telegram.constants import ParseMode
@@ -6,113 +10,240 @@ from telegram.constants import ParseMode
 # Set up logging
 logger = logging.getLogger(__name__)
 
-async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Welcome new users with an engaging start message and UI"""
-    user = update.effective_user
-
-    # Premium welcome message with rich formatting
-    welcome_text = (
-        f"🚀 <b>Welcome to BuyBot Alert, {user.first_name}!</b>\n\n"
-        f"I'm your personal crypto monitoring assistant, designed to help you track and boost tokens across multiple blockchains.\n\n"
-        f"<b>🔍 What I can do for you:</b>\n"
-        f"• Monitor token transactions in real-time\n"
-        f"• Send custom alerts when significant buys happen\n"
-        f"• Promote your project to partner channels\n"
-        f"• Track tokens across ETH, SOL and more\n\n"
-        f"<i>Get started by selecting an option below:</i>"
-    )
-
-    # Create an attractive, user-friendly keyboard layout
-    keyboard = [
-        [
-            InlineKeyboardButton("🔎 Start Tracking", callback_data="start_tracking"),
-            InlineKeyboardButton("📊 Dashboard", callback_data="open_dashboard")
-        ],
-        [
-            InlineKeyboardButton("🚀 Boost Token", callback_data="boost_token"),
-            InlineKeyboardButton("🎮 Quick Tour", callback_data="quick_tour")
-        ],
-        [
-            InlineKeyboardButton("🛠️ Commands List", callback_data="view_commands"),
-            InlineKeyboardButton("❓ Help Center", callback_data="help_menu")
-        ],
-        [
-            InlineKeyboardButton("🌐 Visit Website", url="https://tickertrending.com")
-        ]
-    ]
-
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
-    # Handle the logo image path
-    import os
-    logo_path = "attached_assets/buybot_logo.jpg"
+LOGO_PATH = "attached_assets/buybot_logo.jpg"
 
+def _load_logo():
+    """Put the welcome logo in place if missing and return its bytes (None if unavailable)"""
     # Ensure the directory exists
     os.makedirs("attached_assets", exist_ok=True)
 
     # If you don't have the correct logo file saved yet, create it from the existing file in your project
-    if not os.path.exists(logo_path):
+    if not os.path.exists(LOGO_PATH):
         try:
             # Try to copy from the previous chat uploaded image if it exists
-            import shutil
             if os.path.exists("attached_assets/IMAGE 2025-04-20 20:15:03_1745195098952.jpg"):
-                shutil.copy("attached_assets/IMAGE 2025-04-20 20:15:03_1745195098952.jpg", logo_path)
+                shutil.copy("attached_assets/IMAGE 2025-04-20 20:15:03_1745195098952.jpg", LOGO_PATH)
             else:
                 # Use any existing image as fallback
                 for filename in os.listdir("attached_assets"):
                     if filename.endswith((".jpg", ".jpeg", ".png")) and "buybot" in filename.lower():
-                        shutil.copy(f"attached_assets/{filename}", logo_path)
+                        shutil.copy(f"attached_assets/{filename}", LOGO_PATH)
                         break
         except Exception as e:
             logger.error(f"Error preparing logo image: {e}")
 
-    # Send the image with caption and inline keyboard
     try:
-        with open(logo_path, "rb") as logo_file:
-            await update.message.reply_photo(
-                photo=logo_file,
+        return Path(LOGO_PATH).read_bytes()
+    except OSError as e:
+        logger.error(f"Welcome logo not available: {e}")
+        return None
+
+# Read once at import so /start does no disk I/O on the event loop
+_LOGO_BYTES = _load_logo()
+# Telegram file_id of the logo after its first upload; later /start replies reuse it
+_logo_file_id = None
+
+# Static menus and texts are identical for every user, so they're built once at import
+_WELCOME_BODY = (
+    "I'm your personal crypto monitoring assistant, designed to help you track and boost tokens across multiple blockchains.\n\n"
+    "<b>🔍 What I can do for you:</b>\n"
+    "• Monitor token transactions in real-time\n"
+    "• Send custom alerts when significant buys happen\n"
+    "• Promote your project to partner channels\n"
+    "• Track tokens across ETH, SOL and more\n\n"
+    "<i>Get started by selecting an option below:</i>"
+)
+_WELCOME_TEMPLATE = "🚀 <b>Welcome to BuyBot Alert, {name}!</b>\n\n" + _WELCOME_BODY
+_BACK_TO_START_TEMPLATE = "🚀 <b>Welcome to TickerTrending Bot, {name}!</b>\n\n" + _WELCOME_BODY
+
+_MAIN_MENU_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🔎 Start Tracking", callback_data="start_tracking"),
+        InlineKeyboardButton("📊 Dashboard", callback_data="open_dashboard")
+    ],
+    [
+        InlineKeyboardButton("🚀 Boost Token", callback_data="boost_token"),
+        InlineKeyboardButton("🎮 Quick Tour", callback_data="quick_tour")
+    ],
+    [
+        InlineKeyboardButton("🛠️ Commands List", callback_data="view_commands"),
+        InlineKeyboardButton("❓ Help Center", callback_data="help_menu")
+    ],
+    [
+        InlineKeyboardButton("🌐 Visit Website", url="https://tickertrending.com")
+    ]
+])
+
+_TRACKING_TEXT = (
+    "🔍 <b>Choose a Network to Track</b>\n\n"
+    "Select which blockchain you want to monitor tokens on.\n"
+    "Each network offers real-time tracking of significant transactions."
+)
+_TRACKING_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🟣 Ethereum", callback_data="track_eth"),
+        InlineKeyboardButton("🔵 Solana", callback_data="track_sol")
+    ],
+    [
+        InlineKeyboardButton("🟡 BNB", callback_data="track_bnb"),
+        InlineKeyboardButton("🟢 Base", callback_data="track_base")
+    ],
+    [
+        InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_start")
+    ]
+])
+
+# Dashboard link, from the Replit environment when available
+_REPL_SLUG = os.environ.get('REPL_SLUG', '')
+_REPL_OWNER = os.environ.get('REPL_OWNER', '')
+if _REPL_SLUG and _REPL_OWNER:
+    DASHBOARD_URL = f"https://{_REPL_SLUG}.{_REPL_OWNER}.repl.co/status"
+else:
+    DASHBOARD_URL = "http://0.0.0.0:8080/status"
+
+_DASHBOARD_TEXT = (
+    "📊 <b>Performance Dashboard</b>\n\n"
+    "Get real-time stats about your tracked tokens, alerts, and system status.\n\n"
+    "• View all tracked tokens\n"
+    "• Check system performance\n"
+    "• Monitor alert history\n"
+    "• See active blockchain connections"
+)
+_DASHBOARD_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🌐 Open Dashboard", url=DASHBOARD_URL)],
+    [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_start")]
+])
+
+_TOUR_TEXT = (
+    "🎮 <b>Quick Tour - Getting Started</b>\n\n"
+    "<b>Step 1:</b> Track a token using /track followed by address\n"
+    "<b>Step 2:</b> Customize your alerts with /customize\n"
+    "<b>Step 3:</b> Get real-time notifications on significant buys\n"
+    "<b>Step 4:</b> Boost your token for maximum visibility\n\n"
+    "You can view a complete guide with examples by selecting the button below."
+)
+_TOUR_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📚 Full User Guide", url="https://tickertrending.com/guide")],
+    [InlineKeyboardButton("▶️ Next: Basic Commands", callback_data="tour_commands")],
+    [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_start")]
+])
+
+_COMMANDS_TEXT = (
+    "🛠️ <b>Essential Commands</b>\n\n"
+    "<code>/track</code> - Track Ethereum token\n"
+    "<code>/tracksol</code> - Track Solana token\n"
+    "<code>/untrack</code> - Stop tracking a token\n"
+    "<code>/boost</code> - Promote your token\n"
+    "<code>/customize</code> - Personalize alerts\n"
+    "<code>/status</code> - Check system status\n"
+    "<code>/help</code> - View detailed help\n\n"
+    "For a complete list of commands, check COMMANDS.md on our GitHub repository."
+)
+_COMMANDS_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📋 Full Commands List", callback_data="full_commands")],
+    [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_start")]
+])
+
+_TOUR_COMMANDS_TEXT = (
+    "🛠️ <b>Basic Commands - Quick Tour</b>\n\n"
+    "• <code>/track 0x1234...abcd TokenName TKN</code>\n"
+    "  Track any Ethereum token\n\n"
+    "• <code>/tracksol Addr1234 TokenName TKN</code>\n"
+    "  Track any Solana token\n\n"
+    "• <code>/example_alert</code>\n"
+    "  See what alerts look like\n\n"
+    "• <code>/boost</code>\n"
+    "  Promote your token to our network"
+)
+_TOUR_COMMANDS_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("◀️ Previous", callback_data="quick_tour")],
+    [InlineKeyboardButton("▶️ Next: Customization", callback_data="tour_custom")],
+    [InlineKeyboardButton("🔙 Main Menu", callback_data="back_to_start")]
+])
+
+_TOUR_CUSTOM_TEXT = (
+    "🎨 <b>Customizing Alerts - Quick Tour</b>\n\n"
+    "Make your alerts stand out with branding:\n\n"
+    "• Add your token logo\n"
+    "• Include website and social links\n"
+    "• Choose custom emojis\n"
+    "• Add animated GIFs\n\n"
+    "Use <code>/customize</code> followed by your token address to begin personalizing your alerts."
+)
+_TOUR_CUSTOM_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("◀️ Previous", callback_data="tour_commands")],
+    [InlineKeyboardButton("🔙 Main Menu", callback_data="back_to_start")]
+])
+
+_BOOST_TEXT = (
+    "🚀 <b>Token Boost Packages</b>\n\n"
+    "Boost your token to appear on the trending page and across our partner channels.\n\n"
+    "• <b>Increased Visibility</b> to potential investors\n"
+    "• <b>Higher Ranking</b> in alerts and notifications\n"
+    "• <b>Professional Presentation</b> with your branding\n\n"
+    "Select which blockchain your token is on:"
+)
+_BOOST_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🟣 Ethereum", callback_data="network_eth"),
+        InlineKeyboardButton("🔵 Solana", callback_data="network_sol")
+    ],
+    [
+        InlineKeyboardButton("🟡 BNB", callback_data="network_bnb"),
+        InlineKeyboardButton("🟢 Base", callback_data="network_base")
+    ],
+    [
+        InlineKeyboardButton("ℹ️ How Boosting Works", callback_data="how_boost_works")
+    ],
+    [InlineKeyboardButton("🔙 Back", callback_data="back_to_start")]
+])
+
+# Commands Reference message, built from COMMANDS.md on first use
+_COMMANDS_FILE = "COMMANDS.md"
+_commands_message = None
+_commands_lock = asyncio.Lock()
+
+_FULL_COMMANDS_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔙 Back", callback_data="view_commands")],
+    [InlineKeyboardButton("🔙 Main Menu", callback_data="back_to_start")]
+])
+
+async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Welcome new users with an engaging start message and UI"""
+    global _logo_file_id
+    welcome_text = _WELCOME_TEMPLATE.format(name=update.effective_user.first_name)
+
+    # Send the image with caption and inline keyboard
+    photo = _logo_file_id or _LOGO_BYTES
+    if photo is not None:
+        try:
+            message = await update.message.reply_photo(
+                photo=photo,
                 caption=welcome_text,
-                reply_markup=reply_markup,
+                reply_markup=_MAIN_MENU_MARKUP,
                 parse_mode=ParseMode.HTML
             )
-    except Exception as e:
-        logger.error(f"Failed to send image: {e}")
-        # Fallback to text-only message if image sending fails
-        await update.message.reply_text(
-            welcome_text,
-            reply_markup=reply_markup,
-            parse_mode=ParseMode.HTML
-        )
+            if _logo_file_id is None and message.photo:
+                _logo_file_id = message.photo[-1].file_id
+            return
+        except Exception as e:
+            logger.error(f"Failed to send image: {e}")
+
+    # Fallback to text-only message if image sending fails
+    await update.message.reply_text(
+        welcome_text,
+        reply_markup=_MAIN_MENU_MARKUP,
+        parse_mode=ParseMode.HTML
+    )
 
 async def handle_start_tracking(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle Start Tracking button click"""
     query = update.callback_query
     await query.answer()
 
-    # Create network selection buttons with full options matching boost menu
-    keyboard = [
-        [
-            InlineKeyboardButton("🟣 Ethereum", callback_data="track_eth"),
-            InlineKeyboardButton("🔵 Solana", callback_data="track_sol")
-        ],
-        [
-            InlineKeyboardButton("🟡 BNB", callback_data="track_bnb"),
-            InlineKeyboardButton("🟢 Base", callback_data="track_base")
-        ],
-        [
-            InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_start")
-        ]
-    ]
-
-    tracking_text = (
-        "🔍 <b>Choose a Network to Track</b>\n\n"
-        "Select which blockchain you want to monitor tokens on.\n"
-        "Each network offers real-time tracking of significant transactions."
-    )
-
     await query.edit_message_text(
-        tracking_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        _TRACKING_TEXT,
+        reply_markup=_TRACKING_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -121,33 +252,9 @@ async def handle_dashboard(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
 
-    # Get Replit URL
-    import os
-    replit_slug = os.environ.get('REPL_SLUG', '')
-    replit_owner = os.environ.get('REPL_OWNER', '')
-
-    if replit_slug and replit_owner:
-        dashboard_url = f"https://{replit_slug}.{replit_owner}.repl.co/status"
-    else:
-        dashboard_url = "http://0.0.0.0:8080/status"
-
-    dashboard_text = (
-        "📊 <b>Performance Dashboard</b>\n\n"
-        "Get real-time stats about your tracked tokens, alerts, and system status.\n\n"
-        "• View all tracked tokens\n"
-        "• Check system performance\n"
-        "• Monitor alert history\n"
-        "• See active blockchain connections"
-    )
-
-    keyboard = [
-        [InlineKeyboardButton("🌐 Open Dashboard", url=dashboard_url)],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_start")]
-    ]
-
     await query.edit_message_text(
-        dashboard_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        _DASHBOARD_TEXT,
+        reply_markup=_DASHBOARD_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -156,24 +263,9 @@ async def handle_quick_tour(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
 
-    tour_text = (
-        "🎮 <b>Quick Tour - Getting Started</b>\n\n"
-        "<b>Step 1:</b> Track a token using /track followed by address\n"
-        "<b>Step 2:</b> Customize your alerts with /customize\n"
-        "<b>Step 3:</b> Get real-time notifications on significant buys\n"
-        "<b>Step 4:</b> Boost your token for maximum visibility\n\n"
-        "You can view a complete guide with examples by selecting the button below."
-    )
-
-    keyboard = [
-        [InlineKeyboardButton("📚 Full User Guide", url="https://tickertrending.com/guide")],
-        [InlineKeyboardButton("▶️ Next: Basic Commands", callback_data="tour_commands")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_start")]
-    ]
-
     await query.edit_message_text(
-        tour_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        _TOUR_TEXT,
+        reply_markup=_TOUR_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -182,52 +274,37 @@ async def handle_commands_view(update: Update, context: ContextTypes.DEFAULT_TYP
     query = update.callback_query
     await query.answer()
 
-    commands_text = (
-        "🛠️ <b>Essential Commands</b>\n\n"
-        "<code>/track</code> - Track Ethereum token\n"
-        "<code>/tracksol</code> - Track Solana token\n"
-        "<code>/untrack</code> - Stop tracking a token\n"
-        "<code>/boost</code> - Promote your token\n"
-        "<code>/customize</code> - Personalize alerts\n"
-        "<code>/status</code> - Check system status\n"
-        "<code>/help</code> - View detailed help\n\n"
-        "For a complete list of commands, check COMMANDS.md on our GitHub repository."
-    )
-
-    keyboard = [
-        [InlineKeyboardButton("📋 Full Commands List", callback_data="full_commands")],
-        [InlineKeyboardButton("🔙 Back to Menu", callback_data="back_to_start")]
-    ]
-
     await query.edit_message_text(
-        commands_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        _COMMANDS_TEXT,
+        reply_markup=_COMMANDS_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
-async def handle_full_commands(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle Full Commands List button click"""
-    query = update.callback_query
-    await query.answer()
-
-    # Read from COMMANDS.md
-    try:
-        with open("COMMANDS.md", "r") as file:
-            content = file.read()
+async def _get_commands_message():
+    """Return the Commands Reference text, reading COMMANDS.md off the event loop only once"""
+    global _commands_message
+    async with _commands_lock:
+        if _commands_message is None:
+            try:
+                content = await asyncio.to_thread(Path(_COMMANDS_FILE).read_text)
+            except (OSError, UnicodeDecodeError) as e:
+                # Not cached, so a file added later is still picked up
+                logger.error(f"Could not load {_COMMANDS_FILE}: {e}")
+                return "📋 <b>Commands Reference</b>\n\n<pre>Could not load commands file.</pre>"
             # Just take the first part to avoid message too long
             if len(content) > 1000:
                 content = content[:1000] + "...\n\nUse the button below to see all commands."
-    except:
-        content = "Could not load commands file."
+            _commands_message = f"📋 <b>Commands Reference</b>\n\n<pre>{content}</pre>"
+        return _commands_message
 
-    keyboard = [
-        [InlineKeyboardButton("🔙 Back", callback_data="view_commands")],
-        [InlineKeyboardButton("🔙 Main Menu", callback_data="back_to_start")]
-    ]
+async def handle_full_commands(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle Full Commands List button click"""
+    query = update.callback_query
+    await query.answer()
 
     await query.edit_message_text(
-        f"📋 <b>Commands Reference</b>\n\n<pre>{content}</pre>",
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        await _get_commands_message(),
+        reply_markup=_FULL_COMMANDS_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -236,27 +313,9 @@ async def handle_tour_commands(update: Update, context: ContextTypes.DEFAULT_TYP
     query = update.callback_query
     await query.answer()
 
-    tour_commands_text = (
-        "🛠️ <b>Basic Commands - Quick Tour</b>\n\n"
-        "• <code>/track 0x1234...abcd TokenName TKN</code>\n"
-        "  Track any Ethereum token\n\n"
-        "• <code>/tracksol Addr1234 TokenName TKN</code>\n"
-        "  Track any Solana token\n\n"
-        "• <code>/example_alert</code>\n"
-        "  See what alerts look like\n\n"
-        "• <code>/boost</code>\n"
-        "  Promote your token to our network"
-    )
-
-    keyboard = [
-        [InlineKeyboardButton("◀️ Previous", callback_data="quick_tour")],
-        [InlineKeyboardButton("▶️ Next: Customization", callback_data="tour_custom")],
-        [InlineKeyboardButton("🔙 Main Menu", callback_data="back_to_start")]
-    ]
-
     await query.edit_message_text(
-        tour_commands_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        _TOUR_COMMANDS_TEXT,
+        reply_markup=_TOUR_COMMANDS_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -265,24 +324,9 @@ async def handle_tour_custom(update: Update, context: ContextTypes.DEFAULT_TYPE)
     query = update.callback_query
     await query.answer()
 
-    tour_custom_text = (
-        "🎨 <b>Customizing Alerts - Quick Tour</b>\n\n"
-        "Make your alerts stand out with branding:\n\n"
-        "• Add your token logo\n"
-        "• Include website and social links\n"
-        "• Choose custom emojis\n"
-        "• Add animated GIFs\n\n"
-        "Use <code>/customize</code> followed by your token address to begin personalizing your alerts."
-    )
-
-    keyboard = [
-        [InlineKeyboardButton("◀️ Previous", callback_data="tour_commands")],
-        [InlineKeyboardButton("🔙 Main Menu", callback_data="back_to_start")]
-    ]
-
     await query.edit_message_text(
-        tour_custom_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        _TOUR_CUSTOM_TEXT,
+        reply_markup=_TOUR_CUSTOM_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -291,42 +335,9 @@ async def handle_back_to_start(update: Update, context: ContextTypes.DEFAULT_TYP
     query = update.callback_query
     await query.answer()
 
-    # Just call the start command logic again
-    user = update.effective_user
-    welcome_text = (
-        f"🚀 <b>Welcome to TickerTrending Bot, {user.first_name}!</b>\n\n"
-        f"I'm your personal crypto monitoring assistant, designed to help you track and boost tokens across multiple blockchains.\n\n"
-        f"<b>🔍 What I can do for you:</b>\n"
-        f"• Monitor token transactions in real-time\n"
-        f"• Send custom alerts when significant buys happen\n"
-        f"• Promote your project to partner channels\n"
-        f"• Track tokens across ETH, SOL and more\n\n"
-        f"<i>Get started by selecting an option below:</i>"
-    )
-
-    keyboard = [
-        [
-            InlineKeyboardButton("🔎 Start Tracking", callback_data="start_tracking"),
-            InlineKeyboardButton("📊 Dashboard", callback_data="open_dashboard")
-        ],
-        [
-            InlineKeyboardButton("🚀 Boost Token", callback_data="boost_token"),
-            InlineKeyboardButton("🎮 Quick Tour", callback_data="quick_tour")
-        ],
-        [
-            InlineKeyboardButton("🛠️ Commands List", callback_data="view_commands"),
-            InlineKeyboardButton("❓ Help Center", callback_data="help_menu")
-        ],
-        [
-            InlineKeyboardButton("🌐 Visit Website", url="https://tickertrending.com")
-        ]
-    ]
-
-    reply_markup = InlineKeyboardMarkup(keyboard)
-
     await query.edit_message_text(
-        welcome_text,
-        reply_markup=reply_markup,
+        _BACK_TO_START_TEMPLATE.format(name=update.effective_user.first_name),
+        reply_markup=_MAIN_MENU_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -335,34 +346,9 @@ async def handle_boost_token_button(update: Update, context: ContextTypes.DEFAUL
     query = update.callback_query
     await query.answer()
 
-    # Create rich UI for boosting
-    keyboard = [
-        [
-            InlineKeyboardButton("🟣 Ethereum", callback_data="network_eth"),
-            InlineKeyboardButton("🔵 Solana", callback_data="network_sol")
-        ],
-        [
-            InlineKeyboardButton("🟡 BNB", callback_data="network_bnb"),
-            InlineKeyboardButton("🟢 Base", callback_data="network_base")
-        ],
-        [
-            InlineKeyboardButton("ℹ️ How Boosting Works", callback_data="how_boost_works")
-        ],
-        [InlineKeyboardButton("🔙 Back", callback_data="back_to_start")]
-    ]
-
-    boost_text = (
-        "🚀 <b>Token Boost Packages</b>\n\n"
-        "Boost your token to appear on the trending page and across our partner channels.\n\n"
-        "• <b>Increased Visibility</b> to potential investors\n"
-        "• <b>Higher Ranking</b> in alerts and notifications\n"
-        "• <b>Professional Presentation</b> with your branding\n\n"
-        "Select which blockchain your token is on:"
-    )
-
     await query.edit_message_text(
-        text=boost_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        text=_BOOST_TEXT,
+        reply_markup=_BOOST_MARKUP,
         parse_mode='HTML'
     )
 
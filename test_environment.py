@@ -2,7 +2,7 @@
 import os
 import sys
 import logging
-from dotenv import load_dotenv
+from env_cache import get_bot_token, load_env_once
 
 # Configure logging
 logging.basicConfig(
@@ -13,12 +13,12 @@ logger = logging.getLogger("environment_check")
 
 def check_environment():
     """Check if all required environment variables are set"""
-    load_dotenv()
+    load_env_once()
     
     # Critical variables
     print("🔍 Checking critical environment variables...")
     
-    token = os.getenv('BOT_TOKEN') or os.getenv('TELEGRAM_BOT_TOKEN')
+    token = get_bot_token()
     if not token:
         logger.error("❌ TELEGRAM_BOT_TOKEN not found! Bot cannot function without it.")
         print("   💡 Add it to your Replit Secrets (key: TELEGRAM_BOT_TOKEN)")
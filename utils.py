@@ -76,7 +76,7 @@ async def handle_status_command(update: Update, context: ContextTypes.DEFAULT_TY
     from eth_monitor import get_instance
     eth_monitor = get_instance()
 
-    web3_status = "✅ Connected" if eth_monitor and eth_monitor.web3 and eth_monitor.web3.is_connected() else "❌ Disconnected"
+    web3_status = "✅ Connected" if eth_monitor and await eth_monitor.is_connected() else "❌ Disconnected"
 
     # Prepare status message
     status_msg = f"🤖 *Bot Status Report* 🤖\n\n"